@@ -144,31 +144,27 @@ def cmd_analyze(args: argparse.Namespace) -> int:
         # Initialize orchestrator
         orchestrator = PipelineOrchestrator(
             input_file=str(input_file),
-            output_dir=args.output
+            output_dir=args.output,
+            use_cache=args.cache
         )
 
         # Run analysis
         logger.info("Starting analysis pipeline...")
         analysis_results = orchestrator.run_full_analysis()
 
-        report_paths = None
-        export_paths = None
-        viz_paths = None
-
-        # Generate reports (default behavior unless --no-reports specified)
-        if args.reports:
-            logger.info("Generating reports...")
-            report_paths = orchestrator.generate_reports(analysis_results)
-
-        # Generate exports (if --exports or --all specified)
-        if args.exports or args.all:
-            logger.info("Exporting data files...")
-            export_paths = orchestrator.export_data(analysis_results)
-
-        # Generate visualizations (if --visualizations or --all specified)
-        if args.visualizations or args.all:
-            logger.info("Generating visualizations...")
-            viz_paths = orchestrator.generate_visualizations(analysis_results)
+        # Generate reports (default behavior unless --no-reports specified),
+        # exports and visualizations (if --exports/--visualizations or --all
+        # specified); the selected outputs are generated concurrently
+        logger.info("Generating outputs...")
+        outputs = orchestrator.generate_outputs(
+            analysis_results,
+            reports=args.reports,
+            exports=args.exports or args.all,
+            visualizations=args.visualizations or args.all
+        )
+        report_paths = outputs['reports']
+        export_paths = outputs['exports']
+        viz_paths = outputs['visualizations']
 
         # Print summary
         execution_time = time() - start_time
@@ -236,6 +232,7 @@ Output Flags:
   --exports          : Export CSV and JSON data files
   --visualizations   : Generate charts and interactive dashboard
   --no-reports       : Skip PDF/Excel report generation
+  --cache            : Reuse analysis results cached in <output>/.cache
 
 Output Structure:
   output/
@@ -302,6 +299,15 @@ Output Structure:
         help='Generate everything: reports + exports + visualizations'
     )
 
+    analyze_parser.add_argument(
+        '--cache',
+        action='store_true',
+        default=False,
+        help='Reuse analysis results cached in <output>/.cache while the input '
+             'file is unchanged (only for trusted output directories; cached '
+             'results do not track code changes)'
+    )
+
     # Parse arguments
     args = parser.parse_args()
 
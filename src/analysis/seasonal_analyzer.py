@@ -9,8 +9,11 @@ Uses Create_Date (when repair was requested) to capture when equipment failures
 actually occur, rather than Complete_Date (when work was finished).
 """
 
+import calendar
+
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class SeasonalAnalyzer:
@@ -31,6 +34,14 @@ class SeasonalAnalyzer:
         9: 'Fall', 10: 'Fall', 11: 'Fall'
     }
 
+    # Calendar order of periods, used as ordered categories for result 'period' columns
+    MONTH_ORDER = list(calendar.month_name)[1:]
+    QUARTER_ORDER = ['Q1', 'Q2', 'Q3', 'Q4']
+    SEASON_ORDER = ['Winter', 'Spring', 'Summer', 'Fall']
+
+    # Month number -> season name lookup array (index 0 unused)
+    _SEASON_LUT = np.array([None] + list(map(SEASON_MAP.get, range(1, 13))), dtype=object)
+
     def _get_date_column(self, df: pd.DataFrame) -> str:
         """
         Determine which date column to use for analysis.
@@ -85,28 +96,32 @@ class SeasonalAnalyzer:
             return pd.DataFrame(columns=['period', 'total_cost', 'avg_cost', 'work_order_count'])
 
         # Filter to valid dates and costs
-        valid_df = df[df[date_col].notna() & df['PO_AMOUNT'].notna()].copy()
+        valid_df = df[df[date_col].notna() & df['PO_AMOUNT'].notna()]
 
         if valid_df.empty:
             return pd.DataFrame(columns=['period', 'total_cost', 'avg_cost', 'work_order_count'])
 
-        # Extract month and month name
-        valid_df['month'] = valid_df[date_col].dt.month
-        valid_df['month_name'] = valid_df[date_col].dt.month_name()
+        # Extract month and month name from a single DatetimeIndex conversion
+        dates = pd.DatetimeIndex(valid_df[date_col])
 
         # Group by month
-        monthly = valid_df.groupby(['month', 'month_name']).agg(
-            total_cost=('PO_AMOUNT', 'sum'),
-            avg_cost=('PO_AMOUNT', 'mean'),
-            work_order_count=('PO_AMOUNT', 'count')
-        ).reset_index()
+        monthly = valid_df['PO_AMOUNT'].groupby(
+            [dates.month, dates.month_name()], sort=False
+        ).agg(
+            total_cost='sum',
+            avg_cost='mean',
+            work_order_count='count'
+        ).rename_axis(['month', 'month_name']).reset_index()
 
         # Sort by month number for proper ordering
-        monthly = monthly.sort_values('month')
+        monthly = monthly.sort_values('month').reset_index(drop=True)
 
         # Rename month_name to period and drop month number
         monthly = monthly.rename(columns={'month_name': 'period'})
         monthly = monthly[['period', 'total_cost', 'avg_cost', 'work_order_count']]
+        monthly['period'] = pd.Categorical(
+            monthly['period'], categories=self.MONTH_ORDER, ordered=True
+        )
 
         return monthly
 
@@ -140,25 +155,28 @@ class SeasonalAnalyzer:
                 'year', 'month', 'period', 'total_cost', 'avg_cost', 'work_order_count'
             ])
 
-        valid_df = df[df[date_col].notna() & df['PO_AMOUNT'].notna()].copy()
+        valid_df = df[df[date_col].notna() & df['PO_AMOUNT'].notna()]
         if valid_df.empty:
             return pd.DataFrame(columns=[
                 'year', 'month', 'period', 'total_cost', 'avg_cost', 'work_order_count'
             ])
 
-        valid_df['year'] = valid_df[date_col].dt.year
-        valid_df['month'] = valid_df[date_col].dt.month
-        valid_df['month_name'] = valid_df[date_col].dt.month_name()
+        dates = pd.DatetimeIndex(valid_df[date_col])
 
-        monthly = valid_df.groupby(['year', 'month', 'month_name']).agg(
-            total_cost=('PO_AMOUNT', 'sum'),
-            avg_cost=('PO_AMOUNT', 'mean'),
-            work_order_count=('PO_AMOUNT', 'count')
-        ).reset_index()
+        monthly = valid_df['PO_AMOUNT'].groupby(
+            [dates.year, dates.month, dates.month_name()], sort=False
+        ).agg(
+            total_cost='sum',
+            avg_cost='mean',
+            work_order_count='count'
+        ).rename_axis(['year', 'month', 'month_name']).reset_index()
 
-        monthly = monthly.sort_values(['year', 'month'])
+        monthly = monthly.sort_values(['year', 'month']).reset_index(drop=True)
         monthly = monthly.rename(columns={'month_name': 'period'})
         monthly = monthly[['year', 'month', 'period', 'total_cost', 'avg_cost', 'work_order_count']]
+        monthly['period'] = pd.Categorical(
+            monthly['period'], categories=self.MONTH_ORDER, ordered=True
+        )
 
         return monthly
 
@@ -205,21 +223,97 @@ class SeasonalAnalyzer:
         valid_df['quarter_name'] = 'Q' + valid_df['quarter'].astype(str)
 
         # Group by quarter
-        quarterly = valid_df.groupby(['quarter', 'quarter_name']).agg(
+        quarterly = valid_df.groupby(['quarter', 'quarter_name'], sort=False).agg(
             total_cost=('PO_AMOUNT', 'sum'),
             avg_cost=('PO_AMOUNT', 'mean'),
             work_order_count=('PO_AMOUNT', 'count')
         ).reset_index()
 
         # Sort by quarter number
-        quarterly = quarterly.sort_values('quarter')
+        quarterly = quarterly.sort_values('quarter').reset_index(drop=True)
 
         # Rename quarter_name to period and drop quarter number
         quarterly = quarterly.rename(columns={'quarter_name': 'period'})
         quarterly = quarterly[['period', 'total_cost', 'avg_cost', 'work_order_count']]
+        quarterly['period'] = pd.Categorical(
+            quarterly['period'], categories=self.QUARTER_ORDER, ordered=True
+        )
 
         return quarterly
 
+    def calculate_monthly_and_quarterly(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Aggregate work order costs by month and by quarter in a single pass.
+
+        Groups the work orders by month once and rolls the (at most 12)
+        monthly totals and counts up into quarters, rather than grouping every
+        work order again as calculate_quarterly_costs does.
+
+        Args:
+            df: DataFrame with 'Create_Date' (or 'Complete_Date') and 'PO_AMOUNT' columns
+
+        Returns:
+            Tuple of (monthly, quarterly) DataFrames with the same columns as
+            calculate_monthly_costs and calculate_quarterly_costs return
+        """
+        columns = ['period', 'total_cost', 'avg_cost', 'work_order_count']
+
+        # Handle empty dataframe
+        if df.empty:
+            return pd.DataFrame(columns=columns), pd.DataFrame(columns=columns)
+
+        # Determine which date column to use
+        date_col = self._get_date_column(df)
+        if date_col is None:
+            return pd.DataFrame(columns=columns), pd.DataFrame(columns=columns)
+
+        # Filter to valid dates and costs
+        valid_df = df[df[date_col].notna() & df['PO_AMOUNT'].notna()]
+
+        if valid_df.empty:
+            return pd.DataFrame(columns=columns), pd.DataFrame(columns=columns)
+
+        # One groupby over the work orders, sorted by month number
+        months = pd.DatetimeIndex(valid_df[date_col]).month
+        monthly_totals = valid_df['PO_AMOUNT'].groupby(months).agg(
+            total_cost='sum',
+            work_order_count='count'
+        )
+
+        # Quarter totals from the monthly totals
+        quarterly_totals = monthly_totals.groupby((monthly_totals.index - 1) // 3 + 1).sum()
+
+        monthly = self._period_costs(
+            monthly_totals, [self.MONTH_ORDER[m - 1] for m in monthly_totals.index], self.MONTH_ORDER
+        )
+        quarterly = self._period_costs(
+            quarterly_totals, [f'Q{q}' for q in quarterly_totals.index], self.QUARTER_ORDER
+        )
+
+        return monthly, quarterly
+
+    @staticmethod
+    def _period_costs(totals: pd.DataFrame, periods: List[str], order: List[str]) -> pd.DataFrame:
+        """
+        Build a period cost table from per-period total_cost and work_order_count.
+
+        Args:
+            totals: DataFrame with total_cost and work_order_count, one row per period
+            periods: Period label for each row of totals
+            order: Calendar order of all period labels
+
+        Returns:
+            DataFrame with period, total_cost, avg_cost and work_order_count columns
+        """
+        total_cost = totals['total_cost'].to_numpy()
+        work_order_count = totals['work_order_count'].to_numpy()
+        return pd.DataFrame({
+            'period': pd.Categorical(periods, categories=order, ordered=True),
+            'total_cost': total_cost,
+            'avg_cost': total_cost / work_order_count,
+            'work_order_count': work_order_count
+        })
+
     def calculate_seasonal_costs(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Aggregate work order costs by season.
@@ -259,29 +353,26 @@ class SeasonalAnalyzer:
             return pd.DataFrame(columns=['period', 'total_cost', 'avg_cost', 'work_order_count'])
 
         # Filter to valid dates and costs
-        valid_df = df[df[date_col].notna() & df['PO_AMOUNT'].notna()].copy()
+        valid_df = df[df[date_col].notna() & df['PO_AMOUNT'].notna()]
 
         if valid_df.empty:
             return pd.DataFrame(columns=['period', 'total_cost', 'avg_cost', 'work_order_count'])
 
-        # Map month to season
-        valid_df['month'] = valid_df[date_col].dt.month
-        valid_df['season'] = valid_df['month'].map(self.SEASON_MAP)
+        # Map month to season as an ordered categorical so sorting follows
+        # season order (Winter, Spring, Summer, Fall) via the category codes
+        months = valid_df[date_col].dt.month.to_numpy()
+        seasons = pd.Categorical(
+            self._SEASON_LUT[months], categories=self.SEASON_ORDER, ordered=True
+        )
 
         # Group by season
-        seasonal = valid_df.groupby('season').agg(
+        seasonal = valid_df.groupby(seasons, sort=False, observed=True).agg(
             total_cost=('PO_AMOUNT', 'sum'),
             avg_cost=('PO_AMOUNT', 'mean'),
             work_order_count=('PO_AMOUNT', 'count')
-        ).reset_index()
-
-        # Rename season to period
-        seasonal = seasonal.rename(columns={'season': 'period'})
+        ).rename_axis('period').reset_index()
 
-        # Sort by season order (Winter, Spring, Summer, Fall)
-        season_order = ['Winter', 'Spring', 'Summer', 'Fall']
-        seasonal['sort_order'] = seasonal['period'].map({s: i for i, s in enumerate(season_order)})
-        seasonal = seasonal.sort_values('sort_order').drop(columns=['sort_order'])
+        seasonal = seasonal.sort_values('period').reset_index(drop=True)
 
         return seasonal
 
@@ -5,12 +5,107 @@ Purpose: Identify high-cost vendors, efficiency patterns, and quality issues
 to inform vendor selection and contract negotiations.
 """
 
+import numpy as np
 import pandas as pd
 import logging
-from typing import Optional, Literal, List, Dict, Any
+from typing import Optional, Literal, List, Dict, Any, Tuple, Iterable
 
 logger = logging.getLogger(__name__)
 
+# Nanoseconds per day, for converting datetime64[ns] differences to days
+NS_PER_DAY = 86_400_000_000_000
+
+# int64 representation of NaT in datetime64[ns] arrays
+NAT_INT64 = np.iinfo(np.int64).min
+
+
+def _lerp(a: float, b: float, t: float) -> float:
+    """Linear interpolation between a and b, rounded as NumPy's quantile does."""
+    diff = b - a
+    return b - diff * (1 - t) if t >= 0.5 else a + diff * t
+
+
+def _linear_quantile(values: np.ndarray, q: float) -> float:
+    """
+    q-th quantile of values with linear interpolation (as Series.quantile).
+
+    Uses np.partition to select the two bracketing order statistics in O(n)
+    instead of sorting. NaN values are ignored.
+
+    Args:
+        values: Non-empty array of numbers
+        q: Quantile in [0, 1]
+
+    Returns:
+        Quantile value
+    """
+    values = values[~np.isnan(values)]
+    n = len(values)
+    pos = (n - 1) * q
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, n - 1)
+    part = np.partition(values, [lo, hi])
+    return _lerp(part[lo], part[hi], pos - lo)
+
+
+def _duration_days(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Whole-day durations between Create_Date and Complete_Date.
+
+    Works directly on the int64 nanosecond views of both columns: NaT is
+    detected through its int64 sentinel, so no timedelta Series or notna
+    passes are materialized. Days are floored, matching Timedelta.days.
+
+    Args:
+        df: DataFrame with Create_Date and Complete_Date columns
+
+    Returns:
+        Tuple of (boolean mask of rows with both dates, int64 day counts for
+        those rows)
+    """
+    create_ns = df['Create_Date'].to_numpy(dtype='datetime64[ns]').view('i8')
+    complete_ns = df['Complete_Date'].to_numpy(dtype='datetime64[ns]').view('i8')
+
+    valid = (create_ns != NAT_INT64) & (complete_ns != NAT_INT64)
+    return valid, (complete_ns[valid] - create_ns[valid]) // NS_PER_DAY
+
+
+def _count_repeat_equipment(
+    contractor_codes: np.ndarray,
+    equipment_codes: np.ndarray,
+    n_contractors: int,
+    n_equipment: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count work orders, distinct equipment and repeat equipment per contractor.
+
+    Works on pd.factorize codes (-1 for missing). Rows without a contractor are
+    ignored; rows without equipment count as work orders but not as equipment.
+
+    Args:
+        contractor_codes: Contractor code per work order
+        equipment_codes: Equipment code per work order
+        n_contractors: Number of distinct contractors
+        n_equipment: Number of distinct equipment
+
+    Returns:
+        Tuple of int64 arrays indexed by contractor code:
+        (total work orders, unique equipment, equipment with 2+ work orders)
+    """
+    has_contractor = contractor_codes >= 0
+    total = np.bincount(contractor_codes[has_contractor], minlength=n_contractors)
+
+    # Encode each (contractor, equipment) pair as one integer and count pairs
+    paired = has_contractor & (equipment_codes >= 0)
+    pair_ids = contractor_codes[paired].astype(np.int64) * n_equipment + equipment_codes[paired]
+    pair_ids, pair_counts = np.unique(pair_ids, return_counts=True)
+    pair_contractors = pair_ids // max(n_equipment, 1)
+
+    unique = np.bincount(pair_contractors, minlength=n_contractors)
+    repeat = np.bincount(pair_contractors[pair_counts >= 2], minlength=n_contractors)
+
+    return total.astype(np.int64), unique.astype(np.int64), repeat.astype(np.int64)
+
 
 class VendorAnalyzer:
     """
@@ -23,21 +118,294 @@ class VendorAnalyzer:
     - Identify high-cost vendors for review
     """
 
-    def __init__(self, min_work_orders: int = 3, unknown_label: str = "Unknown"):
+    def __init__(
+        self,
+        min_work_orders: int = 3,
+        unknown_label: str = "Unknown",
+        backend: Literal['pandas', 'polars'] = 'pandas'
+    ):
         """
         Initialize VendorAnalyzer with configuration parameters.
 
         Args:
             min_work_orders: Minimum work order count to include vendor (default: 3)
             unknown_label: Label for missing Contractor values (default: "Unknown")
+            backend: Engine for the per-contractor aggregation - 'pandas' (default)
+                or 'polars' (multithreaded lazy plan; requires the optional
+                polars package)
+
+        Raises:
+            ValueError: If backend is not 'pandas' or 'polars'
         """
+        if backend not in ('pandas', 'polars'):
+            raise ValueError(f"Invalid backend: {backend}")
+
         self.min_work_orders = min_work_orders
         self.unknown_label = unknown_label
+        self.backend = backend
+
+    def prepare(
+        self,
+        df: pd.DataFrame,
+        contractor_dtype: Literal['category', 'string[pyarrow]'] = 'category'
+    ) -> pd.DataFrame:
+        """
+        Encode the Contractor column once for repeated analysis.
+
+        Grouping on categorical codes avoids re-hashing contractor strings in
+        every method call. 'string[pyarrow]' instead stores names in contiguous
+        Arrow UTF-8 buffers, which suits frames shared with other Arrow-backed
+        code (requires the optional pyarrow package). Pass the returned frame
+        to any number of analyzer methods; missing contractors stay missing,
+        so include_unknown behaves as for the raw frame.
+
+        Args:
+            df: DataFrame with a Contractor column
+            contractor_dtype: Target dtype - 'category' (default) or 'string[pyarrow]'
+
+        Returns:
+            DataFrame with Contractor in contractor_dtype (df itself if it
+            already is)
+
+        Raises:
+            ValueError: If contractor_dtype is not supported
+        """
+        if contractor_dtype == 'category':
+            if isinstance(df['Contractor'].dtype, pd.CategoricalDtype):
+                return df
+        elif contractor_dtype == 'string[pyarrow]':
+            if df['Contractor'].dtype == 'string[pyarrow]':
+                return df
+        else:
+            raise ValueError(f"Invalid contractor_dtype: {contractor_dtype}")
+
+        return df.assign(Contractor=df['Contractor'].astype(contractor_dtype))
+
+    def _contractor_keys(self, df: pd.DataFrame, include_unknown: bool) -> pd.Series:
+        """
+        Build the Contractor grouping key for aggregation.
+
+        Missing contractors are labelled with unknown_label when include_unknown
+        is True. Otherwise they are left missing, and groupby's default
+        dropna=True excludes those rows without filtering or copying df.
+
+        Args:
+            df: DataFrame with a Contractor column
+            include_unknown: If True, keep missing contractors under unknown_label
+
+        Returns:
+            Series aligned with df to group by
+        """
+        contractors = df['Contractor']
+        # Cleaned data usually has no missing contractors; hasnans is a single
+        # cached reduction, after which the column is used as-is
+        if include_unknown and contractors.hasnans:
+            if (isinstance(contractors.dtype, pd.CategoricalDtype)
+                    and self.unknown_label not in contractors.cat.categories):
+                contractors = contractors.cat.add_categories([self.unknown_label])
+            return contractors.fillna(self.unknown_label)
+        return contractors
+
+    def _compute_all_metrics(self, df: pd.DataFrame, include_unknown: bool = False) -> pd.DataFrame:
+        """
+        Compute per-contractor cost and duration metrics in one grouping pass.
+
+        The public cost, duration, ranking, threshold and efficiency methods are
+        views over this frame, so callers needing several of them can compute it
+        once and pass it on via their precomputed argument. The min_work_orders
+        threshold is not applied here.
+
+        Args:
+            df: DataFrame with work order data (Contractor, PO_AMOUNT and,
+                optionally, Create_Date / Complete_Date)
+            include_unknown: If True, include contractors with missing names (default: False)
+
+        Returns:
+            DataFrame indexed by contractor with columns:
+            - total_cost: Sum of PO_AMOUNT
+            - work_order_count: Number of work orders
+            - avg_cost_per_wo: Average PO_AMOUNT
+            - dated_work_order_count: Work orders with both dates present
+            - avg_duration_days: Average completion time in days over those
+        """
+        if self.backend == 'polars':
+            return self._compute_all_metrics_polars(df, include_unknown)
+        return self._compute_all_metrics_pandas(df, include_unknown)
+
+    def _compute_all_metrics_pandas(self, df: pd.DataFrame, include_unknown: bool) -> pd.DataFrame:
+        """
+        Pandas implementation of _compute_all_metrics.
+
+        Args:
+            df: DataFrame with work order data
+            include_unknown: If True, include contractors with missing names
+
+        Returns:
+            Contractor-indexed metrics frame (see _compute_all_metrics)
+        """
+        # Handle missing Contractor values; only the columns aggregated below
+        # are read, so df itself is never filtered or copied
+        contractors = self._contractor_keys(df, include_unknown)
+
+        metrics = df['PO_AMOUNT'].groupby(contractors, sort=False, observed=True).agg(
+            total_cost='sum',
+            work_order_count='size',
+            avg_cost_per_wo='mean'
+        )
+
+        if 'Create_Date' in df.columns and 'Complete_Date' in df.columns:
+            # Duration for rows with valid dates
+            valid, days = _duration_days(df)
+            duration_days = pd.Series(days, index=df.index[valid])
+
+            duration = duration_days.groupby(contractors[valid], sort=False, observed=True).agg(
+                dated_work_order_count='size',
+                avg_duration_days='mean'
+            )
+            # Every dated contractor also appears in metrics, so align by
+            # index; when both groupings saw contractors in the same order
+            # (no contractor lacks dates) the columns are taken as-is
+            if not duration.index.equals(metrics.index):
+                duration = duration.reindex(metrics.index)
+            metrics['dated_work_order_count'] = duration['dated_work_order_count'].to_numpy()
+            metrics['avg_duration_days'] = duration['avg_duration_days'].to_numpy()
+        else:
+            metrics['dated_work_order_count'] = 0
+            metrics['avg_duration_days'] = np.nan
+
+        metrics['dated_work_order_count'] = metrics['dated_work_order_count'].fillna(0).astype('i8')
+
+        return metrics.rename_axis('contractor')
+
+    def _compute_all_metrics_polars(self, df: pd.DataFrame, include_unknown: bool) -> pd.DataFrame:
+        """
+        Polars implementation of _compute_all_metrics.
+
+        Runs the contractor fill/filter, cost and duration aggregations and their
+        join as one lazy Polars plan, converting back to pandas only for the
+        returned metrics frame.
+
+        Args:
+            df: DataFrame with work order data
+            include_unknown: If True, include contractors with missing names
+
+        Returns:
+            Same frame as _compute_all_metrics
+        """
+        import polars as pl
+
+        has_dates = 'Create_Date' in df.columns and 'Complete_Date' in df.columns
+        columns = ['Contractor', 'PO_AMOUNT']
+        if has_dates:
+            columns += ['Create_Date', 'Complete_Date']
+
+        lf = pl.from_pandas(df[columns]).lazy()
+
+        # Handle missing Contractor values
+        if include_unknown:
+            lf = lf.with_columns(pl.col('Contractor').fill_null(self.unknown_label))
+        else:
+            lf = lf.filter(pl.col('Contractor').is_not_null())
+
+        metrics_lf = lf.group_by('Contractor').agg(
+            total_cost=pl.col('PO_AMOUNT').sum(),
+            work_order_count=pl.len().cast(pl.Int64),
+            avg_cost_per_wo=pl.col('PO_AMOUNT').mean()
+        )
+
+        if has_dates:
+            duration_lf = (
+                lf.filter(pl.col('Create_Date').is_not_null() & pl.col('Complete_Date').is_not_null())
+                .with_columns(
+                    duration_days=(pl.col('Complete_Date') - pl.col('Create_Date'))
+                    .dt.total_nanoseconds() // NS_PER_DAY
+                )
+                .group_by('Contractor')
+                .agg(
+                    dated_work_order_count=pl.len().cast(pl.Int64),
+                    avg_duration_days=pl.col('duration_days').mean()
+                )
+            )
+            metrics_lf = metrics_lf.join(duration_lf, on='Contractor', how='left')
+
+        metrics = metrics_lf.collect().to_pandas().set_index('Contractor')
+
+        if not has_dates:
+            metrics['dated_work_order_count'] = 0
+            metrics['avg_duration_days'] = np.nan
+
+        metrics['dated_work_order_count'] = metrics['dated_work_order_count'].fillna(0).astype('i8')
+
+        return metrics.rename_axis('contractor')
+
+    def _finalize_vendor_frame(self, result_df: pd.DataFrame, sort_column: str) -> pd.DataFrame:
+        """
+        Turn a contractor-indexed metrics slice into a sorted result frame.
+
+        Args:
+            result_df: Metrics slice indexed by contractor
+            sort_column: Column to sort by, descending
+
+        Returns:
+            DataFrame with a categorical 'contractor' column, sorted by sort_column
+        """
+        result_df = result_df.reset_index()
+
+        if len(result_df) > 0:
+            # Inputs are often already in order (e.g. ranking by total_cost
+            # after a cost view); a single monotonicity pass skips the sort
+            if not result_df[sort_column].is_monotonic_decreasing:
+                result_df = result_df.sort_values(sort_column, ascending=False).reset_index(drop=True)
+            # Re-encode so categories are exactly the listed contractors in
+            # sorted order, whether or not the input Contractor was categorical
+            result_df['contractor'] = result_df['contractor'].astype(object).astype('category')
+
+        return result_df
+
+    def _cost_view(self, metrics: pd.DataFrame) -> pd.DataFrame:
+        """Vendor cost frame (see calculate_vendor_costs) from precomputed metrics."""
+        result_df = metrics.loc[
+            metrics['work_order_count'] >= self.min_work_orders,
+            ['total_cost', 'work_order_count', 'avg_cost_per_wo']
+        ]
+        return self._finalize_vendor_frame(result_df, 'total_cost')
+
+    def _top_cost_view(self, metrics: pd.DataFrame, k: int) -> pd.DataFrame:
+        """
+        Vendor cost frame restricted to the k highest total costs.
+
+        Selects the top k with np.argpartition in O(n) and sorts only those,
+        instead of sorting every contractor and taking the head.
+
+        Args:
+            metrics: Precomputed metrics from _compute_all_metrics
+            k: Number of vendors to keep
+
+        Returns:
+            Vendor cost frame (see calculate_vendor_costs) with at most k rows
+        """
+        result_df = metrics.loc[
+            metrics['work_order_count'] >= self.min_work_orders,
+            ['total_cost', 'work_order_count', 'avg_cost_per_wo']
+        ]
+        totals = result_df['total_cost'].to_numpy()
+        if len(totals) > k:
+            result_df = result_df.iloc[np.argpartition(-totals, k - 1)[:k]]
+        return self._finalize_vendor_frame(result_df, 'total_cost')
+
+    def _duration_view(self, metrics: pd.DataFrame) -> pd.DataFrame:
+        """Vendor duration frame (see calculate_vendor_duration) from precomputed metrics."""
+        result_df = metrics.loc[
+            metrics['dated_work_order_count'] >= self.min_work_orders,
+            ['dated_work_order_count', 'avg_duration_days']
+        ].rename(columns={'dated_work_order_count': 'work_order_count'})
+        return self._finalize_vendor_frame(result_df, 'avg_duration_days')
 
     def calculate_vendor_costs(
         self,
         df: pd.DataFrame,
-        include_unknown: bool = False
+        include_unknown: bool = False,
+        precomputed: Optional[pd.DataFrame] = None
     ) -> pd.DataFrame:
         """
         Calculate cost aggregations by vendor/contractor.
@@ -52,6 +420,8 @@ class VendorAnalyzer:
                 - Contractor: Vendor/contractor name
                 - PO_AMOUNT: Cost amount
             include_unknown: If True, include contractors with missing names (default: False)
+            precomputed: Optional metrics from _compute_all_metrics to reuse
+                instead of regrouping df
 
         Returns:
             DataFrame with columns:
@@ -60,41 +430,10 @@ class VendorAnalyzer:
             - work_order_count: Number of work orders
             - avg_cost_per_wo: Average cost per work order
         """
-        # Handle missing Contractor values
-        df_work = df.copy()
-        df_work['Contractor'] = df_work['Contractor'].fillna(self.unknown_label)
-
-        # Filter out unknown if requested
-        if not include_unknown:
-            df_work = df_work[df_work['Contractor'] != self.unknown_label]
-
-        # Group by contractor
-        grouped = df_work.groupby('Contractor')
+        if precomputed is None:
+            precomputed = self._compute_all_metrics(df, include_unknown=include_unknown)
 
-        results = []
-        for contractor, group in grouped:
-            work_order_count = len(group)
-
-            # Filter by minimum work order threshold
-            if work_order_count < self.min_work_orders:
-                continue
-
-            # Calculate cost metrics
-            total_cost = group['PO_AMOUNT'].sum()
-            avg_cost_per_wo = group['PO_AMOUNT'].mean()
-
-            results.append({
-                'contractor': contractor,
-                'total_cost': total_cost,
-                'work_order_count': work_order_count,
-                'avg_cost_per_wo': avg_cost_per_wo
-            })
-
-        result_df = pd.DataFrame(results)
-
-        if len(result_df) > 0:
-            # Sort by total cost descending
-            result_df = result_df.sort_values('total_cost', ascending=False).reset_index(drop=True)
+        result_df = self._cost_view(precomputed)
 
         logger.info(f"Calculated costs for {len(result_df)} contractors")
 
@@ -103,7 +442,8 @@ class VendorAnalyzer:
     def calculate_vendor_duration(
         self,
         df: pd.DataFrame,
-        include_unknown: bool = False
+        include_unknown: bool = False,
+        precomputed: Optional[pd.DataFrame] = None
     ) -> pd.DataFrame:
         """
         Calculate average completion time by vendor/contractor.
@@ -117,6 +457,8 @@ class VendorAnalyzer:
                 - Create_Date: Work order creation date
                 - Complete_Date: Work order completion date
             include_unknown: If True, include contractors with missing names (default: False)
+            precomputed: Optional metrics from _compute_all_metrics to reuse
+                instead of regrouping df
 
         Returns:
             DataFrame with columns:
@@ -124,51 +466,100 @@ class VendorAnalyzer:
             - work_order_count: Number of work orders with valid dates
             - avg_duration_days: Average completion time in days
         """
-        # Handle missing Contractor values
-        df_work = df.copy()
-        df_work['Contractor'] = df_work['Contractor'].fillna(self.unknown_label)
+        if precomputed is None:
+            precomputed = self._compute_all_metrics(df, include_unknown=include_unknown)
 
-        # Filter out unknown if requested
-        if not include_unknown:
-            df_work = df_work[df_work['Contractor'] != self.unknown_label]
+        result_df = self._duration_view(precomputed)
 
-        # Filter to rows with valid dates
-        df_work = df_work[
-            pd.notna(df_work['Create_Date']) &
-            pd.notna(df_work['Complete_Date'])
-        ].copy()
+        logger.info(f"Calculated duration for {len(result_df)} contractors")
+
+        return result_df
 
-        # Calculate duration
-        df_work['duration_days'] = (
-            df_work['Complete_Date'] - df_work['Create_Date']
-        ).dt.days
+    def calculate_vendor_costs_streaming(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        include_unknown: bool = False
+    ) -> pd.DataFrame:
+        """
+        Calculate cost aggregations by vendor from an iterable of DataFrame chunks.
 
-        # Group by contractor
-        grouped = df_work.groupby('Contractor')
+        Streaming counterpart of calculate_vendor_costs for inputs too large to
+        hold in memory (e.g. pd.read_csv(..., chunksize=N)). Per-chunk sums and
+        counts are combined, so peak memory is bounded by the number of vendors
+        rather than the number of rows.
 
-        results = []
-        for contractor, group in grouped:
-            work_order_count = len(group)
+        Args:
+            chunks: Iterable of DataFrames with Contractor and PO_AMOUNT columns
+            include_unknown: If True, include contractors with missing names (default: False)
 
-            # Filter by minimum work order threshold
-            if work_order_count < self.min_work_orders:
-                continue
+        Returns:
+            DataFrame with the same columns and ordering as calculate_vendor_costs
+        """
+        acc = None
+        for chunk in chunks:
+            contractors = self._contractor_keys(chunk, include_unknown)
+            part = chunk['PO_AMOUNT'].groupby(contractors, sort=False, observed=True).agg(
+                ['sum', 'count', 'size']
+            )
+            acc = part if acc is None else acc.add(part, fill_value=0)
 
-            avg_duration_days = group['duration_days'].mean()
+        if acc is None:
+            acc = pd.DataFrame({'sum': [], 'count': [], 'size': []})
 
-            results.append({
-                'contractor': contractor,
-                'work_order_count': work_order_count,
-                'avg_duration_days': avg_duration_days
-            })
+        metrics = pd.DataFrame({
+            'total_cost': acc['sum'],
+            'work_order_count': acc['size'].astype('i8'),
+            # Mean over non-null amounts, as in calculate_vendor_costs
+            'avg_cost_per_wo': acc['sum'] / acc['count'].where(acc['count'] > 0)
+        }).rename_axis('contractor')
 
-        result_df = pd.DataFrame(results)
+        result_df = self._cost_view(metrics)
 
-        if len(result_df) > 0:
-            # Sort by average duration descending
-            result_df = result_df.sort_values('avg_duration_days', ascending=False).reset_index(drop=True)
+        logger.info(f"Calculated streamed costs for {len(result_df)} contractors")
 
-        logger.info(f"Calculated duration for {len(result_df)} contractors")
+        return result_df
+
+    def calculate_vendor_duration_streaming(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        include_unknown: bool = False
+    ) -> pd.DataFrame:
+        """
+        Calculate average completion time by vendor from an iterable of DataFrame chunks.
+
+        Streaming counterpart of calculate_vendor_duration. Per-chunk duration
+        sums and counts are combined before averaging.
+
+        Args:
+            chunks: Iterable of DataFrames with Contractor, Create_Date and
+                Complete_Date columns
+            include_unknown: If True, include contractors with missing names (default: False)
+
+        Returns:
+            DataFrame with the same columns and ordering as calculate_vendor_duration
+        """
+        acc = None
+        for chunk in chunks:
+            contractors = self._contractor_keys(chunk, include_unknown)
+            valid, days = _duration_days(chunk)
+            duration_days = pd.Series(days, index=chunk.index[valid])
+
+            part = duration_days.groupby(contractors[valid], sort=False, observed=True).agg(
+                ['sum', 'size']
+            )
+            acc = part if acc is None else acc.add(part, fill_value=0)
+
+        if acc is None:
+            acc = pd.DataFrame({'sum': [], 'size': []})
+
+        metrics = pd.DataFrame({
+            'dated_work_order_count': acc['size'].astype('i8'),
+            'avg_duration_days': acc['sum'] / acc['size']
+        }).rename_axis('contractor')
+
+        result_df = self._duration_view(metrics)
+
+        logger.info(f"Calculated streamed duration for {len(result_df)} contractors")
 
         return result_df
 
@@ -176,7 +567,8 @@ class VendorAnalyzer:
         self,
         df: pd.DataFrame,
         by: Literal['total_cost', 'avg_cost', 'work_order_count'] = 'total_cost',
-        include_unknown: bool = False
+        include_unknown: bool = False,
+        precomputed: Optional[pd.DataFrame] = None
     ) -> pd.DataFrame:
         """
         Rank vendors by specified metric.
@@ -187,6 +579,8 @@ class VendorAnalyzer:
             df: DataFrame with work order data
             by: Ranking metric - 'total_cost', 'avg_cost', or 'work_order_count'
             include_unknown: If True, include contractors with missing names (default: False)
+            precomputed: Optional metrics from _compute_all_metrics to reuse
+                instead of regrouping df
 
         Returns:
             DataFrame with columns:
@@ -197,28 +591,26 @@ class VendorAnalyzer:
             - avg_duration_days: Average completion days (if available)
             - rank: Rank by specified metric (1 = highest)
         """
-        # Get cost data
-        cost_df = self.calculate_vendor_costs(df, include_unknown=include_unknown)
+        if precomputed is None:
+            precomputed = self._compute_all_metrics(df, include_unknown=include_unknown)
 
-        if len(cost_df) == 0:
+        # Cost metrics for vendors meeting the work order threshold
+        cost_mask = precomputed['work_order_count'] >= self.min_work_orders
+
+        if not cost_mask.any():
             return pd.DataFrame(columns=[
                 'contractor', 'total_cost', 'work_order_count',
                 'avg_cost_per_wo', 'avg_duration_days', 'rank'
             ])
 
-        # Get duration data
-        duration_df = self.calculate_vendor_duration(df, include_unknown=include_unknown)
+        result_df = precomputed.loc[
+            cost_mask, ['total_cost', 'work_order_count', 'avg_cost_per_wo']
+        ].copy()
 
-        # Merge cost and duration
-        if len(duration_df) > 0:
-            result_df = cost_df.merge(
-                duration_df[['contractor', 'avg_duration_days']],
-                on='contractor',
-                how='left'
-            )
-        else:
-            result_df = cost_df.copy()
-            result_df['avg_duration_days'] = None
+        # Duration is only reported where enough dated work orders exist
+        result_df['avg_duration_days'] = precomputed.loc[cost_mask, 'avg_duration_days'].where(
+            precomputed.loc[cost_mask, 'dated_work_order_count'] >= self.min_work_orders
+        )
 
         # Determine ranking column
         rank_column_map = {
@@ -229,8 +621,8 @@ class VendorAnalyzer:
         rank_column = rank_column_map[by]
 
         # Sort by ranking metric (descending) and add rank
-        result_df = result_df.sort_values(rank_column, ascending=False).reset_index(drop=True)
-        result_df['rank'] = range(1, len(result_df) + 1)
+        result_df = self._finalize_vendor_frame(result_df, rank_column)
+        result_df['rank'] = np.arange(1, len(result_df) + 1, dtype=np.int32)
 
         logger.info(f"Ranked {len(result_df)} contractors by {by}")
 
@@ -240,7 +632,8 @@ class VendorAnalyzer:
         self,
         df: pd.DataFrame,
         threshold: Literal['75th_percentile', '90th_percentile', 'top_10'] = '75th_percentile',
-        include_unknown: bool = False
+        include_unknown: bool = False,
+        precomputed: Optional[pd.DataFrame] = None
     ) -> pd.DataFrame:
         """
         Identify vendors exceeding cost thresholds.
@@ -254,6 +647,8 @@ class VendorAnalyzer:
                 - '90th_percentile': Above 90th percentile of total cost
                 - 'top_10': Top 10 vendors by total cost
             include_unknown: If True, include contractors with missing names (default: False)
+            precomputed: Optional metrics from _compute_all_metrics to reuse
+                instead of regrouping df
 
         Returns:
             DataFrame with high-cost vendors:
@@ -263,8 +658,14 @@ class VendorAnalyzer:
             - avg_cost_per_wo: Average cost per work order
             - cost_threshold: The threshold value used
         """
-        # Get cost data
-        cost_df = self.calculate_vendor_costs(df, include_unknown=include_unknown)
+        if precomputed is None:
+            precomputed = self._compute_all_metrics(df, include_unknown=include_unknown)
+
+        # Get cost data; top_10 only needs the ten largest vendors sorted
+        if threshold == 'top_10':
+            cost_df = self._top_cost_view(precomputed, 10)
+        else:
+            cost_df = self.calculate_vendor_costs(df, precomputed=precomputed)
 
         if len(cost_df) == 0:
             return pd.DataFrame(columns=[
@@ -272,16 +673,15 @@ class VendorAnalyzer:
                 'avg_cost_per_wo', 'cost_threshold'
             ])
 
-        # Calculate threshold
+        # Calculate threshold (cost_df is already sorted by total_cost descending)
         if threshold == '75th_percentile':
-            threshold_value = cost_df['total_cost'].quantile(0.75)
-            high_cost_df = cost_df[cost_df['total_cost'] >= threshold_value].copy()
+            high_cost_df, threshold_value = self._select_above_quantile(cost_df, 'total_cost', 0.75)
         elif threshold == '90th_percentile':
-            threshold_value = cost_df['total_cost'].quantile(0.90)
-            high_cost_df = cost_df[cost_df['total_cost'] >= threshold_value].copy()
+            high_cost_df, threshold_value = self._select_above_quantile(cost_df, 'total_cost', 0.90)
         elif threshold == 'top_10':
-            high_cost_df = cost_df.head(10).copy()
-            threshold_value = high_cost_df['total_cost'].min() if len(high_cost_df) > 0 else 0
+            high_cost_df = cost_df
+            # Sorted descending and non-empty, so the last row is the minimum
+            threshold_value = high_cost_df['total_cost'].iat[-1]
         else:
             raise ValueError(f"Invalid threshold: {threshold}")
 
@@ -294,10 +694,45 @@ class VendorAnalyzer:
 
         return high_cost_df
 
+    @staticmethod
+    def _select_above_quantile(
+        sorted_df: pd.DataFrame,
+        column: str,
+        q: float
+    ) -> Tuple[pd.DataFrame, float]:
+        """
+        Select leading rows at or above the q-th quantile of a column.
+
+        Relies on sorted_df being sorted by column descending (as the vendor
+        cost and duration frames are), so the quantile (linear interpolation,
+        as in Series.quantile) is read positionally and the matching rows are
+        a prefix of the frame.
+
+        Args:
+            sorted_df: Non-empty frame sorted by column descending
+            column: Metric column to threshold
+            q: Quantile in [0, 1]
+
+        Returns:
+            Tuple of (rows with column >= threshold, threshold value)
+        """
+        values = sorted_df[column].to_numpy()
+        n = len(values)
+
+        # Position in ascending order, mapped onto the descending array
+        pos = (n - 1) * q
+        lo = int(np.floor(pos))
+        hi = min(lo + 1, n - 1)
+        threshold_value = _lerp(values[n - 1 - lo], values[n - 1 - hi], pos - lo)
+
+        k = int(np.searchsorted(-values, -threshold_value, side='right'))
+        return sorted_df.iloc[:k].copy(), threshold_value
+
     def calculate_cost_efficiency(
         self,
         df: pd.DataFrame,
-        include_unknown: bool = False
+        include_unknown: bool = False,
+        precomputed: Optional[pd.DataFrame] = None
     ) -> pd.DataFrame:
         """
         Calculate cost efficiency for vendors (cost per day).
@@ -308,6 +743,8 @@ class VendorAnalyzer:
         Args:
             df: DataFrame with work order data
             include_unknown: If True, include contractors with missing names (default: False)
+            precomputed: Optional metrics from _compute_all_metrics to reuse
+                instead of regrouping df
 
         Returns:
             DataFrame with columns:
@@ -318,7 +755,9 @@ class VendorAnalyzer:
             - work_order_count: Number of work orders
         """
         # Get ranked vendors (includes both cost and duration)
-        vendor_df = self.rank_vendors(df, by='total_cost', include_unknown=include_unknown)
+        vendor_df = self.rank_vendors(
+            df, by='total_cost', include_unknown=include_unknown, precomputed=precomputed
+        )
 
         if len(vendor_df) == 0:
             return pd.DataFrame(columns=[
@@ -327,19 +766,14 @@ class VendorAnalyzer:
             ])
 
         # Calculate cost per day (only for vendors with duration data)
-        result_rows = []
-        for _, row in vendor_df.iterrows():
-            if pd.notna(row['avg_duration_days']) and row['avg_duration_days'] > 0:
-                cost_per_day = row['avg_cost_per_wo'] / row['avg_duration_days']
-                result_rows.append({
-                    'contractor': row['contractor'],
-                    'avg_cost_per_wo': row['avg_cost_per_wo'],
-                    'avg_duration_days': row['avg_duration_days'],
-                    'cost_per_day': cost_per_day,
-                    'work_order_count': row['work_order_count']
-                })
-
-        result_df = pd.DataFrame(result_rows)
+        has_duration = vendor_df['avg_duration_days'].notna() & (vendor_df['avg_duration_days'] > 0)
+        result_df = vendor_df.loc[
+            has_duration, ['contractor', 'avg_cost_per_wo', 'avg_duration_days', 'work_order_count']
+        ]
+        result_df.insert(
+            3, 'cost_per_day',
+            result_df['avg_cost_per_wo'].to_numpy() / result_df['avg_duration_days'].to_numpy()
+        )
 
         if len(result_df) > 0:
             # Sort by cost per day (lower is better)
@@ -377,42 +811,32 @@ class VendorAnalyzer:
             - repeat_rate: Percentage of repeat equipment (potential rework indicator)
         """
         # Handle missing Contractor values
-        df_work = df.copy()
-        df_work['Contractor'] = df_work['Contractor'].fillna(self.unknown_label)
-
-        # Filter out unknown if requested
-        if not include_unknown:
-            df_work = df_work[df_work['Contractor'] != self.unknown_label]
-
-        results = []
-
-        # Group by contractor
-        for contractor, contractor_group in df_work.groupby('Contractor'):
-            work_order_count = len(contractor_group)
-
-            # Filter by minimum work order threshold
-            if work_order_count < self.min_work_orders:
-                continue
+        contractors = self._contractor_keys(df, include_unknown)
+
+        # Work orders, unique equipment and repeat equipment per contractor,
+        # counted on factorized integer codes
+        contractor_codes, contractor_names = pd.factorize(contractors, sort=False)
+        equipment_codes, equipment_ids = pd.factorize(df['Equipment_ID'], sort=False)
+        total, unique, repeat = _count_repeat_equipment(
+            contractor_codes, equipment_codes, len(contractor_names), len(equipment_ids)
+        )
 
-            # Count work orders per equipment for this contractor
-            equipment_counts = contractor_group.groupby('Equipment_ID').size()
-            unique_equipment = len(equipment_counts)
-            repeat_equipment_count = (equipment_counts >= 2).sum()
-            repeat_rate = (repeat_equipment_count / unique_equipment * 100) if unique_equipment > 0 else 0
+        metrics = pd.DataFrame({
+            'total_work_orders': total,
+            'unique_equipment': unique,
+            'repeat_equipment_count': repeat
+        }, index=pd.Index(contractor_names, name='contractor'), copy=False)
 
-            results.append({
-                'contractor': contractor,
-                'total_work_orders': work_order_count,
-                'unique_equipment': unique_equipment,
-                'repeat_equipment_count': repeat_equipment_count,
-                'repeat_rate': repeat_rate
-            })
+        # Filter by minimum work order threshold
+        metrics = metrics[metrics['total_work_orders'] >= self.min_work_orders]
 
-        result_df = pd.DataFrame(results)
+        unique_equipment = metrics['unique_equipment']
+        metrics['repeat_rate'] = (
+            metrics['repeat_equipment_count'] / unique_equipment.where(unique_equipment > 0) * 100
+        ).fillna(0.0)
 
-        if len(result_df) > 0:
-            # Sort by repeat rate descending (higher = more potential quality issues)
-            result_df = result_df.sort_values('repeat_rate', ascending=False).reset_index(drop=True)
+        # Sort by repeat rate descending (higher = more potential quality issues)
+        result_df = self._finalize_vendor_frame(metrics, 'repeat_rate')
 
         logger.info(f"Calculated quality indicators for {len(result_df)} contractors")
 
@@ -440,64 +864,74 @@ class VendorAnalyzer:
             - metric: Specific metric value
             - suggestion: Actionable recommendation
         """
-        recommendations = []
-
-        # Get various metrics
-        cost_df = self.calculate_vendor_costs(df, include_unknown=include_unknown)
-        duration_df = self.calculate_vendor_duration(df, include_unknown=include_unknown)
-        efficiency_df = self.calculate_cost_efficiency(df, include_unknown=include_unknown)
+        # Flagged vendors per issue, collected column-wise and turned into
+        # recommendation dicts once at the end. Metric columns are converted
+        # to Python scalars in one tolist() call each before formatting,
+        # rather than boxing a NumPy scalar per value
+        flagged: List[Tuple[np.ndarray, str, List[str], str]] = []
+
+        # Get various metrics, encoding and grouping contractors only once
+        df = self.prepare(df)
+        metrics = self._compute_all_metrics(df, include_unknown=include_unknown)
+        cost_df = self.calculate_vendor_costs(df, precomputed=metrics)
+        duration_df = self.calculate_vendor_duration(df, precomputed=metrics)
+        efficiency_df = self.calculate_cost_efficiency(df, precomputed=metrics)
         quality_df = self.calculate_quality_indicators(df, include_unknown=include_unknown)
 
         # High cost vendors (top 25%)
         if len(cost_df) > 0:
-            high_cost_threshold = cost_df['total_cost'].quantile(0.75)
-            high_cost_vendors = cost_df[cost_df['total_cost'] >= high_cost_threshold]
-
-            for _, row in high_cost_vendors.iterrows():
-                recommendations.append({
-                    'vendor': row['contractor'],
-                    'issue': 'High cost',
-                    'metric': f"${row['total_cost']:,.2f} total ({row['work_order_count']} WOs)",
-                    'suggestion': 'Review contract terms and pricing structure for potential cost savings'
-                })
+            high_cost_vendors, _ = self._select_above_quantile(cost_df, 'total_cost', 0.75)
+
+            flagged.append((
+                high_cost_vendors['contractor'].to_numpy(dtype=object),
+                'High cost',
+                [f"${total:,.2f} total ({count} WOs)" for total, count in zip(
+                    high_cost_vendors['total_cost'].tolist(),
+                    high_cost_vendors['work_order_count'].tolist()
+                )],
+                'Review contract terms and pricing structure for potential cost savings'
+            ))
 
         # Slow completion vendors (top 25%)
         if len(duration_df) > 0:
-            slow_threshold = duration_df['avg_duration_days'].quantile(0.75)
-            slow_vendors = duration_df[duration_df['avg_duration_days'] >= slow_threshold]
+            slow_vendors, _ = self._select_above_quantile(duration_df, 'avg_duration_days', 0.75)
 
-            for _, row in slow_vendors.iterrows():
-                recommendations.append({
-                    'vendor': row['contractor'],
-                    'issue': 'Slow completion',
-                    'metric': f"{row['avg_duration_days']:.1f} days average",
-                    'suggestion': 'Discuss completion time expectations and potential service level agreements'
-                })
+            flagged.append((
+                slow_vendors['contractor'].to_numpy(dtype=object),
+                'Slow completion',
+                [f"{days:.1f} days average" for days in slow_vendors['avg_duration_days'].tolist()],
+                'Discuss completion time expectations and potential service level agreements'
+            ))
 
         # Low efficiency vendors (top 25% cost per day)
         if len(efficiency_df) > 0:
-            inefficient_threshold = efficiency_df['cost_per_day'].quantile(0.75)
-            inefficient_vendors = efficiency_df[efficiency_df['cost_per_day'] >= inefficient_threshold]
+            cost_per_day = efficiency_df['cost_per_day'].to_numpy()
+            inefficient = cost_per_day >= _linear_quantile(cost_per_day, 0.75)
 
-            for _, row in inefficient_vendors.iterrows():
-                recommendations.append({
-                    'vendor': row['contractor'],
-                    'issue': 'Low efficiency',
-                    'metric': f"${row['cost_per_day']:.2f} per day",
-                    'suggestion': 'Evaluate work efficiency and consider alternative vendors for comparison'
-                })
+            flagged.append((
+                efficiency_df['contractor'].to_numpy(dtype=object)[inefficient],
+                'Low efficiency',
+                [f"${cost:.2f} per day" for cost in cost_per_day[inefficient].tolist()],
+                'Evaluate work efficiency and consider alternative vendors for comparison'
+            ))
 
         # Quality concerns (repeat rate > 50%)
         if len(quality_df) > 0:
-            quality_concern_vendors = quality_df[quality_df['repeat_rate'] > 50]
-
-            for _, row in quality_concern_vendors.iterrows():
-                recommendations.append({
-                    'vendor': row['contractor'],
-                    'issue': 'Quality concerns',
-                    'metric': f"{row['repeat_rate']:.1f}% repeat equipment rate",
-                    'suggestion': 'Investigate repeat work orders on same equipment for potential quality issues'
-                })
+            repeat_rate = quality_df['repeat_rate'].to_numpy()
+            quality_concern = repeat_rate > 50
+
+            flagged.append((
+                quality_df['contractor'].to_numpy(dtype=object)[quality_concern],
+                'Quality concerns',
+                [f"{rate:.1f}% repeat equipment rate" for rate in repeat_rate[quality_concern].tolist()],
+                'Investigate repeat work orders on same equipment for potential quality issues'
+            ))
+
+        recommendations = [
+            {'vendor': vendor, 'issue': issue, 'metric': metric, 'suggestion': suggestion}
+            for vendors, issue, metric_text, suggestion in flagged
+            for vendor, metric in zip(vendors, metric_text)
+        ]
 
         logger.info(f"Generated {len(recommendations)} vendor recommendations")
 
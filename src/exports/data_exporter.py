@@ -5,14 +5,265 @@ Purpose: Enable stakeholders to consume analysis data in standard formats for
 external tools, spreadsheets, or custom processing.
 """
 
+import math
+import numpy as np
 import pandas as pd
+import io
 import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Union, Dict, List, Any
+from typing import Union, Dict, List, Any, Optional, Tuple, Literal
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional dependency; stdlib json is used instead
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Buffer size for export file handles, so writers issue few large syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Numbers orjson spells differently from json.dumps: any exponent form, and
+# values below 1e-4 that orjson writes out in positional notation
+_ORJSON_DIVERGENT_NUMBER = re.compile(rb'[0-9][eE]|0\.0000')
+
+# Export column order for each CSV export kind
+_EQUIPMENT_COLS = (
+    'Equipment_Name', 'equipment_primary_category', 'work_orders_per_month',
+    'avg_cost', 'cost_impact', 'priority_score', 'overall_rank'
+)
+_SEASONAL_COLS = ('period', 'total_cost', 'work_order_count', 'avg_cost')
+_VENDOR_COLS = ('contractor', 'total_cost', 'work_order_count', 'avg_cost_per_wo')
+_FAILURE_COLS = ('pattern', 'frequency', 'total_cost', 'equipment_count', 'category')
+
+# Header-only CSV content written for empty exports, by export kind
+_EMPTY_CSV_HEADERS = {
+    kind: ','.join(cols) + '\n'
+    for kind, cols in (
+        ('equipment_rankings', _EQUIPMENT_COLS),
+        ('seasonal_patterns', _SEASONAL_COLS),
+        ('vendor_metrics', _VENDOR_COLS),
+        ('failure_patterns', _FAILURE_COLS),
+    )
+}
+
+# Standard failure pattern export names for alternative analyzer keys
+_FAILURE_COLUMN_MAPPING = {
+    'occurrences': 'frequency',
+    'equipment_affected': 'equipment_count'
+}
+
+# Monetary columns kept in float64 when float columns are downcast for export
+EXACT_COLUMNS = frozenset({
+    'PO_AMOUNT', 'total_cost', 'avg_cost', 'avg_cost_per_wo', 'cost_impact', 'cost_threshold'
+})
+
+
+@contextmanager
+def _open_output(output_path: Union[str, Path], mode: str, newline: Optional[str] = None):
+    """
+    Open an export file for writing, compressing it according to its suffix.
+
+    Paths ending in '.gz' are gzip-compressed and paths ending in '.zst' are
+    zstd-compressed at level 3 (requires the optional zstandard package), so
+    callers opt in to compression just by naming the output file, e.g.
+    'vendor_metrics.csv.zst'. Files are written with a WRITE_BUFFER_SIZE
+    buffer.
+
+    Data goes to a temporary file next to output_path, which replaces
+    output_path atomically (os.replace) once the with-block completes. If the
+    block raises, the temporary file is removed and any existing output_path
+    is left untouched, so a failed export never leaves a truncated file.
+
+    Args:
+        output_path: Path to output file
+        mode: 'w' (text) or 'wb' (binary)
+        newline: Newline translation for text mode (see open())
+
+    Yields:
+        Writable file object
+
+    Raises:
+        ImportError: If a '.zst' path is given and zstandard is not installed
+    """
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f"{output_path.name}.tmp.{os.getpid()}")
+    suffix = output_path.suffix.lower()
+
+    try:
+        with ExitStack() as stack:
+            if suffix not in ('.gz', '.zst'):
+                yield stack.enter_context(
+                    open(tmp_path, mode, buffering=WRITE_BUFFER_SIZE, newline=newline)
+                )
+            else:
+                f = stack.enter_context(open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE))
+                if suffix == '.gz':
+                    import gzip
+                    # Name the final file, not the temporary, in the gzip header
+                    f = stack.enter_context(gzip.GzipFile(filename=output_path.name, mode='wb', fileobj=f))
+                else:
+                    import zstandard
+                    f = stack.enter_context(
+                        zstandard.ZstdCompressor(level=3).stream_writer(f, closefd=False)
+                    )
+                if 'b' not in mode:
+                    f = stack.enter_context(io.TextIOWrapper(f, newline=newline))
+                yield f
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _write_empty_csv(output_path: Union[str, Path], kind: str) -> None:
+    """Write the header-only CSV for an empty export of the given kind."""
+    with _open_output(output_path, 'w', newline='') as f:
+        f.write(_EMPTY_CSV_HEADERS[kind])
+
+
+def _write_csv(df: pd.DataFrame, output_path: Union[str, Path]) -> None:
+    """
+    Write a DataFrame to CSV without the index, through a large buffered handle.
+
+    Always uses DataFrame.to_csv: PyArrow's CSV writer is faster but cannot
+    reproduce its text (it quotes every string, writes booleans as
+    true/false and drops the '.0' of whole floats), and exports must keep
+    the same bytes for consumers that diff or parse them literally.
+
+    Args:
+        df: DataFrame to write
+        output_path: Path to output CSV file
+    """
+    with _open_output(output_path, 'w', newline='') as f:
+        df.to_csv(f, index=False)
+
+
+def _sort_descending(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    Sort df by column descending, skipping the sort if already in order.
+
+    Analyzer outputs usually arrive sorted already, so a single-pass
+    monotonicity check avoids an O(N log N) re-sort.
+
+    Args:
+        df: DataFrame to sort
+        column: Column to sort by; df is returned unchanged if missing
+
+    Returns:
+        DataFrame sorted by column descending
+    """
+    if column in df.columns and not df[column].is_monotonic_decreasing:
+        return df.sort_values(column, ascending=False, kind='stable')
+    return df
+
+
+def _dump_json(data: Any, output_path: Union[str, Path], use_orjson: bool = True) -> None:
+    """
+    Write data as pretty-printed (2-space indented) JSON.
+
+    Serializes in memory and writes the document in one call, encoding with
+    orjson when installed and falling back to the standard json module when
+    it is not or when data holds a type orjson cannot serialize.
+
+    The orjson payload is only kept when it is byte-identical to what
+    json.dumps(indent=2) would write. orjson emits non-ASCII text as raw
+    UTF-8 (json escapes it as \\uXXXX) and formats very large or small
+    floats differently, so documents containing either are re-encoded with
+    the json module.
+
+    Args:
+        data: JSON-safe data (see DataExporter._clean_for_json)
+        output_path: Path to output JSON file
+        use_orjson: If False, always encode with the standard json module
+    """
+    if use_orjson and orjson is not None:
+        try:
+            payload = orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass
+        else:
+            if payload.isascii() and _ORJSON_DIVERGENT_NUMBER.search(payload) is None:
+                with _open_output(output_path, 'wb') as f:
+                    f.write(payload)
+                return
+
+    with _open_output(output_path, 'w') as f:
+        f.write(json.dumps(data, indent=2))
+
+
+def _write_ndjson(records: List[Dict[str, Any]], output_path: Union[str, Path],
+                  use_orjson: bool = True) -> None:
+    """
+    Write records as newline-delimited JSON, one object per line.
+
+    Uses orjson's C serializer when installed and falls back to the standard
+    json module otherwise. Each record is encoded and written on its own, so
+    the full document is never held in memory as one string.
+
+    Args:
+        records: JSON-safe records (see DataExporter._clean_for_json)
+        output_path: Path to output NDJSON file
+        use_orjson: If False, always encode with the standard json module
+    """
+    if not use_orjson or orjson is None:
+        with _open_output(output_path, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record))
+                f.write('\n')
+        return
+
+    with _open_output(output_path, 'wb') as f:
+        for record in records:
+            f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+
+
+def _clean_float(value: float) -> Optional[float]:
+    """NaN/Infinity -> None, other floats as Python floats."""
+    if math.isnan(value) or math.isinf(value):
+        return None
+    return float(value)
+
+
+def _identity(value: Any) -> Any:
+    """Values that are already JSON-safe."""
+    return value
+
+
+# Scalar types that need no JSON cleaning (exact types: bool, an int
+# subclass, is still normalized to 0/1 by _clean_value)
+_JSON_SAFE_TYPES = frozenset({str, int, type(None)})
+
+# Cleaners for common scalar types, keyed by exact type (see
+# DataExporter._clean_value); bool maps to int like any int subclass
+_SCALAR_CLEANERS = {
+    str: _identity,
+    type(None): _identity,
+    float: _clean_float,
+    np.float64: _clean_float,
+    np.float32: _clean_float,
+    int: int,
+    bool: int,
+    np.int64: int,
+    np.int32: int,
+    pd.Timestamp: pd.Timestamp.isoformat,
+}
+
+# isinstance() fallbacks for scalar types missing from _SCALAR_CLEANERS
+_FLOAT_TYPES = (float, np.floating)
+_INT_TYPES = (int, np.integer)
+
 
 class DataExporter:
     """
@@ -23,8 +274,48 @@ class DataExporter:
     - Seasonal patterns (dictionaries with monthly/quarterly data)
     - Vendor metrics (DataFrames with vendor performance)
     - Failure patterns (lists of pattern dictionaries)
+
+    Output paths ending in '.gz' or '.zst' are written compressed.
     """
 
+    def __init__(self, downcast_floats: bool = False, use_orjson: bool = True):
+        """
+        Initialize DataExporter.
+
+        Args:
+            downcast_floats: If True, write non-monetary float64 columns
+                (scores, rates, per-month figures) to CSV as float32, which
+                shortens their text and halves the data stringified. Columns
+                in EXACT_COLUMNS keep full precision. JSON exports are not
+                affected. (default: False)
+            use_orjson: If True, encode JSON exports with orjson when it is
+                installed; if False, always use the standard json module
+                (default: True)
+        """
+        self.downcast_floats = downcast_floats
+        self.use_orjson = use_orjson
+
+    def _prepare_for_export(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the configured float downcast to a frame about to be written to CSV.
+
+        Args:
+            df: DataFrame to export
+
+        Returns:
+            df itself, or a shallow-converted frame with float32 columns
+        """
+        if not self.downcast_floats:
+            return df
+
+        columns = [
+            col for col, dtype in df.dtypes.items()
+            if dtype == np.float64 and col not in EXACT_COLUMNS
+        ]
+        if not columns:
+            return df
+        return df.astype({col: np.float32 for col in columns})
+
     def export_equipment_rankings(self, df: pd.DataFrame, output_path: Union[str, Path]) -> None:
         """
         Export equipment ranking DataFrame to CSV.
@@ -40,23 +331,15 @@ class DataExporter:
         # Handle empty DataFrame
         if df is None or len(df) == 0:
             logger.warning("Empty DataFrame provided for equipment rankings export")
-            empty_df = pd.DataFrame(columns=[
-                'Equipment_Name', 'equipment_primary_category', 'work_orders_per_month',
-                'avg_cost', 'cost_impact', 'priority_score', 'overall_rank'
-            ])
-            empty_df.to_csv(output_path, index=False)
+            _write_empty_csv(output_path, 'equipment_rankings')
             return
 
-        # Create a copy for export (don't modify original)
-        export_df = df.copy()
-
         # Sort by priority_score descending
-        if 'priority_score' in export_df.columns:
-            export_df = export_df.sort_values('priority_score', ascending=False)
+        export_df = _sort_descending(df, 'priority_score')
 
         # Export to CSV without index
-        export_df.to_csv(output_path, index=False)
-        logger.info(f"Exported {len(export_df)} equipment rankings to {output_path}")
+        _write_csv(self._prepare_for_export(export_df), output_path)
+        logger.info("Exported %d equipment rankings to %s", len(export_df), output_path)
 
     def export_seasonal_patterns(self, patterns_dict: Dict[str, Any], output_path: Union[str, Path]) -> None:
         """
@@ -75,8 +358,7 @@ class DataExporter:
         # Handle None or empty dict
         if patterns_dict is None or len(patterns_dict) == 0:
             logger.warning("Empty patterns_dict provided for seasonal patterns export")
-            empty_df = pd.DataFrame(columns=['period', 'total_cost', 'work_order_count', 'avg_cost'])
-            empty_df.to_csv(output_path, index=False)
+            _write_empty_csv(output_path, 'seasonal_patterns')
             return
 
         # Try to extract DataFrame from patterns_dict
@@ -91,25 +373,20 @@ class DataExporter:
         # If still no DataFrame found, create empty
         if export_df is None or len(export_df) == 0:
             logger.warning("No monthly or quarterly cost data found in patterns_dict")
-            empty_df = pd.DataFrame(columns=['period', 'total_cost', 'work_order_count', 'avg_cost'])
-            empty_df.to_csv(output_path, index=False)
+            _write_empty_csv(output_path, 'seasonal_patterns')
             return
 
-        # Create a copy for export
-        export_df = export_df.copy()
-
-        # Ensure required columns exist
-        required_cols = ['period', 'total_cost', 'work_order_count', 'avg_cost']
-        for col in required_cols:
-            if col not in export_df.columns:
-                export_df[col] = None
-
-        # Select and reorder columns
-        export_df = export_df[required_cols]
+        # Project required columns in order (missing ones filled with None)
+        # without copying the caller's frame
+        export_df = pd.DataFrame(
+            {col: export_df[col] if col in export_df.columns else None for col in _SEASONAL_COLS},
+            index=export_df.index,
+            copy=False
+        )
 
         # Export to CSV without index
-        export_df.to_csv(output_path, index=False)
-        logger.info(f"Exported {len(export_df)} seasonal patterns to {output_path}")
+        _write_csv(self._prepare_for_export(export_df), output_path)
+        logger.info("Exported %d seasonal patterns to %s", len(export_df), output_path)
 
     def export_vendor_metrics(self, df: pd.DataFrame, output_path: Union[str, Path]) -> None:
         """
@@ -125,22 +402,15 @@ class DataExporter:
         # Handle empty DataFrame
         if df is None or len(df) == 0:
             logger.warning("Empty DataFrame provided for vendor metrics export")
-            empty_df = pd.DataFrame(columns=[
-                'contractor', 'total_cost', 'work_order_count', 'avg_cost_per_wo'
-            ])
-            empty_df.to_csv(output_path, index=False)
+            _write_empty_csv(output_path, 'vendor_metrics')
             return
 
-        # Create a copy for export
-        export_df = df.copy()
-
         # Sort by total_cost descending
-        if 'total_cost' in export_df.columns:
-            export_df = export_df.sort_values('total_cost', ascending=False)
+        export_df = _sort_descending(df, 'total_cost')
 
         # Export to CSV without index
-        export_df.to_csv(output_path, index=False)
-        logger.info(f"Exported {len(export_df)} vendor metrics to {output_path}")
+        _write_csv(self._prepare_for_export(export_df), output_path)
+        logger.info("Exported %d vendor metrics to %s", len(export_df), output_path)
 
     def export_failure_patterns(self, patterns_list: List[Dict[str, Any]], output_path: Union[str, Path]) -> None:
         """
@@ -157,77 +427,68 @@ class DataExporter:
         # Handle None or empty list
         if patterns_list is None or len(patterns_list) == 0:
             logger.warning("Empty patterns_list provided for failure patterns export")
-            empty_df = pd.DataFrame(columns=[
-                'pattern', 'frequency', 'total_cost', 'equipment_count', 'category'
-            ])
-            empty_df.to_csv(output_path, index=False)
+            _write_empty_csv(output_path, 'failure_patterns')
             return
 
-        # Convert list of dicts to DataFrame
-        df = pd.DataFrame(patterns_list)
-
-        # Standardize column names for export
-        # Map various possible input column names to standard export names
-        column_mapping = {
-            'occurrences': 'frequency',
-            'equipment_affected': 'equipment_count'
+        # Standardize column names for export (map various possible input
+        # keys to standard export names); a source key is only used when the
+        # standard name itself is absent from every pattern
+        present = set().union(*patterns_list)
+        sources = {
+            new_name: old_name for old_name, new_name in _FAILURE_COLUMN_MAPPING.items()
+            if new_name not in present
         }
 
-        for old_name, new_name in column_mapping.items():
-            if old_name in df.columns and new_name not in df.columns:
-                df = df.rename(columns={old_name: new_name})
-
-        # Ensure required columns exist
-        required_cols = ['pattern', 'frequency', 'total_cost', 'equipment_count', 'category']
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = None
+        # Build only the source columns (missing ones as NaN) and rename them
+        # in place, instead of a full frame plus rename/reindex copies
+        keys = [sources.get(col, col) for col in _FAILURE_COLS]
+        export_df = pd.DataFrame(patterns_list, columns=keys)
+        export_df.columns = list(_FAILURE_COLS)
+        _write_csv(export_df, output_path)
 
-        # Select and reorder columns
-        export_df = df[required_cols].copy()
-
-        # Export to CSV without index
-        export_df.to_csv(output_path, index=False)
-        logger.info(f"Exported {len(export_df)} failure patterns to {output_path}")
+        logger.info("Exported %d failure patterns to %s", len(patterns_list), output_path)
 
     # JSON Export Methods
 
-    def export_equipment_rankings_json(self, df: pd.DataFrame, output_path: Union[str, Path]) -> None:
+    def export_equipment_rankings_json(
+        self,
+        df: pd.DataFrame,
+        output_path: Union[str, Path],
+        orient: Literal['records', 'columns'] = 'records'
+    ) -> None:
         """
         Export equipment ranking DataFrame to JSON.
 
         Args:
             df: DataFrame with equipment rankings (from equipment_ranker.rank_equipment)
             output_path: Path to output JSON file
+            orient: 'records' (default) for an array of objects, or 'columns'
+                for a column-oriented {"layout": "columns", "data": {...}}
+                document, which is smaller for large frames
 
         Creates pretty-printed JSON array of equipment objects sorted by priority_score.
         Handles NaN values by converting to null.
         """
+        if orient not in ('records', 'columns'):
+            raise ValueError(f"Invalid orient: {orient}")
+
         # Handle empty DataFrame
         if df is None or len(df) == 0:
             logger.warning("Empty DataFrame provided for equipment rankings JSON export")
-            with open(output_path, 'w') as f:
-                json.dump([], f, indent=2)
+            empty = [] if orient == 'records' else {'layout': 'columns', 'data': {}}
+            _dump_json(empty, output_path, self.use_orjson)
             return
 
-        # Create a copy for export
-        export_df = df.copy()
-
         # Sort by priority_score descending
-        if 'priority_score' in export_df.columns:
-            export_df = export_df.sort_values('priority_score', ascending=False)
-
-        # Convert to list of dicts, replacing NaN with None
-        records = export_df.to_dict('records')
+        export_df = _sort_descending(df, 'priority_score')
 
-        # Clean NaN/Infinity values
-        cleaned_records = self._clean_for_json(records)
+        # Convert to JSON-safe records or columns, replacing NaN/Infinity with None
+        payload = self._df_to_json_payload(export_df, orient)
 
         # Write to JSON with pretty printing
-        with open(output_path, 'w') as f:
-            json.dump(cleaned_records, f, indent=2)
+        _dump_json(payload, output_path, self.use_orjson)
 
-        logger.info(f"Exported {len(cleaned_records)} equipment rankings to {output_path}")
+        logger.info("Exported %d equipment rankings to %s", len(export_df), output_path)
 
     def export_seasonal_patterns_json(self, patterns_dict: Dict[str, Any], output_path: Union[str, Path]) -> None:
         """
@@ -248,8 +509,7 @@ class DataExporter:
         # Handle None or empty dict
         if patterns_dict is None or len(patterns_dict) == 0:
             logger.warning("Empty patterns_dict provided for seasonal patterns JSON export")
-            with open(output_path, 'w') as f:
-                json.dump({}, f, indent=2)
+            _dump_json({}, output_path, self.use_orjson)
             return
 
         # Build output structure
@@ -259,59 +519,61 @@ class DataExporter:
         if 'monthly_costs' in patterns_dict and patterns_dict['monthly_costs'] is not None:
             monthly_df = patterns_dict['monthly_costs']
             if len(monthly_df) > 0:
-                output['monthly'] = self._clean_for_json(monthly_df.to_dict('records'))
+                output['monthly'] = self._df_to_json_records(monthly_df)
 
         # Convert quarterly costs DataFrame to list
         if 'quarterly_costs' in patterns_dict and patterns_dict['quarterly_costs'] is not None:
             quarterly_df = patterns_dict['quarterly_costs']
             if len(quarterly_df) > 0:
-                output['quarterly'] = self._clean_for_json(quarterly_df.to_dict('records'))
+                output['quarterly'] = self._df_to_json_records(quarterly_df)
 
         # Include patterns list if available
         if 'patterns' in patterns_dict and patterns_dict['patterns'] is not None:
             output['patterns'] = patterns_dict['patterns']
 
         # Write to JSON with pretty printing
-        with open(output_path, 'w') as f:
-            json.dump(output, f, indent=2)
+        _dump_json(output, output_path, self.use_orjson)
 
-        logger.info(f"Exported seasonal patterns to {output_path}")
+        logger.info("Exported seasonal patterns to %s", output_path)
 
-    def export_vendor_metrics_json(self, df: pd.DataFrame, output_path: Union[str, Path]) -> None:
+    def export_vendor_metrics_json(
+        self,
+        df: pd.DataFrame,
+        output_path: Union[str, Path],
+        orient: Literal['records', 'columns'] = 'records'
+    ) -> None:
         """
         Export vendor performance DataFrame to JSON.
 
         Args:
             df: DataFrame with vendor metrics (from vendor_analyzer.calculate_vendor_costs)
             output_path: Path to output JSON file
+            orient: 'records' (default) for an array of objects, or 'columns'
+                for a column-oriented {"layout": "columns", "data": {...}}
+                document, which is smaller for large frames
 
         Creates pretty-printed JSON array of vendor objects sorted by total_cost.
         """
+        if orient not in ('records', 'columns'):
+            raise ValueError(f"Invalid orient: {orient}")
+
         # Handle empty DataFrame
         if df is None or len(df) == 0:
             logger.warning("Empty DataFrame provided for vendor metrics JSON export")
-            with open(output_path, 'w') as f:
-                json.dump([], f, indent=2)
+            empty = [] if orient == 'records' else {'layout': 'columns', 'data': {}}
+            _dump_json(empty, output_path, self.use_orjson)
             return
 
-        # Create a copy for export
-        export_df = df.copy()
-
         # Sort by total_cost descending
-        if 'total_cost' in export_df.columns:
-            export_df = export_df.sort_values('total_cost', ascending=False)
+        export_df = _sort_descending(df, 'total_cost')
 
-        # Convert to list of dicts
-        records = export_df.to_dict('records')
-
-        # Clean NaN/Infinity values
-        cleaned_records = self._clean_for_json(records)
+        # Convert to JSON-safe records or columns, replacing NaN/Infinity with None
+        payload = self._df_to_json_payload(export_df, orient)
 
         # Write to JSON with pretty printing
-        with open(output_path, 'w') as f:
-            json.dump(cleaned_records, f, indent=2)
+        _dump_json(payload, output_path, self.use_orjson)
 
-        logger.info(f"Exported {len(cleaned_records)} vendor metrics to {output_path}")
+        logger.info("Exported %d vendor metrics to %s", len(export_df), output_path)
 
     def export_failure_patterns_json(self, patterns_list: List[Dict[str, Any]], output_path: Union[str, Path]) -> None:
         """
@@ -326,18 +588,324 @@ class DataExporter:
         # Handle None or empty list
         if patterns_list is None or len(patterns_list) == 0:
             logger.warning("Empty patterns_list provided for failure patterns JSON export")
-            with open(output_path, 'w') as f:
-                json.dump([], f, indent=2)
+            _dump_json([], output_path, self.use_orjson)
             return
 
         # Clean for JSON (handle any NaN or special values)
         cleaned_list = self._clean_for_json(patterns_list)
 
         # Write to JSON with pretty printing
-        with open(output_path, 'w') as f:
-            json.dump(cleaned_list, f, indent=2)
+        _dump_json(cleaned_list, output_path, self.use_orjson)
+
+        logger.info("Exported %d failure patterns to %s", len(cleaned_list), output_path)
+
+    # Paired CSV + JSON Export Methods
+
+    def _write_pair(self, write_csv, write_json) -> None:
+        """
+        Run a CSV writer and a JSON writer for the same data concurrently.
+
+        Args:
+            write_csv: Zero-argument callable writing the CSV file
+            write_json: Zero-argument callable writing the JSON file
+
+        Raises:
+            Exception: Re-raises the first failed write
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(write_csv), executor.submit(write_json)]
+            for future in futures:
+                future.result()
+
+    def export_equipment_rankings_both(
+        self,
+        df: pd.DataFrame,
+        csv_path: Union[str, Path],
+        json_path: Union[str, Path]
+    ) -> None:
+        """
+        Export equipment rankings to CSV and JSON from a single sort.
 
-        logger.info(f"Exported {len(cleaned_list)} failure patterns to {output_path}")
+        Args:
+            df: DataFrame with equipment rankings (from equipment_ranker.rank_equipment)
+            csv_path: Path to output CSV file
+            json_path: Path to output JSON file
+
+        Produces the same files as export_equipment_rankings and
+        export_equipment_rankings_json, but sorts by priority_score once and
+        hands the sorted frame to both writers.
+        """
+        if df is not None and len(df) > 0:
+            df = _sort_descending(df, 'priority_score')
+        self._write_pair(
+            lambda: self.export_equipment_rankings(df, csv_path),
+            lambda: self.export_equipment_rankings_json(df, json_path)
+        )
+
+    def export_seasonal_patterns_both(
+        self,
+        patterns_dict: Dict[str, Any],
+        csv_path: Union[str, Path],
+        json_path: Union[str, Path]
+    ) -> None:
+        """
+        Export seasonal analysis patterns to CSV and JSON.
+
+        Args:
+            patterns_dict: Dictionary with seasonal data (see export_seasonal_patterns)
+            csv_path: Path to output CSV file
+            json_path: Path to output JSON file
+        """
+        self._write_pair(
+            lambda: self.export_seasonal_patterns(patterns_dict, csv_path),
+            lambda: self.export_seasonal_patterns_json(patterns_dict, json_path)
+        )
+
+    def export_vendor_metrics_both(
+        self,
+        df: pd.DataFrame,
+        csv_path: Union[str, Path],
+        json_path: Union[str, Path]
+    ) -> None:
+        """
+        Export vendor metrics to CSV and JSON from a single sort.
+
+        Args:
+            df: DataFrame with vendor metrics (from vendor_analyzer.calculate_vendor_costs)
+            csv_path: Path to output CSV file
+            json_path: Path to output JSON file
+
+        Produces the same files as export_vendor_metrics and
+        export_vendor_metrics_json, but sorts by total_cost once and hands
+        the sorted frame to both writers.
+        """
+        if df is not None and len(df) > 0:
+            df = _sort_descending(df, 'total_cost')
+        self._write_pair(
+            lambda: self.export_vendor_metrics(df, csv_path),
+            lambda: self.export_vendor_metrics_json(df, json_path)
+        )
+
+    def export_failure_patterns_both(
+        self,
+        patterns_list: List[Dict[str, Any]],
+        csv_path: Union[str, Path],
+        json_path: Union[str, Path]
+    ) -> None:
+        """
+        Export failure patterns to CSV and JSON.
+
+        Args:
+            patterns_list: List of pattern dictionaries from failure_pattern_analyzer
+            csv_path: Path to output CSV file
+            json_path: Path to output JSON file
+        """
+        self._write_pair(
+            lambda: self.export_failure_patterns(patterns_list, csv_path),
+            lambda: self.export_failure_patterns_json(patterns_list, json_path)
+        )
+
+    def export_ndjson(self, df: pd.DataFrame, output_path: Union[str, Path]) -> None:
+        """
+        Export an analysis DataFrame to newline-delimited JSON.
+
+        Args:
+            df: Any analysis result DataFrame (rankings, vendor metrics, ...)
+            output_path: Path to output NDJSON file
+
+        Writes one JSON object per row, in the frame's row order, which suits
+        large tables and line-oriented tools. NaN values are written as null.
+        An empty or None frame produces an empty file.
+        """
+        # Handle empty DataFrame
+        if df is None or len(df) == 0:
+            logger.warning("Empty DataFrame provided for NDJSON export")
+            _write_ndjson([], output_path, self.use_orjson)
+            return
+
+        records = self._df_to_json_records(df)
+        _write_ndjson(records, output_path, self.use_orjson)
+
+        logger.info("Exported %d records to %s", len(records), output_path)
+
+    def export_all(
+        self,
+        exports: Dict[str, Tuple[str, Any]],
+        output_dir: Union[str, Path],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Export several analysis results to CSV and JSON concurrently.
+
+        Each export writes <name>.csv and <name>.json into output_dir using the
+        matching export_<kind>_both method, so each frame is sorted once for
+        both files. The exports are independent and spend most of their time
+        in pandas code and file I/O, so they run on a thread pool.
+
+        Args:
+            exports: Mapping of output file stem to (kind, data), where kind is
+                one of 'equipment_rankings', 'seasonal_patterns',
+                'vendor_metrics', 'failure_patterns' and data is what the
+                matching export method accepts
+            output_dir: Directory for the exported files
+            max_workers: Thread pool size (default: min(8, CPU count))
+
+        Returns:
+            Dict with file paths in the order of exports:
+            {
+                'csv': [list of CSV file paths],
+                'json': [list of JSON file paths]
+            }
+
+        Raises:
+            ValueError: If an export kind is not supported
+            Exception: Re-raises the first failed export
+        """
+        output_dir = Path(output_dir)
+        kinds = ('equipment_rankings', 'seasonal_patterns', 'vendor_metrics', 'failure_patterns')
+
+        tasks = []
+        csv_files = []
+        json_files = []
+        for name, (kind, data) in exports.items():
+            if kind not in kinds:
+                raise ValueError(f"Invalid export kind: {kind}")
+            csv_path = output_dir / f"{name}.csv"
+            json_path = output_dir / f"{name}.json"
+            tasks.append((getattr(self, f"export_{kind}_both"), data, csv_path, json_path))
+            csv_files.append(str(csv_path))
+            json_files.append(str(json_path))
+
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(export, data, csv_path, json_path)
+                for export, data, csv_path, json_path in tasks
+            ]
+            for future in futures:
+                future.result()
+
+        logger.info("Exported %d files to %s", 2 * len(tasks), output_dir)
+
+        return {
+            'csv': csv_files,
+            'json': json_files
+        }
+
+    def _df_to_json_columns(self, df: pd.DataFrame) -> List[List[Any]]:
+        """
+        Convert each DataFrame column to a JSON-safe list of values.
+
+        Numeric and datetime columns are cleaned with one vectorized pass per
+        column instead of per-cell type checks. Other columns (object,
+        categorical, nullable extension types) are cleaned per value.
+
+        Args:
+            df: DataFrame to convert
+
+        Returns:
+            One list of cleaned values per column, in column order
+        """
+        columns = []
+        for _, col in df.items():
+            dtype = col.dtype
+            if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+                # NaN/Infinity -> None, finite values as Python floats
+                values = col.to_numpy()
+                cleaned = values.astype(object)
+                cleaned[~np.isfinite(values)] = None
+                columns.append(cleaned.tolist())
+            elif isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+                columns.append(col.tolist())
+            elif isinstance(dtype, np.dtype) and dtype.kind == 'b':
+                # Booleans are written as 0/1 like other integers
+                columns.append(col.to_numpy().astype(np.int64).tolist())
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                columns.append([
+                    None if value is pd.NaT else value.isoformat() for value in col
+                ])
+            else:
+                columns.append([self._clean_value(value) for value in col.tolist()])
+
+        return columns
+
+    def _df_to_json_records(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Convert a DataFrame to JSON-safe records column by column.
+
+        Produces the same records as _clean_for_json(df.to_dict('records')),
+        using _df_to_json_columns for the per-column cleaning.
+
+        Args:
+            df: DataFrame to convert
+
+        Returns:
+            List of record dicts safe for JSON serialization
+        """
+        names = list(df.columns)
+        return [dict(zip(names, row)) for row in zip(*self._df_to_json_columns(df))]
+
+    def _df_to_json_payload(
+        self,
+        df: pd.DataFrame,
+        orient: Literal['records', 'columns']
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Build the JSON document for a DataFrame export in the given layout.
+
+        Args:
+            df: DataFrame to convert
+            orient: 'records' for an array of row objects, or 'columns' for
+                {"layout": "columns", "data": {column: [values, ...]}}, which
+                names each column once instead of once per row
+
+        Returns:
+            JSON-safe list of records or column-layout dict
+
+        Raises:
+            ValueError: If orient is not 'records' or 'columns'
+        """
+        if orient == 'records':
+            return self._df_to_json_records(df)
+        if orient == 'columns':
+            return {
+                'layout': 'columns',
+                'data': dict(zip(df.columns, self._df_to_json_columns(df)))
+            }
+        raise ValueError(f"Invalid orient: {orient}")
+
+    def _clean_value(self, value: Any) -> Any:
+        """
+        Clean a single value for JSON serialization (see _clean_for_json).
+
+        Common scalar types are dispatched through _SCALAR_CLEANERS with one
+        dict lookup on the exact type; other values go through the general
+        isinstance checks.
+
+        Args:
+            value: Value to clean
+
+        Returns:
+            JSON-safe value
+        """
+        cleaner = _SCALAR_CLEANERS.get(type(value))
+        if cleaner is not None:
+            return cleaner(value)
+
+        # Handle various special cases
+        if isinstance(value, _FLOAT_TYPES):
+            return _clean_float(value)
+        elif isinstance(value, _INT_TYPES):
+            return int(value)
+        elif isinstance(value, pd.Timestamp):
+            return value.isoformat()
+        elif isinstance(value, (list, dict)):
+            return self._clean_for_json(value)
+        elif pd.isna(value):
+            return None
+        return value
 
     def _clean_for_json(self, data: Union[List[Dict], Dict]) -> Union[List[Dict], Dict]:
         """
@@ -352,30 +920,18 @@ class DataExporter:
         Returns:
             Cleaned data structure safe for JSON serialization
         """
-        import math
-        import numpy as np
-
         if isinstance(data, list):
+            # Lists of dicts holding only str/int/None values (e.g. integer
+            # and text failure patterns) are already JSON-safe; one type scan
+            # is cheaper than rebuilding every dict
+            if all(
+                type(item) is dict
+                and all(type(value) in _JSON_SAFE_TYPES for value in item.values())
+                for item in data
+            ):
+                return data
             return [self._clean_for_json(item) for item in data]
         elif isinstance(data, dict):
-            cleaned = {}
-            for key, value in data.items():
-                # Handle various special cases
-                if isinstance(value, (float, np.floating)):
-                    if math.isnan(value) or math.isinf(value):
-                        cleaned[key] = None
-                    else:
-                        cleaned[key] = float(value)
-                elif isinstance(value, (int, np.integer)):
-                    cleaned[key] = int(value)
-                elif isinstance(value, pd.Timestamp):
-                    cleaned[key] = value.isoformat()
-                elif pd.isna(value):
-                    cleaned[key] = None
-                elif isinstance(value, (list, dict)):
-                    cleaned[key] = self._clean_for_json(value)
-                else:
-                    cleaned[key] = value
-            return cleaned
+            return {key: self._clean_value(value) for key, value in data.items()}
         else:
             return data
@@ -3,12 +3,23 @@ Pipeline orchestrator for end-to-end work order analysis.
 
 Coordinates all analysis modules and output generation to provide
 a unified entry point for batch processing workflows.
+
+The reporting, export and visualization modules (and with them reportlab,
+openpyxl, matplotlib and plotly) are imported inside the methods that use
+them rather than at module level. Batch jobs that only call
+run_full_analysis() skip that import cost; the first output call pays it
+instead.
 """
 
+import hashlib
 import logging
+import multiprocessing
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 # Pipeline modules
@@ -22,20 +33,123 @@ from src.analysis.seasonal_analyzer import SeasonalAnalyzer
 from src.analysis.vendor_analyzer import VendorAnalyzer
 from src.analysis.failure_pattern_analyzer import FailurePatternAnalyzer
 
-# Reporting modules
-from src.reporting.report_builder import ReportBuilder
-from src.reporting.pdf_generator import PDFReportGenerator
-from src.reporting.excel_generator import ExcelReportGenerator
 
-# Export modules
-from src.exports.data_exporter import DataExporter
+logger = logging.getLogger(__name__)
 
-# Visualization modules
-from src.visualization.chart_generator import ChartGenerator
-from src.visualization.dashboard_generator import DashboardGenerator
+# Environment variable bounding the analysis stage thread pool
+ANALYSIS_THREADS_ENV = 'TCLRPD_ANALYSIS_THREADS'
 
+# Environment variable bounding the chart rendering process pool
+CHART_PROCESSES_ENV = 'TCLRPD_CHART_PROCESSES'
 
-logger = logging.getLogger(__name__)
+# Bump when run_full_analysis results change shape, so stale cached results
+# from an older version are not reused
+RESULTS_CACHE_VERSION = 3
+
+# Bytes hashed from each end of the input file for the results cache key
+CACHE_SAMPLE_BYTES = 1 << 20
+
+# Low-cardinality text columns grouped or counted by several stages;
+# converted to categoricals once after the data pipeline
+CATEGORICAL_COLUMNS = ('Contractor', 'Property', 'FM_Type')
+
+# Number of independent analysis stages run concurrently (equipment,
+# seasonal, vendor, failure)
+ANALYSIS_STAGE_COUNT = 4
+
+# Work order columns read by ReportBuilder's sections (through the
+# frequency, seasonal, vendor and failure pattern analyzers); results keep
+# only these in 'work_orders_df'
+REPORT_COLUMNS = (
+    'wo_no', 'Create_Date', 'Complete_Date', 'create_date_yyyymmdd', 'PO_AMOUNT',
+    'Contractor', 'Equipment_ID', 'EquipmentName', 'equipment_primary_category',
+    'Problem', 'Cause', 'Remedy', 'description',
+)
+
+
+def _pool_size(env_var: str, default: int, limit: int) -> int:
+    """
+    Size of a worker pool, optionally overridden by an environment variable.
+
+    Args:
+        env_var: Environment variable holding a positive integer override
+        default: Pool size when env_var is unset or invalid
+        limit: Upper bound on the pool size (the number of tasks)
+
+    Returns:
+        Number of workers, between 1 and limit
+    """
+    value = os.environ.get(env_var)
+    if value:
+        try:
+            workers = int(value)
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", env_var, value)
+        else:
+            if workers > 0:
+                return max(1, min(workers, limit))
+            logger.warning("Ignoring non-positive %s=%r", env_var, value)
+    return max(1, min(default, limit))
+
+
+def _analysis_workers() -> int:
+    """
+    Size of the analysis stage thread pool.
+
+    Reads ANALYSIS_THREADS_ENV when set to a positive integer, otherwise
+    uses one thread per stage. Setting it to 1 runs the stages serially.
+
+    Returns:
+        Number of worker threads
+    """
+    return _pool_size(ANALYSIS_THREADS_ENV, ANALYSIS_STAGE_COUNT, ANALYSIS_STAGE_COUNT)
+
+
+def _chart_mp_context():
+    """
+    Multiprocessing context for the chart rendering process pool.
+
+    Chart rendering may overlap with other output stages running on threads
+    (see PipelineOrchestrator.generate_outputs), and forking a multithreaded
+    process can copy locks held by those threads into the workers. Workers
+    are therefore started from a fork server where available, and with the
+    platform default (spawn) otherwise.
+
+    Returns:
+        multiprocessing context, or None for the platform default
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return None
+
+
+def _render_chart(method: str, *args, **kwargs) -> None:
+    """
+    Render one static chart with a fresh ChartGenerator.
+
+    Module-level so it can run in a worker process; only the method name and
+    its (picklable) arguments cross the process boundary.
+
+    Args:
+        method: ChartGenerator method name, e.g. 'create_vendor_performance_chart'
+        *args: Positional arguments for the method
+        **kwargs: Keyword arguments for the method
+    """
+    from src.visualization.chart_generator import ChartGenerator
+
+    getattr(ChartGenerator(dpi=300), method)(*args, **kwargs)
+
+
+def _render_dashboard(**kwargs) -> None:
+    """
+    Render the interactive dashboard with a fresh DashboardGenerator.
+
+    Args:
+        **kwargs: Keyword arguments for DashboardGenerator.create_dashboard
+    """
+    from src.visualization.dashboard_generator import DashboardGenerator
+
+    DashboardGenerator().create_dashboard(**kwargs)
 
 
 class PipelineOrchestrator:
@@ -55,28 +169,39 @@ class PipelineOrchestrator:
     Provides single entry point for batch processing workflows.
     """
 
-    def __init__(self, input_file: str, output_dir: str = 'output'):
+    def __init__(self, input_file: str, output_dir: str = 'output', use_cache: bool = False):
         """
         Initialize orchestrator with input file and output directory.
 
         Args:
             input_file: Path to input CSV/Excel file with work order data
             output_dir: Base directory for all outputs (default: 'output')
+            use_cache: Reuse run_full_analysis results cached under
+                output_dir/.cache for an unchanged input file. The cache key
+                covers the input file and RESULTS_CACHE_VERSION only, not the
+                analysis code, and entries are unpickled, so only enable it
+                for a trusted output_dir whose code is unchanged
+                (default: False)
         """
         self.input_file = input_file
         self.output_dir = Path(output_dir)
+        self.use_cache = use_cache
 
         # Create output directory structure
         self._create_output_directories()
 
-        logger.info(f"PipelineOrchestrator initialized")
-        logger.info(f"  Input: {input_file}")
-        logger.info(f"  Output: {output_dir}")
+        logger.info("PipelineOrchestrator initialized")
+        logger.info("  Input: %s", input_file)
+        logger.info("  Output: %s", output_dir)
 
     def _create_output_directories(self) -> None:
-        """Create output directory structure if it doesn't exist."""
+        """
+        Create output directory structure if it doesn't exist.
+
+        Only the subdirectories are listed; output_dir itself is created as
+        their parent.
+        """
         directories = [
-            self.output_dir,
             self.output_dir / 'reports',
             self.output_dir / 'exports',
             self.output_dir / 'visualizations'
@@ -84,7 +209,82 @@ class PipelineOrchestrator:
 
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {directory}")
+            logger.debug("Ensured directory exists: %s", directory)
+
+    def _cache_key(self) -> str:
+        """
+        Fingerprint the input file for the analysis results cache.
+
+        Combines the file's modification time and size with a SHA-1 of its
+        first and last CACHE_SAMPLE_BYTES and RESULTS_CACHE_VERSION, so
+        edits to the input and results format changes both miss the cache.
+
+        Returns:
+            Hex digest identifying the input file contents
+
+        Raises:
+            FileNotFoundError: If input file doesn't exist
+        """
+        stat = Path(self.input_file).stat()
+        digest = hashlib.sha1()
+        digest.update(f"{RESULTS_CACHE_VERSION}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        with open(self.input_file, 'rb') as f:
+            digest.update(f.read(CACHE_SAMPLE_BYTES))
+            if stat.st_size > CACHE_SAMPLE_BYTES:
+                f.seek(max(CACHE_SAMPLE_BYTES, stat.st_size - CACHE_SAMPLE_BYTES))
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def _load_cached_results(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Return cached analysis results, or None if missing or unreadable.
+
+        Reads the layout written by _save_cached_results: the buffer sizes,
+        the out-of-band buffers, then the pickle that references them. Each
+        buffer is read straight into a bytearray, which the unpickled arrays
+        use as their (writable) memory without another copy.
+        """
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                buffer_sizes = pickle.load(f)
+                buffers = []
+                for size in buffer_sizes:
+                    buffer = bytearray(size)
+                    if f.readinto(buffer) != size:
+                        raise EOFError("truncated results cache")
+                    buffers.append(buffer)
+                return pickle.load(f, buffers=buffers)
+        except Exception as e:
+            logger.warning("Ignoring unreadable results cache %s: %s", cache_path, e)
+            return None
+
+    def _save_cached_results(self, cache_path: Path, results: Dict[str, Any]) -> None:
+        """
+        Write analysis results to the cache; failures are only logged.
+
+        Pickles with protocol 5 and out-of-band buffers, so the NumPy arrays
+        behind the result DataFrames are written from their own memory
+        instead of being copied into the pickle stream. The buffers are
+        stored in the same file, ahead of the pickle, so the cache entry is
+        still replaced atomically.
+        """
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp.{os.getpid()}")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            buffers: List[pickle.PickleBuffer] = []
+            payload = pickle.dumps(results, protocol=5, buffer_callback=buffers.append)
+            raw_buffers = [buffer.raw() for buffer in buffers]
+            with open(tmp_path, 'wb') as f:
+                pickle.dump([raw.nbytes for raw in raw_buffers], f, protocol=5)
+                for raw in raw_buffers:
+                    f.write(raw)
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning("Could not write results cache %s: %s", cache_path, e)
+            tmp_path.unlink(missing_ok=True)
 
     def run_full_analysis(self) -> Dict[str, Any]:
         """
@@ -97,6 +297,11 @@ class PipelineOrchestrator:
         4. Vendor analysis (cost performance, efficiency, quality)
         5. Failure pattern analysis (text extraction, categorization)
 
+        When use_cache is set (off by default), results are cached in
+        output_dir/.cache keyed by the input file's fingerprint (see
+        _cache_key) and returned from there while the input file is
+        unchanged.
+
         Returns:
             Dictionary with analysis results:
             {
@@ -104,9 +309,12 @@ class PipelineOrchestrator:
                 'seasonal_dict': Dict with monthly/quarterly patterns,
                 'vendor_df': DataFrame with vendor metrics,
                 'patterns_list': List of failure patterns,
+                'patterns_df': The failure patterns as a DataFrame,
                 'quality_report': Dict with data quality metrics,
                 'thresholds': Dict with threshold recommendations,
-                'category_stats': DataFrame with category statistics
+                'category_stats': DataFrame with category statistics,
+                'work_orders_df': Cleaned and categorized work orders,
+                    projected to REPORT_COLUMNS
             }
 
         Raises:
@@ -119,30 +327,49 @@ class PipelineOrchestrator:
         logger.info("=" * 60)
 
         try:
+            cache_path = None
+            if self.use_cache:
+                cache_path = self.output_dir / '.cache' / f"{self._cache_key()}.pkl"
+                cached = self._load_cached_results(cache_path)
+                if cached is not None:
+                    logger.info("✓ Input unchanged - reusing cached analysis results: %s", cache_path)
+                    return cached
+
             # Stage 1: Data Pipeline
             logger.info("\n[Stage 1/5] Running data pipeline...")
             df, quality_report = run_pipeline(self.input_file)
-            logger.info(f"✓ Data pipeline complete: {len(df)} work orders processed")
-
-            # Stage 2: Equipment Analysis
-            logger.info("\n[Stage 2/5] Running equipment analysis...")
-            equipment_results = self._run_equipment_analysis(df)
-            logger.info(f"✓ Equipment analysis complete: {len(equipment_results['equipment_df'])} outliers identified")
-
-            # Stage 3: Seasonal Analysis
-            logger.info("\n[Stage 3/5] Running seasonal analysis...")
-            seasonal_results = self._run_seasonal_analysis(df)
-            logger.info(f"✓ Seasonal analysis complete: {seasonal_results.get('pattern_count', 0)} patterns detected")
-
-            # Stage 4: Vendor Analysis
-            logger.info("\n[Stage 4/5] Running vendor analysis...")
-            vendor_results = self._run_vendor_analysis(df)
-            logger.info(f"✓ Vendor analysis complete: {len(vendor_results['vendor_df'])} vendors analyzed")
-
-            # Stage 5: Failure Pattern Analysis
-            logger.info("\n[Stage 5/5] Running failure pattern analysis...")
-            failure_results = self._run_failure_analysis(df)
-            logger.info(f"✓ Failure analysis complete: {len(failure_results['patterns_list'])} patterns identified")
+            logger.info("✓ Data pipeline complete: %d work orders processed", len(df))
+            self._categorize_columns(df)
+
+            # Stages 2-5 only read df and return independent results, and
+            # spend most of their time in pandas C code, so run them on a
+            # thread pool and log their summaries in stage order afterwards
+            logger.info("\n[Stages 2-5/5] Running equipment, seasonal, vendor and failure analysis...")
+            if df.empty:
+                # Every stage returns its empty results straight away, so
+                # skip the thread pool
+                logger.warning("No work orders left after the data pipeline - analysis stages return empty results")
+                equipment_results = self._run_equipment_analysis(df)
+                seasonal_results = self._run_seasonal_analysis(df)
+                vendor_results = self._run_vendor_analysis(df)
+                failure_results = self._run_failure_analysis(df)
+            else:
+                no_equip_df, equip_only_df = self._split_no_equipment(df)
+                with ThreadPoolExecutor(max_workers=_analysis_workers()) as executor:
+                    equipment_future = executor.submit(self._run_equipment_analysis, df, no_equip_df)
+                    seasonal_future = executor.submit(self._run_seasonal_analysis, df)
+                    vendor_future = executor.submit(self._run_vendor_analysis, df, equip_only_df)
+                    failure_future = executor.submit(self._run_failure_analysis, df)
+
+                    equipment_results = equipment_future.result()
+                    seasonal_results = seasonal_future.result()
+                    vendor_results = vendor_future.result()
+                    failure_results = failure_future.result()
+
+            logger.info("✓ Equipment analysis complete: %d outliers identified", len(equipment_results['equipment_df']))
+            logger.info("✓ Seasonal analysis complete: %d patterns detected", seasonal_results.get('pattern_count', 0))
+            logger.info("✓ Vendor analysis complete: %d vendors analyzed", len(vendor_results['vendor_df']))
+            logger.info("✓ Failure analysis complete: %d patterns identified", len(failure_results['patterns_list']))
 
             # Consolidate results
             results = {
@@ -151,14 +378,19 @@ class PipelineOrchestrator:
                 'seasonal_dict': seasonal_results,
                 'vendor_df': vendor_results['vendor_df'],
                 'patterns_list': failure_results['patterns_list'],
+                'patterns_df': failure_results['patterns_df'],
                 'quality_report': quality_report,
                 'thresholds': equipment_results.get('thresholds', {}),
                 'category_stats': equipment_results.get('category_stats', pd.DataFrame()),
-                'no_equipment_summary': equipment_results.get('no_equipment_summary', {})
+                'no_equipment_summary': equipment_results.get('no_equipment_summary', {}),
+                'work_orders_df': self._project_columns(df, REPORT_COLUMNS)
             }
             if 'vendor_df_no_equipment' in vendor_results:
                 results['vendor_df_no_equipment'] = vendor_results['vendor_df_no_equipment']
 
+            if cache_path is not None:
+                self._save_cached_results(cache_path, results)
+
             logger.info("\n" + "=" * 60)
             logger.info("FULL ANALYSIS PIPELINE COMPLETE")
             logger.info("=" * 60)
@@ -178,7 +410,62 @@ class PipelineOrchestrator:
             logger.exception("Full traceback:")
             raise
 
-    def _run_equipment_analysis(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _categorize_columns(self, df: pd.DataFrame) -> None:
+        """
+        Convert CATEGORICAL_COLUMNS from object to category dtype in place.
+
+        Later groupbys, value counts and masks on these columns then work on
+        integer codes instead of hashing the strings again in every stage.
+
+        Args:
+            df: Work order DataFrame from the data pipeline
+        """
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns and df[col].dtype == object:
+                df[col] = df[col].astype('category')
+
+    @staticmethod
+    def _project_columns(df: pd.DataFrame, columns: Tuple[str, ...]) -> pd.DataFrame:
+        """
+        Select the given columns of df, skipping any it does not have.
+
+        Handing consumers only the columns they read lets the pipeline frame's
+        other columns be freed (and keeps them out of the results cache).
+
+        Args:
+            df: DataFrame to project
+            columns: Columns to keep, in order
+
+        Returns:
+            DataFrame with the columns of df that appear in columns
+        """
+        return df[[col for col in columns if col in df.columns]]
+
+    def _split_no_equipment(
+        self,
+        df: pd.DataFrame
+    ) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        """
+        Split work orders into 'No Equipment' and equipment rows in one mask pass.
+
+        Args:
+            df: Cleaned and categorized work order DataFrame
+
+        Returns:
+            Tuple of (no-equipment rows, equipment rows), or (None, None) if
+            df has no is_no_equipment column
+        """
+        if 'is_no_equipment' not in df.columns:
+            return None, None
+
+        no_equip_mask = df['is_no_equipment'].to_numpy(dtype=bool)
+        return df[no_equip_mask], df[~no_equip_mask]
+
+    def _run_equipment_analysis(
+        self,
+        df: pd.DataFrame,
+        no_equip_df: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """
         Run equipment frequency, outlier detection, and ranking.
 
@@ -188,19 +475,31 @@ class PipelineOrchestrator:
 
         Args:
             df: Cleaned and categorized work order DataFrame
+            no_equip_df: Optional 'No Equipment' rows of df, already split
+                out by _split_no_equipment
 
         Returns:
             Dict with equipment_df, thresholds, category_stats, and no_equipment_summary
         """
+        # Nothing to rank without work orders
+        if df.empty:
+            return {
+                'equipment_df': pd.DataFrame(),
+                'all_equipment_df': pd.DataFrame(),
+                'thresholds': {},
+                'category_stats': pd.DataFrame(),
+                'no_equipment_summary': {'count': 0, 'percentage': 0.0}
+            }
+
         # Separate no-equipment records for summary
-        no_equipment_summary = self._calculate_no_equipment_summary(df)
+        no_equipment_summary = self._calculate_no_equipment_summary(df, no_equip_df)
 
         # Calculate frequencies (excludes 'No Equipment' by default)
         freq_df = calculate_equipment_frequencies(df, exclude_no_equipment=True)
 
         # Rank ALL equipment by priority (for comprehensive view)
         all_equipment_df = rank_all_equipment(freq_df, exclude_no_equipment=True)
-        logger.info(f"Ranked {len(all_equipment_df)} equipment items by priority")
+        logger.info("Ranked %d equipment items by priority", len(all_equipment_df))
 
         # Detect outliers (excludes 'No Equipment' by default)
         outliers_df = detect_outliers(freq_df, exclude_no_equipment=True)
@@ -223,7 +522,11 @@ class PipelineOrchestrator:
             'no_equipment_summary': no_equipment_summary
         }
 
-    def _calculate_no_equipment_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_no_equipment_summary(
+        self,
+        df: pd.DataFrame,
+        no_equip_df: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """
         Calculate summary statistics for 'No Equipment' records.
 
@@ -232,6 +535,8 @@ class PipelineOrchestrator:
 
         Args:
             df: Full work order DataFrame
+            no_equip_df: Optional 'No Equipment' rows of df, already split
+                out by _split_no_equipment
 
         Returns:
             Dict with no-equipment summary statistics
@@ -240,36 +545,51 @@ class PipelineOrchestrator:
         if 'is_no_equipment' not in df.columns:
             return {'count': 0, 'percentage': 0.0}
 
-        no_equip_df = df[df['is_no_equipment']]
+        if no_equip_df is None:
+            no_equip_df, _ = self._split_no_equipment(df)
         total_count = len(df)
         no_equip_count = len(no_equip_df)
 
         if no_equip_count == 0:
             return {'count': 0, 'percentage': 0.0}
 
-        # Calculate summary statistics
+        # Calculate summary statistics; the mean reuses the sum (as
+        # Series.mean does internally) rather than summing the column twice
+        total_cost = 0
+        avg_cost = 0
+        if 'PO_AMOUNT' in no_equip_df.columns:
+            costs = no_equip_df['PO_AMOUNT']
+            total_cost = costs.sum()
+            cost_count = costs.count()
+            avg_cost = total_cost / cost_count if cost_count > 0 else np.nan
+
         summary = {
             'count': no_equip_count,
             'percentage': (no_equip_count / total_count * 100) if total_count > 0 else 0,
-            'total_cost': no_equip_df['PO_AMOUNT'].sum() if 'PO_AMOUNT' in no_equip_df.columns else 0,
-            'avg_cost': no_equip_df['PO_AMOUNT'].mean() if 'PO_AMOUNT' in no_equip_df.columns else 0,
+            'total_cost': total_cost,
+            'avg_cost': avg_cost,
         }
 
-        # Property distribution (top 10)
+        # Property distribution (top 10); nlargest on unsorted counts selects
+        # the top 10 without sorting every distinct value. Categorical
+        # columns also count categories absent from these rows, so zero
+        # counts are dropped
         if 'Property' in no_equip_df.columns:
-            property_counts = no_equip_df['Property'].value_counts().head(10)
-            summary['top_properties'] = property_counts.to_dict()
+            property_counts = no_equip_df['Property'].value_counts(sort=False).nlargest(10)
+            summary['top_properties'] = property_counts[property_counts > 0].to_dict()
 
         # Work type distribution
         if 'FM_Type' in no_equip_df.columns:
-            fm_type_counts = no_equip_df['FM_Type'].value_counts().head(10)
-            summary['work_types'] = fm_type_counts.to_dict()
-
-        logger.info(
-            f"No-equipment summary: {no_equip_count} records "
-            f"({summary['percentage']:.1f}%), "
-            f"total cost: ${summary['total_cost']:,.0f}"
-        )
+            fm_type_counts = no_equip_df['FM_Type'].value_counts(sort=False).nlargest(10)
+            summary['work_types'] = fm_type_counts[fm_type_counts > 0].to_dict()
+
+        if logger.isEnabledFor(logging.INFO):
+            # %-style has no thousands separator, so format the cost only
+            # when the record will actually be emitted
+            logger.info(
+                "No-equipment summary: %d records (%.1f%%), total cost: $%s",
+                no_equip_count, summary['percentage'], f"{summary['total_cost']:,.0f}"
+            )
 
         return summary
 
@@ -284,12 +604,21 @@ class PipelineOrchestrator:
             Dict with monthly_costs, quarterly_costs, monthly_costs_by_year,
             patterns, and pattern_count
         """
+        # Skip the analyzer entirely without work orders
+        if df.empty:
+            return {
+                'monthly_costs': pd.DataFrame(),
+                'quarterly_costs': pd.DataFrame(),
+                'monthly_costs_by_year': pd.DataFrame(),
+                'patterns': [],
+                'pattern_count': 0
+            }
+
         analyzer = SeasonalAnalyzer()
 
         try:
-            # Calculate monthly and quarterly costs
-            monthly_costs = analyzer.calculate_monthly_costs(df)
-            quarterly_costs = analyzer.calculate_quarterly_costs(df)
+            # Calculate monthly and quarterly costs from one monthly groupby
+            monthly_costs, quarterly_costs = analyzer.calculate_monthly_and_quarterly(df)
             monthly_costs_by_year = analyzer.calculate_monthly_costs_by_year(df)
 
             # Handle edge case: no data
@@ -318,7 +647,7 @@ class PipelineOrchestrator:
             }
 
         except Exception as e:
-            logger.warning(f"Seasonal analysis failed: {str(e)} - continuing with empty results")
+            logger.warning("Seasonal analysis failed: %s - continuing with empty results", e)
             return {
                 'monthly_costs': pd.DataFrame(),
                 'quarterly_costs': pd.DataFrame(),
@@ -327,17 +656,30 @@ class PipelineOrchestrator:
                 'pattern_count': 0
             }
 
-    def _run_vendor_analysis(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _run_vendor_analysis(
+        self,
+        df: pd.DataFrame,
+        equip_only_df: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """
         Run vendor cost, efficiency, and quality analysis.
 
         Args:
             df: Cleaned work order DataFrame
+            equip_only_df: Optional equipment (not 'No Equipment') rows of df,
+                already split out by _split_no_equipment
 
         Returns:
             Dict with vendor_df and recommendation count.
             Includes vendor_df_no_equipment when no-equipment rows can be excluded.
         """
+        # Skip the analyzer entirely without work orders or contractors
+        if df.empty or 'Contractor' not in df.columns:
+            return {
+                'vendor_df': pd.DataFrame(),
+                'recommendations': []
+            }
+
         analyzer = VendorAnalyzer(min_work_orders=3)
 
         try:
@@ -345,9 +687,12 @@ class PipelineOrchestrator:
             vendor_costs = analyzer.calculate_vendor_costs(df, include_unknown=False)
             vendor_costs_no_equipment = None
             if 'is_no_equipment' in df.columns:
-                df_vendor = df[~df['is_no_equipment']].copy()
+                if equip_only_df is None:
+                    _, equip_only_df = self._split_no_equipment(df)
+                # calculate_vendor_costs does not modify its input, so the
+                # filtered rows are passed without a defensive copy
                 vendor_costs_no_equipment = analyzer.calculate_vendor_costs(
-                    df_vendor,
+                    equip_only_df,
                     include_unknown=False
                 )
 
@@ -374,7 +719,7 @@ class PipelineOrchestrator:
             return results
 
         except Exception as e:
-            logger.warning(f"Vendor analysis failed: {str(e)} - continuing with empty results")
+            logger.warning("Vendor analysis failed: %s - continuing with empty results", e)
             return {
                 'vendor_df': pd.DataFrame(),
                 'recommendations': []
@@ -388,8 +733,18 @@ class PipelineOrchestrator:
             df: Cleaned work order DataFrame
 
         Returns:
-            Dict with patterns_list and category counts
+            Dict with patterns_list, the same patterns as patterns_df (so
+            consumers needing a DataFrame skip rebuilding it from the
+            records), and category counts
         """
+        # Skip the analyzer entirely without work orders
+        if df.empty:
+            return {
+                'patterns_list': [],
+                'patterns_df': pd.DataFrame(),
+                'categories': {}
+            }
+
         analyzer = FailurePatternAnalyzer()
 
         try:
@@ -404,24 +759,31 @@ class PipelineOrchestrator:
                 logger.warning("No text data available for failure pattern analysis")
                 return {
                     'patterns_list': [],
+                    'patterns_df': pd.DataFrame(),
                     'categories': {}
                 }
 
-            # Convert DataFrame to list of dicts for easier consumption
+            # Convert DataFrame to list of dicts for easier consumption, and
+            # keep the frame (positionally indexed, like one rebuilt from the
+            # records) for chart and report consumers
             if len(high_impact) > 0:
                 patterns_list = high_impact.to_dict('records')
+                patterns_df = high_impact.reset_index(drop=True)
             else:
                 patterns_list = []
+                patterns_df = pd.DataFrame()
 
             return {
                 'patterns_list': patterns_list,
+                'patterns_df': patterns_df,
                 'categories': categories
             }
 
         except Exception as e:
-            logger.warning(f"Failure pattern analysis failed: {str(e)} - continuing with empty results")
+            logger.warning("Failure pattern analysis failed: %s - continuing with empty results", e)
             return {
                 'patterns_list': [],
+                'patterns_df': pd.DataFrame(),
                 'categories': {}
             }
 
@@ -446,10 +808,18 @@ class PipelineOrchestrator:
         logger.info("GENERATING REPORTS")
         logger.info("=" * 60)
 
+        from src.reporting.report_builder import ReportBuilder
+        from src.reporting.pdf_generator import PDFReportGenerator
+        from src.reporting.excel_generator import ExcelReportGenerator
+
         try:
             # Build report using ReportBuilder
             logger.info("\n[1/3] Building consolidated report...")
-            builder = ReportBuilder(self.input_file)
+            # Reuse the analysis results rather than re-running the pipeline
+            if analysis_results:
+                builder = ReportBuilder.from_results(analysis_results, self.input_file)
+            else:
+                builder = ReportBuilder(self.input_file)
             report = builder.build_report()
             logger.info("✓ Report structure built")
 
@@ -458,14 +828,14 @@ class PipelineOrchestrator:
             pdf_path = self.output_dir / 'reports' / 'work_order_analysis.pdf'
             pdf_generator = PDFReportGenerator()
             pdf_generator.generate_pdf(report, str(pdf_path))
-            logger.info(f"✓ PDF report saved: {pdf_path}")
+            logger.info("✓ PDF report saved: %s", pdf_path)
 
             # Generate Excel
             logger.info("\n[3/3] Generating Excel report...")
             excel_path = self.output_dir / 'reports' / 'work_order_analysis.xlsx'
             excel_generator = ExcelReportGenerator()
             excel_generator.generate_excel(report, str(excel_path))
-            logger.info(f"✓ Excel report saved: {excel_path}")
+            logger.info("✓ Excel report saved: %s", excel_path)
 
             logger.info("\n" + "=" * 60)
             logger.info("REPORT GENERATION COMPLETE")
@@ -508,64 +878,31 @@ class PipelineOrchestrator:
         logger.info("EXPORTING DATA FILES")
         logger.info("=" * 60)
 
-        exporter = DataExporter()
-        csv_files = []
-        json_files = []
+        from src.exports.data_exporter import DataExporter
+
+        # CSVs are written with DataFrame.to_csv; only JSON goes through
+        # orjson when it is installed, the same way for all five exports
+        exporter = DataExporter(use_orjson=True)
 
         try:
-            # Export equipment rankings (outliers only)
-            logger.info("\n[1/5] Exporting equipment outliers...")
-            equipment_csv = self.output_dir / 'exports' / 'equipment_rankings.csv'
-            equipment_json = self.output_dir / 'exports' / 'equipment_rankings.json'
-            exporter.export_equipment_rankings(analysis_results['equipment_df'], equipment_csv)
-            exporter.export_equipment_rankings_json(analysis_results['equipment_df'], equipment_json)
-            csv_files.append(str(equipment_csv))
-            json_files.append(str(equipment_json))
-            logger.info(f"✓ Equipment outliers exported")
-
-            # Export all equipment rankings
-            logger.info("\n[2/5] Exporting all equipment rankings...")
-            all_equipment_csv = self.output_dir / 'exports' / 'all_equipment_rankings.csv'
-            all_equipment_json = self.output_dir / 'exports' / 'all_equipment_rankings.json'
-            exporter.export_equipment_rankings(analysis_results['all_equipment_df'], all_equipment_csv)
-            exporter.export_equipment_rankings_json(analysis_results['all_equipment_df'], all_equipment_json)
-            csv_files.append(str(all_equipment_csv))
-            json_files.append(str(all_equipment_json))
-            logger.info(f"✓ All equipment rankings exported")
-
-            # Export seasonal patterns
-            logger.info("\n[3/5] Exporting seasonal patterns...")
-            seasonal_csv = self.output_dir / 'exports' / 'seasonal_patterns.csv'
-            seasonal_json = self.output_dir / 'exports' / 'seasonal_patterns.json'
-            exporter.export_seasonal_patterns(analysis_results['seasonal_dict'], seasonal_csv)
-            exporter.export_seasonal_patterns_json(analysis_results['seasonal_dict'], seasonal_json)
-            csv_files.append(str(seasonal_csv))
-            json_files.append(str(seasonal_json))
-            logger.info(f"✓ Seasonal patterns exported")
-
-            # Export vendor metrics
-            logger.info("\n[4/5] Exporting vendor metrics...")
-            vendor_csv = self.output_dir / 'exports' / 'vendor_metrics.csv'
-            vendor_json = self.output_dir / 'exports' / 'vendor_metrics.json'
-            exporter.export_vendor_metrics(analysis_results['vendor_df'], vendor_csv)
-            exporter.export_vendor_metrics_json(analysis_results['vendor_df'], vendor_json)
-            csv_files.append(str(vendor_csv))
-            json_files.append(str(vendor_json))
-            logger.info(f"✓ Vendor metrics exported")
-
-            # Export failure patterns
-            logger.info("\n[5/5] Exporting failure patterns...")
-            failure_csv = self.output_dir / 'exports' / 'failure_patterns.csv'
-            failure_json = self.output_dir / 'exports' / 'failure_patterns.json'
-            exporter.export_failure_patterns(analysis_results['patterns_list'], failure_csv)
-            exporter.export_failure_patterns_json(analysis_results['patterns_list'], failure_json)
-            csv_files.append(str(failure_csv))
-            json_files.append(str(failure_json))
-            logger.info(f"✓ Failure patterns exported")
+            # The five exports are independent, so DataExporter writes them
+            # (CSV + JSON each) concurrently
+            logger.info("\nExporting equipment outliers, all equipment rankings, "
+                        "seasonal patterns, vendor metrics and failure patterns...")
+            exported = exporter.export_all({
+                'equipment_rankings': ('equipment_rankings', analysis_results['equipment_df']),
+                'all_equipment_rankings': ('equipment_rankings', analysis_results['all_equipment_df']),
+                'seasonal_patterns': ('seasonal_patterns', analysis_results['seasonal_dict']),
+                'vendor_metrics': ('vendor_metrics', analysis_results['vendor_df']),
+                'failure_patterns': ('failure_patterns', analysis_results['patterns_list']),
+            }, self.output_dir / 'exports')
+            csv_files = exported['csv']
+            json_files = exported['json']
 
             logger.info("\n" + "=" * 60)
             logger.info("DATA EXPORT COMPLETE")
-            logger.info(f"Total files: {len(csv_files) + len(json_files)} ({len(csv_files)} CSV + {len(json_files)} JSON)")
+            logger.info("Total files: %d (%d CSV + %d JSON)",
+                        len(csv_files) + len(json_files), len(csv_files), len(json_files))
             logger.info("=" * 60)
 
             return {
@@ -605,80 +942,9 @@ class PipelineOrchestrator:
         logger.info("GENERATING VISUALIZATIONS")
         logger.info("=" * 60)
 
-        chart_files = []
-
         try:
-            # Initialize generators
-            chart_gen = ChartGenerator(dpi=300)
-            dashboard_gen = DashboardGenerator()
-
-            # Generate static charts
-            logger.info("\n[1/9] Generating equipment outliers chart...")
-            equipment_chart = self.output_dir / 'visualizations' / 'equipment_ranking.png'
-            chart_gen.create_equipment_ranking_chart(
-                analysis_results['equipment_df'],
-                equipment_chart,
-                top_n=5,
-                format='png'
-            )
-            chart_files.append(str(equipment_chart))
-            logger.info(f"✓ Equipment outliers chart saved: {equipment_chart}")
-
-            logger.info("\n[2/9] Generating all equipment ranking chart...")
-            all_equipment_chart = self.output_dir / 'visualizations' / 'all_equipment_ranking.png'
-            chart_gen.create_equipment_ranking_chart(
-                analysis_results['all_equipment_df'],
-                all_equipment_chart,
-                top_n=10,
-                format='png'
-            )
-            chart_files.append(str(all_equipment_chart))
-            logger.info(f"✓ All equipment chart saved: {all_equipment_chart}")
-
-            logger.info("\n[3/9] Generating seasonal trend chart...")
-            seasonal_chart = self.output_dir / 'visualizations' / 'seasonal_costs.png'
-            seasonal_data = {
-                'monthly': analysis_results['seasonal_dict'].get('monthly_costs', pd.DataFrame())
-            }
-            chart_gen.create_seasonal_trend_chart(
-                seasonal_data,
-                seasonal_chart,
-                format='png'
-            )
-            chart_files.append(str(seasonal_chart))
-            logger.info(f"✓ Seasonal chart saved: {seasonal_chart}")
-
-            logger.info("\n[4/9] Generating year-over-year total cost chart...")
+            visualizations_dir = self.output_dir / 'visualizations'
             seasonal_by_year = analysis_results['seasonal_dict'].get('monthly_costs_by_year', pd.DataFrame())
-            yoy_cost_chart = self.output_dir / 'visualizations' / 'seasonal_costs_2024_vs_2025.png'
-            chart_gen.create_year_over_year_comparison_chart(
-                seasonal_by_year,
-                yoy_cost_chart,
-                metric='total_cost',
-                year_a=2024,
-                year_b=2025,
-                months=[1, 2, 3, 4, 5],
-                format='png'
-            )
-            chart_files.append(str(yoy_cost_chart))
-            logger.info(f"Year-over-year total cost chart saved: {yoy_cost_chart}")
-
-            logger.info("\n[5/9] Generating year-over-year work order count chart...")
-            yoy_count_chart = self.output_dir / 'visualizations' / 'seasonal_work_orders_2024_vs_2025.png'
-            chart_gen.create_year_over_year_comparison_chart(
-                seasonal_by_year,
-                yoy_count_chart,
-                metric='work_order_count',
-                year_a=2024,
-                year_b=2025,
-                months=[1, 2, 3, 4, 5],
-                format='png'
-            )
-            chart_files.append(str(yoy_count_chart))
-            logger.info(f"Year-over-year work order count chart saved: {yoy_count_chart}")
-
-            logger.info("\n[6/9] Generating vendor performance chart...")
-            vendor_chart = self.output_dir / 'visualizations' / 'vendor_costs.png'
             vendor_df_for_chart = analysis_results.get(
                 'vendor_df_no_equipment',
                 analysis_results['vendor_df']
@@ -686,58 +952,116 @@ class PipelineOrchestrator:
             vendor_title_note = None
             if 'vendor_df_no_equipment' in analysis_results:
                 vendor_title_note = 'No Equipment excluded'
-            chart_gen.create_vendor_performance_chart(
-                vendor_df_for_chart,
-                vendor_chart,
-                top_n=10,
-                format='png',
-                title_note=vendor_title_note
-            )
-            chart_files.append(str(vendor_chart))
-            logger.info(f"✓ Vendor chart saved: {vendor_chart}")
-
-            logger.info("\n[7/9] Generating vendor scaled cost chart...")
-            vendor_scaled_chart = self.output_dir / 'visualizations' / 'vendor_costs_scaled.png'
-            chart_gen.create_vendor_costs_scaled_chart(
-                analysis_results['vendor_df'],
-                vendor_scaled_chart,
-                top_n=10,
-                format='png'
-            )
-            chart_files.append(str(vendor_scaled_chart))
-            logger.info(f"Vendor scaled chart saved: {vendor_scaled_chart}")
-
-            logger.info("\n[8/9] Generating failure pattern chart...")
-            failure_chart = self.output_dir / 'visualizations' / 'failure_patterns.png'
-            # Convert patterns list to DataFrame if needed
-            if analysis_results['patterns_list']:
-                patterns_df = pd.DataFrame(analysis_results['patterns_list'])
+            # Use the patterns DataFrame from the analysis, converting the
+            # patterns list only if it is missing
+            patterns_df = analysis_results.get('patterns_df')
+            if patterns_df is None:
+                if analysis_results['patterns_list']:
+                    patterns_df = pd.DataFrame(analysis_results['patterns_list'])
+                else:
+                    patterns_df = pd.DataFrame()
+
+            # (description, output path, ChartGenerator method, args, kwargs)
+            chart_tasks = [
+                (
+                    'Equipment outliers chart',
+                    visualizations_dir / 'equipment_ranking.png',
+                    'create_equipment_ranking_chart',
+                    (analysis_results['equipment_df'],),
+                    {'top_n': 5, 'format': 'png'}
+                ),
+                (
+                    'All equipment chart',
+                    visualizations_dir / 'all_equipment_ranking.png',
+                    'create_equipment_ranking_chart',
+                    (analysis_results['all_equipment_df'],),
+                    {'top_n': 10, 'format': 'png'}
+                ),
+                (
+                    'Seasonal chart',
+                    visualizations_dir / 'seasonal_costs.png',
+                    'create_seasonal_trend_chart',
+                    ({'monthly': analysis_results['seasonal_dict'].get('monthly_costs', pd.DataFrame())},),
+                    {'format': 'png'}
+                ),
+                (
+                    'Year-over-year total cost chart',
+                    visualizations_dir / 'seasonal_costs_2024_vs_2025.png',
+                    'create_year_over_year_comparison_chart',
+                    (seasonal_by_year,),
+                    {'metric': 'total_cost', 'year_a': 2024, 'year_b': 2025,
+                     'months': [1, 2, 3, 4, 5], 'format': 'png'}
+                ),
+                (
+                    'Year-over-year work order count chart',
+                    visualizations_dir / 'seasonal_work_orders_2024_vs_2025.png',
+                    'create_year_over_year_comparison_chart',
+                    (seasonal_by_year,),
+                    {'metric': 'work_order_count', 'year_a': 2024, 'year_b': 2025,
+                     'months': [1, 2, 3, 4, 5], 'format': 'png'}
+                ),
+                (
+                    'Vendor chart',
+                    visualizations_dir / 'vendor_costs.png',
+                    'create_vendor_performance_chart',
+                    (vendor_df_for_chart,),
+                    {'top_n': 10, 'format': 'png', 'title_note': vendor_title_note}
+                ),
+                (
+                    'Vendor scaled chart',
+                    visualizations_dir / 'vendor_costs_scaled.png',
+                    'create_vendor_costs_scaled_chart',
+                    (analysis_results['vendor_df'],),
+                    {'top_n': 10, 'format': 'png'}
+                ),
+                (
+                    'Failure patterns chart',
+                    visualizations_dir / 'failure_patterns.png',
+                    'create_failure_pattern_chart',
+                    (patterns_df,),
+                    {'top_n': 10, 'format': 'png'}
+                ),
+            ]
+
+            dashboard_path = visualizations_dir / 'dashboard.html'
+            dashboard_kwargs = {
+                'equipment_df': analysis_results['equipment_df'],
+                'seasonal_dict': analysis_results['seasonal_dict'],
+                'vendor_df': analysis_results['vendor_df'],
+                'patterns_list': analysis_results['patterns_list'],
+                'output_path': dashboard_path
+            }
+
+            # Matplotlib rendering is CPU-bound and holds the GIL, so charts
+            # and the dashboard render in separate processes when more than
+            # one CPU is available
+            task_count = len(chart_tasks) + 1
+            workers = _pool_size(CHART_PROCESSES_ENV, os.cpu_count() or 1, task_count)
+            logger.info("\nRendering %d charts and the dashboard (%d process(es))...", len(chart_tasks), workers)
+
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_chart_mp_context()) as executor:
+                    futures = {
+                        executor.submit(_render_chart, method, *args, path, **kwargs): (description, path)
+                        for description, path, method, args, kwargs in chart_tasks
+                    }
+                    futures[executor.submit(_render_dashboard, **dashboard_kwargs)] = ('Dashboard', dashboard_path)
+                    for future in as_completed(futures):
+                        future.result()
+                        description, path = futures[future]
+                        logger.info("✓ %s saved: %s", description, path)
             else:
-                patterns_df = pd.DataFrame()
-            chart_gen.create_failure_pattern_chart(
-                patterns_df,
-                failure_chart,
-                top_n=10,
-                format='png'
-            )
-            chart_files.append(str(failure_chart))
-            logger.info(f"✓ Failure patterns chart saved: {failure_chart}")
-
-            # Generate interactive dashboard
-            logger.info("\n[9/9] Generating interactive dashboard...")
-            dashboard_path = self.output_dir / 'visualizations' / 'dashboard.html'
-            dashboard_gen.create_dashboard(
-                equipment_df=analysis_results['equipment_df'],
-                seasonal_dict=analysis_results['seasonal_dict'],
-                vendor_df=analysis_results['vendor_df'],
-                patterns_list=analysis_results['patterns_list'],
-                output_path=dashboard_path
-            )
-            logger.info(f"✓ Dashboard saved: {dashboard_path}")
+                for description, path, method, args, kwargs in chart_tasks:
+                    _render_chart(method, *args, path, **kwargs)
+                    logger.info("✓ %s saved: %s", description, path)
+                _render_dashboard(**dashboard_kwargs)
+                logger.info("✓ Dashboard saved: %s", dashboard_path)
+
+            chart_files = [str(path) for _, path, _, _, _ in chart_tasks]
 
             logger.info("\n" + "=" * 60)
             logger.info("VISUALIZATION GENERATION COMPLETE")
-            logger.info(f"Charts: {len(chart_files)}, Dashboard: 1")
+            logger.info("Charts: %d, Dashboard: 1", len(chart_files))
             logger.info("=" * 60)
 
             return {
@@ -749,3 +1073,58 @@ class PipelineOrchestrator:
             logger.error(f"[ERROR] Visualization generation failed: {str(e)}")
             logger.exception("Full traceback:")
             raise
+
+    def generate_outputs(
+        self,
+        analysis_results: Dict[str, Any],
+        reports: bool = True,
+        exports: bool = True,
+        visualizations: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Generate reports, data exports and visualizations concurrently.
+
+        The three output stages only read analysis_results, so the selected
+        stages run on a thread pool and overlap instead of running one after
+        another. Chart rendering itself runs on a process pool (see
+        generate_visualizations).
+
+        Args:
+            analysis_results: Dict returned from run_full_analysis()
+            reports: Generate PDF and Excel reports (default: True)
+            exports: Export CSV and JSON data files (default: True)
+            visualizations: Generate charts and dashboard (default: True)
+
+        Returns:
+            Dict with the return value of each stage, or None if not selected:
+            {
+                'reports': generate_reports() result,
+                'exports': export_data() result,
+                'visualizations': generate_visualizations() result
+            }
+
+        Raises:
+            Exception: Re-raises the first failed stage, in the order above,
+                after all selected stages have finished
+        """
+        stages = {
+            'reports': self.generate_reports if reports else None,
+            'exports': self.export_data if exports else None,
+            'visualizations': self.generate_visualizations if visualizations else None,
+        }
+        selected = {name: stage for name, stage in stages.items() if stage is not None}
+
+        outputs = {name: None for name in stages}
+        if not selected:
+            return outputs
+
+        with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+            futures = {
+                name: executor.submit(stage, analysis_results)
+                for name, stage in selected.items()
+            }
+
+        for name, future in futures.items():
+            outputs[name] = future.result()
+
+        return outputs
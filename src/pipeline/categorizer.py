@@ -9,8 +9,11 @@ cross-category comparisons.
 import logging
 from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .data_cleaner import strip_title
+
 
 # Configure logging
 logging.basicConfig(
@@ -19,6 +22,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Inner edges of the consistency distribution bins logged by
+# assign_equipment_types
+CONSISTENCY_BIN_EDGES = np.array([50, 80, 90])
+
+
+def _group_percentage(codes: np.ndarray, n_groups: int, flags: pd.Series) -> np.ndarray:
+    """
+    Percentage of True flags within each group of factorized codes.
+
+    Group sizes and True counts come from two np.bincount passes over the
+    codes, instead of a hashed groupby. Rows with code -1 (missing key)
+    belong to no group.
+
+    Args:
+        codes: Group codes from pd.factorize, -1 for a missing key
+        n_groups: Number of groups (length of the factorized uniques)
+        flags: Boolean Series aligned with codes
+
+    Returns:
+        Float array (0-100) with one value per group
+    """
+    found = codes >= 0
+    counts = np.bincount(codes[found], minlength=n_groups)
+    hits = np.bincount(
+        codes[found], weights=flags.to_numpy(dtype=bool)[found], minlength=n_groups
+    )
+    return hits / counts * 100
+
+
+def _broadcast_to_rows(group_values: np.ndarray, codes: np.ndarray,
+                       fill_value=np.nan) -> np.ndarray:
+    """
+    Gather per-group values back onto rows by their factorized codes.
+
+    Args:
+        group_values: One value per group, indexed by code
+        codes: Group code of each row, -1 for a missing key
+        fill_value: Value for rows with code -1 (default NaN)
+
+    Returns:
+        Array with one value per row
+    """
+    result = np.full(len(codes), fill_value, dtype=group_values.dtype)
+    found = codes >= 0
+    result[found] = group_values[codes[found]]
+    return result
+
 
 def normalize_categories(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -48,44 +98,43 @@ def normalize_categories(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Starting category normalization")
 
-    # Initialize category columns
-    df['equipment_category'] = None
-    df['equipment_subcategory'] = None
-
-    # Step 1: Handle "No Equipment" records first (if flag exists from data_cleaner)
+    # Step 1: "No Equipment" records (if flag exists from data_cleaner) take
+    # their fixed categories ahead of any classification field
     if 'is_no_equipment' in df.columns:
-        no_equip_mask = df['is_no_equipment']
+        no_equip_mask = df['is_no_equipment'].to_numpy(dtype=bool)
         no_equip_count = no_equip_mask.sum()
         if no_equip_count > 0:
-            df.loc[no_equip_mask, 'equipment_category'] = 'No Equipment'
-            df.loc[no_equip_mask, 'equipment_subcategory'] = 'Interior/General'
             logger.info(
                 f"Assigned {no_equip_count} records to 'No Equipment' category "
                 f"(interior fixes, general maintenance)"
             )
+    else:
+        no_equip_mask = np.zeros(len(df), dtype=bool)
+
+    # Step 2: For remaining records, use priority fallback. Each column is
+    # picked in one np.select over the null masks, in priority order, rather
+    # than through chained fillna calls on .loc slices.
+    service_lv2 = df['service_type_lv2'].to_numpy(dtype=object)
+    service_lv3 = df['service_type_lv3'].to_numpy(dtype=object)
+    fm_type = df['FM_Type'].to_numpy(dtype=object)
+    has_lv2 = pd.notna(service_lv2)
+
+    df['equipment_category'] = np.select(
+        [no_equip_mask, has_lv2, pd.notna(fm_type)],
+        ['No Equipment', service_lv2, fm_type],
+        default='Uncategorized'
+    )
 
-    # Step 2: For remaining records, use priority fallback
-    # Get mask for records that still need categorization
-    needs_category_mask = df['equipment_category'].isna()
-
-    if needs_category_mask.any():
-        # Create equipment_category with priority fallback
-        df.loc[needs_category_mask, 'equipment_category'] = (
-            df.loc[needs_category_mask, 'service_type_lv2'].fillna(
-                df.loc[needs_category_mask, 'FM_Type']
-            ).fillna('Uncategorized')
-        )
-
-        # Create equipment_subcategory from most granular level
-        df.loc[needs_category_mask, 'equipment_subcategory'] = (
-            df.loc[needs_category_mask, 'service_type_lv3'].fillna(
-                df.loc[needs_category_mask, 'service_type_lv2']
-            ).fillna('General')
-        )
+    # Create equipment_subcategory from most granular level
+    df['equipment_subcategory'] = np.select(
+        [no_equip_mask, pd.notna(service_lv3), has_lv2],
+        ['Interior/General', service_lv3, service_lv2],
+        default='General'
+    )
 
     # Standardize text: strip whitespace and title case
-    df['equipment_category'] = df['equipment_category'].str.strip().str.title()
-    df['equipment_subcategory'] = df['equipment_subcategory'].str.strip().str.title()
+    df['equipment_category'] = strip_title(df['equipment_category'])
+    df['equipment_subcategory'] = strip_title(df['equipment_subcategory'])
 
     # Count category assignments
     uncategorized_count = (df['equipment_category'] == 'Uncategorized').sum()
@@ -108,6 +157,10 @@ def create_category_hierarchy(df: pd.DataFrame) -> pd.DataFrame:
 
     This helps identify which categories have sufficient data for statistical analysis.
 
+    Groups with observed=True and sort=False, so equipment_category may be
+    passed as category dtype: the aggregation then works on its integer codes
+    and unused categories do not appear in the result.
+
     Args:
         df: DataFrame with normalized equipment_category field
 
@@ -124,13 +177,13 @@ def create_category_hierarchy(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Creating category hierarchy")
 
-    hierarchy = df.groupby('equipment_category').agg(
+    hierarchy = df.groupby('equipment_category', observed=True, sort=False).agg(
         equipment_count=('Equipment_ID', 'nunique'),
         work_order_count=('Equipment_ID', 'count')
     ).reset_index()
 
     hierarchy.columns = ['category', 'equipment_count', 'work_order_count']
-    hierarchy = hierarchy.sort_values('work_order_count', ascending=False)
+    hierarchy = hierarchy.sort_values(['work_order_count', 'category'], ascending=[False, True])
 
     logger.info(
         f"Category hierarchy created: {len(hierarchy)} categories, "
@@ -147,10 +200,15 @@ def assign_equipment_types(df: pd.DataFrame) -> pd.DataFrame:
     Some equipment may appear in multiple categories if miscategorized over time.
     This function:
     1. Identifies the mode (most frequent) category for each equipment
-    2. Adds equipment_primary_category column to original df
+    2. Adds equipment_primary_category column to df (in place)
     3. Calculates equipment_category_consistency score (% of work orders in primary)
     4. Identifies potentially miscategorized equipment (consistency < 80%)
 
+    Equipment_ID is factorized to integer codes once and every per-equipment
+    step works on those codes. The mode count groups with observed=True and
+    sort=False, so equipment_category may be category dtype without grouping
+    over unused categories.
+
     Args:
         df: DataFrame with Equipment_ID and equipment_category fields
 
@@ -166,50 +224,64 @@ def assign_equipment_types(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Assigning equipment primary categories")
 
-    # Find mode category for each equipment
-    equipment_primary = df.groupby('Equipment_ID')['equipment_category'].agg(
-        lambda x: x.mode()[0] if not x.mode().empty else x.iloc[0]
-    ).reset_index()
-    equipment_primary.columns = ['Equipment_ID', 'equipment_primary_category']
-
-    # Merge primary category back to original df
-    df = df.merge(equipment_primary, on='Equipment_ID', how='left')
-
-    # Calculate consistency score
-    df['is_primary_category'] = (
-        df['equipment_category'] == df['equipment_primary_category']
+    # Factorize Equipment_ID once; the mode count, the consistency score and
+    # the broadcasts back onto rows all work on these integer codes instead
+    # of hashing the ID strings again at every step
+    equipment_codes, equipment_ids = pd.factorize(df['Equipment_ID'], sort=False)
+    has_equipment_id = equipment_codes >= 0
+
+    # Find mode category for each equipment: count each (equipment, category)
+    # pair in one grouped size, then keep the most frequent category per
+    # equipment (ties go to the alphabetically first, as with Series.mode).
+    # Each pair also remembers one row holding it, so the primary category
+    # can be taken from equipment_category itself and keeps its dtype.
+    pairs = pd.DataFrame({
+        'code': equipment_codes[has_equipment_id],
+        'equipment_category': df['equipment_category'].array[has_equipment_id],
+        'row': np.flatnonzero(has_equipment_id),
+    })
+    category_counts = pairs.groupby(
+        ['code', 'equipment_category'], sort=False, observed=True
+    )['row'].agg(['size', 'first']).reset_index()
+    primary = category_counts.sort_values(
+        ['size', 'equipment_category'], ascending=[False, True]
+    ).drop_duplicates('code')
+    primary_row = np.full(len(equipment_ids), -1, dtype=np.intp)
+    primary_row[primary['code'].to_numpy()] = primary['first'].to_numpy()
+
+    # Broadcast primary category and consistency back to every work order by
+    # code, rather than merging (and copying) the whole frame
+    df['equipment_primary_category'] = df['equipment_category'].array.take(
+        _broadcast_to_rows(primary_row, equipment_codes, fill_value=-1), allow_fill=True
     )
 
-    consistency = df.groupby('Equipment_ID')['is_primary_category'].agg(
-        lambda x: (x.sum() / len(x) * 100) if len(x) > 0 else 100
-    ).reset_index()
-    consistency.columns = ['Equipment_ID', 'equipment_category_consistency']
-
-    # Merge consistency back to df
-    df = df.merge(consistency, on='Equipment_ID', how='left')
-
-    # Drop temporary column
-    df = df.drop('is_primary_category', axis=1)
+    # Calculate consistency score
+    is_primary_category = df['equipment_category'] == df['equipment_primary_category']
+    consistency = _group_percentage(equipment_codes, len(equipment_ids), is_primary_category)
+    df['equipment_category_consistency'] = _broadcast_to_rows(consistency, equipment_codes)
 
     # Count equipment by consistency threshold
-    low_consistency_equipment = df[
-        df['equipment_category_consistency'] < 80
-    ]['Equipment_ID'].nunique()
+    low_consistency_equipment = (consistency < 80).sum()
 
     logger.info(
         f"Equipment type assignment complete: "
-        f"{df['Equipment_ID'].nunique()} unique equipment, "
+        f"{len(equipment_ids)} unique equipment, "
         f"{low_consistency_equipment} with consistency < 80% (potentially miscategorized)"
     )
 
-    # Log consistency distribution
-    consistency_ranges = pd.cut(
-        df['equipment_category_consistency'],
-        bins=[0, 50, 80, 90, 100],
-        labels=['<50%', '50-80%', '80-90%', '90-100%']
+    # Log consistency distribution over the right-closed bins (0, 50],
+    # (50, 80], (80, 90], (90, 100], counting bin positions directly rather
+    # than building a Categorical for every row just for a log line
+    consistency_values = df['equipment_category_consistency'].to_numpy()
+    in_range = (consistency_values > 0) & (consistency_values <= 100)
+    bin_counts = np.bincount(
+        np.searchsorted(CONSISTENCY_BIN_EDGES, consistency_values[in_range], side='left'),
+        minlength=len(CONSISTENCY_BIN_EDGES) + 1
+    )
+    logger.info(
+        f"Consistency distribution: <50%={bin_counts[0]}, 50-80%={bin_counts[1]}, "
+        f"80-90%={bin_counts[2]}, 90-100%={bin_counts[3]}"
     )
-    consistency_dist = consistency_ranges.value_counts().sort_index()
-    logger.info(f"Consistency distribution:\n{consistency_dist}")
 
     return df
 
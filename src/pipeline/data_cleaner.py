@@ -20,6 +20,56 @@ import pandas as pd
 # Includes both Traditional (無設備) and Simplified (无设备) Chinese
 NO_EQUIPMENT_MARKERS = ['無設備', '无设备', 'no device', 'no equipment']
 
+# float32 resolves amounts below 2**15 to better than half a cent, so sums of
+# downcast PO_AMOUNT values stay exact to the cent while totals stay below it
+FLOAT32_CENT_SAFE_TOTAL = 2.0 ** 15
+
+
+def strip_title(values: pd.Series) -> pd.Series:
+    """
+    Strip whitespace and title-case text values, as .str.strip().str.title().
+
+    Equipment names and categories repeat across many work orders, so each
+    distinct value is cleaned once (in a single strip + title step) and
+    broadcast back by factorized codes. Missing values are kept as they are;
+    other non-string values become NaN, like the .str accessor does.
+
+    Args:
+        values: Object Series of name or category text
+
+    Returns:
+        Series of cleaned values with the same index and name
+    """
+    codes, uniques = pd.factorize(values)
+    cleaned = np.array(
+        [value.strip().title() if isinstance(value, str) else np.nan for value in uniques],
+        dtype=object
+    )
+    result = values.to_numpy(dtype=object, copy=True)
+    found = codes >= 0
+    result[found] = cleaned[codes[found]]
+    return pd.Series(result, index=values.index, name=values.name)
+
+
+def _replace_where(values: pd.Series, mask: np.ndarray, replacement) -> pd.Series:
+    """
+    Return a copy of values as objects, with replacement written where mask is True.
+
+    Used instead of df.loc[mask, col] = replacement, which on a shallow copy
+    of a DataFrame would write into the caller's column.
+
+    Args:
+        values: Column to copy
+        mask: Boolean array aligned with values
+        replacement: Scalar or array with one value per True in mask
+
+    Returns:
+        Object Series with the same index and name
+    """
+    result = values.to_numpy(dtype=object, copy=True)
+    result[mask] = replacement
+    return pd.Series(result, index=values.index, name=values.name)
+
 
 def is_no_equipment(value) -> bool:
     """
@@ -39,6 +89,29 @@ def is_no_equipment(value) -> bool:
     return str_value.lower() in NO_EQUIPMENT_MARKERS
 
 
+def _synthetic_equipment_ids(names: pd.Series) -> np.ndarray:
+    """
+    Build synthetic Equipment_IDs from equipment names.
+
+    Each ID is the first 12 hex digits of the MD5 of the name, so the same
+    name always gets the same ID across runs. Names repeat across work
+    orders, so each distinct name is hashed once and the IDs are broadcast
+    back by factorized codes.
+
+    Args:
+        names: Non-null EquipmentName values
+
+    Returns:
+        Object array of IDs aligned with names
+    """
+    codes, unique_names = pd.factorize(names)
+    unique_ids = np.array(
+        [hashlib.md5(str(name).encode()).hexdigest()[:12] for name in unique_names],
+        dtype=object
+    )
+    return unique_ids[codes]
+
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -72,6 +145,9 @@ def clean_equipment_data(df: pd.DataFrame) -> pd.DataFrame:
         - Consistent equipment identifiers
     """
     initial_count = len(df)
+    # Shallow copy: columns are only ever replaced below, never written in
+    # place, so the caller's frame is left untouched without copying its data
+    df = df.copy(deep=False)
 
     # Step 1: Detect "no equipment" records BEFORE any filtering
     df['is_no_equipment'] = df['EquipmentName'].apply(is_no_equipment)
@@ -83,41 +159,41 @@ def clean_equipment_data(df: pd.DataFrame) -> pd.DataFrame:
 
     # Step 2: Standardize no-equipment records
     # Set consistent EquipmentName and create synthetic ID
-    no_equip_mask = df['is_no_equipment']
+    no_equip_mask = df['is_no_equipment'].to_numpy()
     if no_equip_mask.any():
-        # Convert Equipment_ID to object type to allow string assignment
-        df['Equipment_ID'] = df['Equipment_ID'].astype('object')
-        # Use a fixed synthetic ID for all no-equipment records
-        df.loc[no_equip_mask, 'Equipment_ID'] = 'NO_EQUIPMENT'
-        df.loc[no_equip_mask, 'EquipmentName'] = 'No Equipment'
+        # Use a fixed synthetic ID for all no-equipment records (as object
+        # columns, to allow string assignment)
+        df['Equipment_ID'] = _replace_where(df['Equipment_ID'], no_equip_mask, 'NO_EQUIPMENT')
+        df['EquipmentName'] = _replace_where(df['EquipmentName'], no_equip_mask, 'No Equipment')
+
+    # Null masks for both identifier columns, computed once and reused by
+    # steps 3-5. No-equipment records already have both fields set by step 2,
+    # so none of these masks can select them. Step 4 only fills names on rows
+    # that have an ID, which leaves the step 5 mask unchanged.
+    id_missing = df['Equipment_ID'].isna().to_numpy()
+    name_missing = df['EquipmentName'].isna().to_numpy()
 
     # Step 3: Drop rows where both Equipment_ID and EquipmentName are null
-    # BUT only for records NOT flagged as no-equipment (those are already handled)
-    drop_mask = (
-        df['Equipment_ID'].isna() &
-        df['EquipmentName'].isna() &
-        ~df['is_no_equipment']
-    )
-    df = df[~drop_mask]
+    drop_mask = id_missing & name_missing
     dropped_count = drop_mask.sum()
 
     if dropped_count > 0:
+        # Filtering copies every column, so only do it when rows go
+        keep_mask = ~drop_mask
+        df = df[keep_mask]
+        id_missing = id_missing[keep_mask]
+        name_missing = name_missing[keep_mask]
         logger.warning(
             f"Dropped {dropped_count} rows with no equipment identifier "
             f"(both Equipment_ID and EquipmentName null)"
         )
 
     # Step 4: For rows with Equipment_ID but missing EquipmentName
-    mask_id_no_name = (
-        df['Equipment_ID'].notna() &
-        df['EquipmentName'].isna() &
-        ~df['is_no_equipment']
-    )
+    mask_id_no_name = ~id_missing & name_missing
     if mask_id_no_name.any():
-        df.loc[mask_id_no_name, 'EquipmentName'] = (
-            df.loc[mask_id_no_name, 'Equipment_ID'].apply(
-                lambda x: f"Unknown Equipment {x}"
-            )
+        df['EquipmentName'] = _replace_where(
+            df['EquipmentName'], mask_id_no_name,
+            ('Unknown Equipment ' + df.loc[mask_id_no_name, 'Equipment_ID'].astype(str)).to_numpy()
         )
         logger.info(
             f"Set EquipmentName for {mask_id_no_name.sum()} rows "
@@ -125,18 +201,11 @@ def clean_equipment_data(df: pd.DataFrame) -> pd.DataFrame:
         )
 
     # Step 5: For rows with EquipmentName but missing Equipment_ID
-    mask_name_no_id = (
-        df['EquipmentName'].notna() &
-        df['Equipment_ID'].isna() &
-        ~df['is_no_equipment']
-    )
+    mask_name_no_id = id_missing & ~name_missing
     if mask_name_no_id.any():
-        # Convert Equipment_ID to string type to avoid dtype warnings
-        df['Equipment_ID'] = df['Equipment_ID'].astype('object')
-        df.loc[mask_name_no_id, 'Equipment_ID'] = (
-            df.loc[mask_name_no_id, 'EquipmentName'].apply(
-                lambda x: hashlib.md5(str(x).encode()).hexdigest()[:12]
-            )
+        df['Equipment_ID'] = _replace_where(
+            df['Equipment_ID'], mask_name_no_id,
+            _synthetic_equipment_ids(df.loc[mask_name_no_id, 'EquipmentName'])
         )
         logger.info(
             f"Created synthetic Equipment_ID for {mask_name_no_id.sum()} rows "
@@ -145,9 +214,10 @@ def clean_equipment_data(df: pd.DataFrame) -> pd.DataFrame:
 
     # Step 6: Standardize EquipmentName: strip whitespace, title case
     # (skip no-equipment records as they already have standardized name)
-    non_no_equip_mask = ~df['is_no_equipment']
-    df.loc[non_no_equip_mask, 'EquipmentName'] = (
-        df.loc[non_no_equip_mask, 'EquipmentName'].str.strip().str.title()
+    non_no_equip_mask = ~df['is_no_equipment'].to_numpy()
+    df['EquipmentName'] = _replace_where(
+        df['EquipmentName'], non_no_equip_mask,
+        strip_title(df.loc[non_no_equip_mask, 'EquipmentName']).to_numpy()
     )
     logger.info("Standardized EquipmentName format (title case)")
 
@@ -170,25 +240,33 @@ def clean_cost_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Cleaned DataFrame with cost_outlier flag column
     """
-    # Fill missing PO_AMOUNT with 0
-    missing_count = df['PO_AMOUNT'].isna().sum()
+    df = df.copy(deep=False)
+
+    # Fill missing PO_AMOUNT with 0 and replace negative costs with 0, in
+    # one write over the column (and none when there is nothing to replace)
+    amounts = df['PO_AMOUNT'].to_numpy()
+    missing_mask = df['PO_AMOUNT'].isna().to_numpy()
+    negative_mask = amounts < 0
+    missing_count = missing_mask.sum()
+    negative_count = negative_mask.sum()
+
+    if missing_count > 0 or negative_count > 0:
+        df['PO_AMOUNT'] = np.where(missing_mask | negative_mask, 0, amounts)
     if missing_count > 0:
-        df['PO_AMOUNT'] = df['PO_AMOUNT'].fillna(0)
         logger.info(f"Filled {missing_count} missing PO_AMOUNT values with 0")
-
-    # Replace negative costs with 0 and log warning
-    negative_mask = df['PO_AMOUNT'] < 0
-    negative_count = negative_mask.sum()
     if negative_count > 0:
-        df.loc[negative_mask, 'PO_AMOUNT'] = 0
         logger.warning(
             f"Replaced {negative_count} negative PO_AMOUNT values with 0"
         )
 
-    # Flag cost outliers (> 99th percentile)
-    if len(df) > 0 and df['PO_AMOUNT'].max() > 0:
-        cost_99th = df['PO_AMOUNT'].quantile(0.99)
-        df['cost_outlier'] = df['PO_AMOUNT'] > cost_99th
+    # Flag cost outliers (> 99th percentile). np.quantile selects the
+    # neighbouring order statistics with np.partition (O(n), no full sort)
+    # and interpolates linearly, as Series.quantile does, without the pandas
+    # wrapper around it
+    amounts = df['PO_AMOUNT'].to_numpy()
+    if len(amounts) > 0 and amounts.max() > 0:
+        cost_99th = np.quantile(amounts, 0.99)
+        df['cost_outlier'] = amounts > cost_99th
         outlier_count = df['cost_outlier'].sum()
         logger.info(
             f"Flagged {outlier_count} cost outliers "
@@ -200,6 +278,40 @@ def clean_cost_data(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def downcast_cost_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store PO_AMOUNT as float32 when it can be done without losing cents.
+
+    Halves the bytes read by memory-bound aggregations over PO_AMOUNT. The
+    downcast is only applied when every amount round-trips to within half a
+    cent and the column's absolute total is below FLOAT32_CENT_SAFE_TOTAL,
+    so sums derived from the narrower column also stay exact to the cent.
+    Otherwise the column is left as float64.
+
+    Args:
+        df: DataFrame with cleaned PO_AMOUNT column (no missing values)
+
+    Returns:
+        DataFrame with PO_AMOUNT possibly downcast to float32
+    """
+    amounts = df['PO_AMOUNT']
+    if len(df) == 0 or amounts.dtype != np.float64:
+        return df
+
+    values = amounts.to_numpy()
+    if not np.abs(values).sum() < FLOAT32_CENT_SAFE_TOTAL:
+        logger.info("Kept PO_AMOUNT as float64 (total too large for float32 cents precision)")
+        return df
+
+    narrowed = values.astype(np.float32)
+    if np.allclose(narrowed, values, rtol=0.0, atol=0.005):
+        df = df.copy(deep=False)
+        df['PO_AMOUNT'] = narrowed
+        logger.info("Downcast PO_AMOUNT to float32")
+
+    return df
+
+
 def clean_date_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean and validate date data, calculate derived fields.
@@ -212,18 +324,21 @@ def clean_date_data(df: pd.DataFrame) -> pd.DataFrame:
 
     Args:
         df: DataFrame with Create_Date, Complete_Date, Status_Eng, Close_Date
-            (dates already converted to datetime)
+            (dates already converted to datetime by load_work_orders)
 
     Returns:
         Cleaned DataFrame with duration_hours and duration_outlier columns
     """
     initial_count = len(df)
+    df = df.copy(deep=False)
 
-    # Drop rows missing Create_Date
-    df = df[df['Create_Date'].notna()]
-    dropped_count = initial_count - len(df)
+    # Drop rows missing Create_Date (only filtering, and so copying the
+    # frame, when there are any)
+    has_create_date = df['Create_Date'].notna()
+    dropped_count = initial_count - has_create_date.sum()
 
     if dropped_count > 0:
+        df = df[has_create_date]
         logger.warning(
             f"Dropped {dropped_count} rows with missing Create_Date "
             f"(cannot analyze without creation date)"
@@ -231,46 +346,42 @@ def clean_date_data(df: pd.DataFrame) -> pd.DataFrame:
 
     # For missing Complete_Date where Status_Eng == 'Closed', use Close_Date
     if 'Close_Date' in df.columns:
-        # Convert Close_Date to datetime if it's not already
-        if not pd.api.types.is_datetime64_any_dtype(df['Close_Date']):
-            df['Close_Date'] = pd.to_datetime(df['Close_Date'], errors='coerce')
-
         mask_closed_no_complete = (
             (df['Complete_Date'].isna()) &
             (df['Status_Eng'] == 'Closed') &
             (df['Close_Date'].notna())
         )
         if mask_closed_no_complete.any():
-            df.loc[mask_closed_no_complete, 'Complete_Date'] = (
-                df.loc[mask_closed_no_complete, 'Close_Date']
+            df['Complete_Date'] = df['Complete_Date'].mask(
+                mask_closed_no_complete, df['Close_Date']
             )
             logger.info(
                 f"Used Close_Date for {mask_closed_no_complete.sum()} closed work orders "
                 f"with missing Complete_Date"
             )
 
-    # Calculate duration_hours for completed work orders
+    # Calculate duration_hours for completed work orders in one subtraction
+    # over the datetime arrays; NaT propagates, leaving NaN for open orders.
+    # Dividing by one second and then 3600 matches Timedelta.total_seconds().
     completed_mask = (df['Complete_Date'].notna() & df['Create_Date'].notna())
-    df['duration_hours'] = pd.Series(dtype=float)
+    duration = (
+        df['Complete_Date'].to_numpy(dtype='datetime64[ns]') -
+        df['Create_Date'].to_numpy(dtype='datetime64[ns]')
+    )
+    df['duration_hours'] = duration / np.timedelta64(1, 's') / 3600
 
     if completed_mask.any():
-        duration = (
-            df.loc[completed_mask, 'Complete_Date'].values -
-            df.loc[completed_mask, 'Create_Date'].values
-        )
-        # Convert timedelta to hours
-        df.loc[completed_mask, 'duration_hours'] = (
-            pd.to_timedelta(duration).total_seconds() / 3600
-        )
         logger.info(
             f"Calculated duration_hours for {completed_mask.sum()} completed work orders"
         )
 
     # Flag duration outliers (> 99th percentile)
-    duration_valid_mask = df['duration_hours'].notna() & (df['duration_hours'] >= 0)
+    # (NaN compares False, so the >= 0 test also excludes missing durations)
+    durations = df['duration_hours'].to_numpy()
+    duration_valid_mask = durations >= 0
     if duration_valid_mask.any():
-        duration_99th = df.loc[duration_valid_mask, 'duration_hours'].quantile(0.99)
-        df['duration_outlier'] = (df['duration_hours'] > duration_99th) & duration_valid_mask
+        duration_99th = np.quantile(durations[duration_valid_mask], 0.99)
+        df['duration_outlier'] = (durations > duration_99th) & duration_valid_mask
         outlier_count = df['duration_outlier'].sum()
         logger.info(
             f"Flagged {outlier_count} duration outliers "
@@ -282,7 +393,7 @@ def clean_date_data(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def clean_work_orders(df: pd.DataFrame) -> pd.DataFrame:
+def clean_work_orders(df: pd.DataFrame, downcast_costs: bool = False) -> pd.DataFrame:
     """
     Orchestrate all cleaning operations on work order data.
 
@@ -291,8 +402,14 @@ def clean_work_orders(df: pd.DataFrame) -> pd.DataFrame:
     2. Cost cleaning (fills missing, removes negatives, flags outliers)
     3. Date cleaning (drops rows with no Create_Date, calculates duration)
 
+    df itself is not modified. Each cleaner works on a shallow copy and
+    replaces whole columns rather than writing into them, so the raw data is
+    never copied up front.
+
     Args:
         df: Raw DataFrame from load_work_orders()
+        downcast_costs: If True, store PO_AMOUNT as float32 where cents
+            precision allows (see downcast_cost_data). Default: False
 
     Returns:
         Cleaned DataFrame with added columns:
@@ -303,14 +420,13 @@ def clean_work_orders(df: pd.DataFrame) -> pd.DataFrame:
     initial_count = len(df)
     logger.info(f"Starting data cleaning: {initial_count} work orders")
 
-    # Make a copy to avoid modifying original
-    df_clean = df.copy()
-
     # Clean equipment data
-    df_clean = clean_equipment_data(df_clean)
+    df_clean = clean_equipment_data(df)
 
     # Clean cost data
     df_clean = clean_cost_data(df_clean)
+    if downcast_costs:
+        df_clean = downcast_cost_data(df_clean)
 
     # Clean date data
     df_clean = clean_date_data(df_clean)
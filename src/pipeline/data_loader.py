@@ -9,6 +9,7 @@ import logging
 from pathlib import Path
 from typing import Union
 
+import numpy as np
 import pandas as pd
 
 from .schema import validate_schema
@@ -21,21 +22,144 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Strings read as missing values: pandas.read_csv's defaults, passed to
+# PyArrow's reader as well so both readers agree
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null'
+]
 
-def load_work_orders(file_path: Union[str, Path]) -> pd.DataFrame:
+
+def _strip_object_columns(df: pd.DataFrame, skip=()) -> pd.DataFrame:
+    """Strip whitespace from df's object columns in place, except those in skip."""
+    for col in df.select_dtypes(include=['object']).columns:
+        if col not in skip:
+            df[col] = df[col].str.strip()
+    return df
+
+
+def _read_csv_pandas(file_path: Path) -> pd.DataFrame:
+    """Read a work order CSV with pandas' C parser and strip its text columns."""
+    # UTF-8-sig encoding handles a BOM; low_memory=False reads the entire
+    # file to infer types correctly
+    df = pd.read_csv(file_path, encoding='utf-8-sig', low_memory=False)
+    return _strip_object_columns(df)
+
+
+def _read_csv(file_path: Path, use_arrow: bool = True) -> pd.DataFrame:
+    """
+    Read a work order CSV into a DataFrame with NumPy-backed columns, with
+    whitespace stripped from its text columns.
+
+    Uses PyArrow's multithreaded C++ CSV reader when pyarrow is installed,
+    converting its result to the same dtypes pandas' C parser produces:
+    columns Arrow infers as dates, timestamps or times of day stay text (the
+    loader converts date columns itself), all-empty columns become float64
+    NaN and missing text cells are NaN rather than None. Falls back to pandas
+    when pyarrow is not installed, cannot parse or decode the file, the
+    header has duplicate names (which pandas renames to 'name.1', ...), or a
+    float64 column reaches 2**63 in magnitude (Arrow reads integers beyond
+    the int64 range as float64, pandas as uint64 or text).
+
+    On the PyArrow path, string columns are trimmed with Arrow's
+    utf8_trim_whitespace kernel before conversion, which avoids a Python
+    call per value (a thread pool would not help .str.strip, which holds the
+    GIL). Other object columns, such as booleans with missing values, get
+    the same .str.strip as on the pandas path.
+
+    Args:
+        file_path: Path to the CSV file
+        use_arrow: If False, always read with pandas.read_csv
+
+    Returns:
+        DataFrame with the file's columns
+    """
+    if not use_arrow:
+        return _read_csv_pandas(file_path)
+
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pcsv
+    except ImportError:
+        return _read_csv_pandas(file_path)
+
+    # Work order descriptions may contain quoted line breaks
+    parse_options = pcsv.ParseOptions(newlines_in_values=True)
+    try:
+        table = pcsv.read_csv(
+            file_path,
+            parse_options=parse_options,
+            convert_options=pcsv.ConvertOptions(null_values=CSV_NA_VALUES, strings_can_be_null=True)
+        )
+        if len(set(table.column_names)) != table.num_columns:
+            return _read_csv_pandas(file_path)
+
+        # Arrow infers ISO dates, timestamps and times of day, which pandas
+        # keeps as text; read every column that is not numeric, boolean or
+        # text again as strings
+        temporal = [
+            field.name for field in table.schema
+            if not (pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+                    or pa.types.is_boolean(field.type) or pa.types.is_null(field.type)
+                    or pa.types.is_string(field.type))
+        ]
+        # Integers past the int64 range are inferred as float64
+        for field in table.schema:
+            if pa.types.is_floating(field.type):
+                largest = pc.max(pc.abs(table.column(field.name))).as_py()
+                if largest is not None and largest >= 2 ** 63:
+                    return _read_csv_pandas(file_path)
+        if temporal:
+            text = pcsv.read_csv(
+                file_path,
+                parse_options=parse_options,
+                convert_options=pcsv.ConvertOptions(
+                    include_columns=temporal,
+                    column_types={name: pa.string() for name in temporal},
+                    null_values=CSV_NA_VALUES,
+                    strings_can_be_null=True
+                )
+            )
+    except pa.ArrowException:
+        return _read_csv_pandas(file_path)
+
+    trimmed = set()
+    for i, field in enumerate(table.schema):
+        if field.name in temporal:
+            table = table.set_column(i, field.name, text.column(field.name))
+        elif pa.types.is_null(field.type) and table.num_rows > 0:
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+        if pa.types.is_string(table.schema.field(i).type):
+            table = table.set_column(i, field.name, pc.utf8_trim_whitespace(table.column(i)))
+            trimmed.add(field.name)
+
+    df = table.to_pandas()
+    # to_pandas marks missing values in object columns with None; pandas'
+    # reader uses NaN
+    for col in df.select_dtypes(include=['object']).columns:
+        if df[col].hasnans:
+            df[col] = df[col].fillna(np.nan)
+    return _strip_object_columns(df, skip=trimmed)
+
+
+def load_work_orders(file_path: Union[str, Path], use_arrow: bool = True) -> pd.DataFrame:
     """
     Load work order data from CSV file with validation and preprocessing.
 
     This function:
-    1. Loads CSV data with proper encoding
+    1. Loads CSV data with proper encoding, stripping whitespace from
+       string columns
     2. Validates required fields are present
     3. Converts date columns to datetime
     4. Converts cost columns to numeric
-    5. Strips whitespace from string columns
-    6. Logs summary statistics
+    5. Logs summary statistics
 
     Args:
         file_path: Path to the CSV file containing work order data
+        use_arrow: If True, parse with PyArrow's CSV reader when pyarrow is
+            installed; if False, always use pandas.read_csv (default: True)
 
     Returns:
         pandas DataFrame with cleaned and validated work order data
@@ -61,14 +185,10 @@ def load_work_orders(file_path: Union[str, Path]) -> pd.DataFrame:
     logger.info(f"Loading work order data from: {file_path}")
 
     try:
-        # Load CSV with UTF-8-sig encoding (handles BOM) and mixed types
-        df = pd.read_csv(
-            file_path,
-            encoding='utf-8-sig',
-            low_memory=False  # Read entire file to infer types correctly
-        )
+        df = _read_csv(file_path, use_arrow)
 
         logger.info(f"Successfully loaded {len(df)} rows from CSV")
+        logger.info("Whitespace stripped from string columns")
 
     except UnicodeDecodeError as e:
         raise Exception(
@@ -94,8 +214,9 @@ def load_work_orders(file_path: Union[str, Path]) -> pd.DataFrame:
 
     logger.info("Schema validation passed: all required fields present")
 
-    # Convert date columns to datetime
-    date_columns = ['Create_Date', 'Complete_Date']
+    # Convert date columns to datetime (Close_Date too, so the cleaner can
+    # fill missing Complete_Date from it without checking its dtype)
+    date_columns = ['Create_Date', 'Complete_Date', 'Close_Date']
     for col in date_columns:
         if col in df.columns:
             original_count = df[col].notna().sum()
@@ -140,13 +261,6 @@ def load_work_orders(file_path: Union[str, Path]) -> pd.DataFrame:
 
     logger.info("Numeric columns converted")
 
-    # Strip whitespace from string columns
-    string_columns = df.select_dtypes(include=['object']).columns
-    for col in string_columns:
-        df[col] = df[col].str.strip()
-
-    logger.info("Whitespace stripped from string columns")
-
     # Log summary statistics - prefer create_date_yyyymmdd
     date_col_for_log = None
     for col in ['create_date_yyyymmdd', 'Create_Date']:
@@ -52,17 +52,40 @@ class ReportBuilder:
     2. Running analysis modules
     3. Extracting key findings
     4. Consolidating into structured Report object
+
+    When built from PipelineOrchestrator.run_full_analysis() results (see
+    from_results), the prepared data and analysis outputs in those results
+    are reused instead of reloading the input file and re-running the
+    analyses.
     """
 
-    def __init__(self, input_file: str):
+    def __init__(self, input_file: str, analysis_results: Optional[Dict[str, Any]] = None):
         """
         Initialize ReportBuilder with input data file.
 
         Args:
             input_file: Path to work order data file (CSV or Excel)
+            analysis_results: Optional dict returned from
+                PipelineOrchestrator.run_full_analysis() to reuse
         """
         self.input_file = input_file
-        self.df: Optional[pd.DataFrame] = None
+        self.analysis_results: Dict[str, Any] = analysis_results or {}
+        self.df: Optional[pd.DataFrame] = self.analysis_results.get('work_orders_df')
+
+    @classmethod
+    def from_results(cls, analysis_results: Dict[str, Any], input_file: str) -> 'ReportBuilder':
+        """
+        Create a ReportBuilder that reuses existing analysis results.
+
+        Args:
+            analysis_results: Dict returned from PipelineOrchestrator.run_full_analysis()
+            input_file: Path to work order data file, loaded only if
+                analysis_results lacks the prepared work orders
+
+        Returns:
+            ReportBuilder instance
+        """
+        return cls(input_file, analysis_results=analysis_results)
 
     def _load_data(self) -> pd.DataFrame:
         """
@@ -219,14 +242,18 @@ class ReportBuilder:
         from src.analysis.outlier_detector import detect_outliers
         from src.analysis.equipment_ranker import rank_equipment, identify_thresholds
 
-        # Run frequency analysis
-        freq_df = calculate_equipment_frequencies(self.df)
+        # Reuse frequency and ranking results when available
+        freq_df = self.analysis_results.get('category_stats')
+        ranked_df = self.analysis_results.get('equipment_df')
+        if freq_df is None or ranked_df is None:
+            # Run frequency analysis
+            freq_df = calculate_equipment_frequencies(self.df)
 
-        # Run outlier detection
-        outlier_df = detect_outliers(freq_df)
+            # Run outlier detection
+            outlier_df = detect_outliers(freq_df)
 
-        # Run ranking
-        ranked_df = rank_equipment(outlier_df)
+            # Run ranking
+            ranked_df = rank_equipment(outlier_df)
 
         # Handle edge case: no consensus outliers found
         if len(ranked_df) == 0:
@@ -316,9 +343,15 @@ class ReportBuilder:
 
         analyzer = SeasonalAnalyzer()
 
-        # Calculate monthly and quarterly costs
-        monthly_costs = analyzer.calculate_monthly_costs(self.df)
-        quarterly_costs = analyzer.calculate_quarterly_costs(self.df)
+        # Reuse monthly and quarterly costs (quarterly with variance) when available
+        seasonal_results = self.analysis_results.get('seasonal_dict')
+        reuse = seasonal_results is not None and 'patterns' in seasonal_results
+        if reuse:
+            monthly_costs = seasonal_results['monthly_costs']
+            quarterly_costs = seasonal_results['quarterly_costs']
+        else:
+            # Calculate monthly and quarterly costs from one monthly groupby
+            monthly_costs, quarterly_costs = analyzer.calculate_monthly_and_quarterly(self.df)
 
         # Handle edge case: insufficient data
         if len(monthly_costs) == 0 or len(quarterly_costs) == 0:
@@ -339,12 +372,15 @@ class ReportBuilder:
                 recommendations=recommendations
             )
 
-        # Calculate variance
-        monthly_with_variance = analyzer.calculate_variance(monthly_costs)
-        quarterly_with_variance = analyzer.calculate_variance(quarterly_costs)
+        if reuse:
+            quarterly_with_variance = quarterly_costs
+            patterns = seasonal_results['patterns']
+        else:
+            # Calculate variance
+            quarterly_with_variance = analyzer.calculate_variance(quarterly_costs)
 
-        # Detect patterns
-        patterns = analyzer.detect_patterns(quarterly_with_variance)
+            # Detect patterns
+            patterns = analyzer.detect_patterns(quarterly_with_variance)
 
         # Get recommendations
         recommendations = analyzer.get_recommendations(quarterly_with_variance)
@@ -414,8 +450,11 @@ class ReportBuilder:
 
         analyzer = VendorAnalyzer(min_work_orders=3)
 
-        # Calculate vendor costs
-        vendor_costs = analyzer.calculate_vendor_costs(self.df, include_unknown=False)
+        # Reuse vendor costs when available
+        vendor_costs = self.analysis_results.get('vendor_df')
+        if vendor_costs is None:
+            # Calculate vendor costs
+            vendor_costs = analyzer.calculate_vendor_costs(self.df, include_unknown=False)
 
         # Handle edge case: no vendor data
         if len(vendor_costs) == 0:
@@ -505,8 +544,14 @@ class ReportBuilder:
 
         analyzer = FailurePatternAnalyzer()
 
-        # Find high-impact patterns
-        high_impact = analyzer.find_high_impact_patterns(self.df, min_occurrences=5)
+        # Reuse high-impact patterns when available
+        if 'patterns_df' in self.analysis_results:
+            high_impact = self.analysis_results['patterns_df']
+        elif 'patterns_list' in self.analysis_results:
+            high_impact = pd.DataFrame(self.analysis_results['patterns_list'])
+        else:
+            # Find high-impact patterns
+            high_impact = analyzer.find_high_impact_patterns(self.df, min_occurrences=5)
 
         # Get failure categories
         categories = analyzer.categorize_by_failure_type(self.df)
@@ -592,8 +637,8 @@ class ReportBuilder:
         Returns:
             Complete Report object with all sections and metadata
         """
-        # Load data
-        df = self._load_data()
+        # Load data unless prepared work orders were provided
+        df = self.df if self.df is not None else self._load_data()
 
         # Calculate metadata
         metadata = self._calculate_metadata(df)
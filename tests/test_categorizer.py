@@ -89,6 +89,25 @@ def test_normalize_categories_standardizes_text():
     assert result.loc[1, 'equipment_subcategory'] == 'Lighting'
 
 
+def test_normalize_categories_repeated_values():
+    """
+    Test that repeated category values are all standardized the same way.
+
+    Matches .str.strip().str.title() applied to the raw fallback values.
+    """
+    df = pd.DataFrame({
+        'Equipment_ID': ['E001', 'E002', 'E003', 'E004'],
+        'service_type_lv2': ['  hvac  ', None, '  hvac  ', 'fire SAFETY'],
+        'service_type_lv3': [None, 'pumps ', None, None],
+        'FM_Type': ['Mechanical', ' plumbing', 'Mechanical', 'Fire'],
+    })
+
+    result = normalize_categories(df)
+
+    assert result['equipment_category'].tolist() == ['Hvac', 'Plumbing', 'Hvac', 'Fire Safety']
+    assert result['equipment_subcategory'].tolist() == ['Hvac', 'Pumps', 'Hvac', 'Fire Safety']
+
+
 def test_create_category_hierarchy():
     """
     Test that create_category_hierarchy counts equipment and work orders correctly.
@@ -119,6 +138,29 @@ def test_create_category_hierarchy():
            result['work_order_count'].nunique() == 1  # Allow ties
 
 
+def test_create_category_hierarchy_categorical_input():
+    """
+    Test that create_category_hierarchy accepts category dtype input.
+
+    Unused categories should not appear in the hierarchy.
+    """
+    df = pd.DataFrame({
+        'Equipment_ID': ['E001', 'E001', 'E002', 'E003', 'E003', 'E003'],
+        'equipment_category': ['HVAC', 'HVAC', 'HVAC', 'Electrical', 'Electrical', 'Plumbing'],
+    })
+    categorical_df = df.astype({'equipment_category': pd.CategoricalDtype(
+        ['Electrical', 'HVAC', 'Lift', 'Plumbing']
+    )})
+
+    result = create_category_hierarchy(categorical_df)
+    expected = create_category_hierarchy(df)
+
+    assert result['category'].tolist() == ['HVAC', 'Electrical', 'Plumbing']
+    assert result['category'].astype(str).tolist() == expected['category'].tolist()
+    assert result['work_order_count'].tolist() == expected['work_order_count'].tolist()
+    assert result['equipment_count'].tolist() == expected['equipment_count'].tolist()
+
+
 def test_assign_equipment_types_finds_primary():
     """
     Test that assign_equipment_types assigns the mode category as primary.
@@ -188,6 +230,90 @@ def test_assign_equipment_types_handles_ties():
     assert result['equipment_category_consistency'].iloc[0] == 50.0
 
 
+def test_assign_equipment_types_matches_mode():
+    """
+    Test that the primary category matches Series.mode per equipment.
+
+    Ties resolve to the alphabetically first category and missing categories
+    are not counted.
+    """
+    df = pd.DataFrame({
+        'Equipment_ID': ['E001', 'E001', 'E001', 'E001', 'E002', 'E002', 'E002'],
+        'equipment_category': ['Plumbing', 'HVAC', 'Plumbing', 'HVAC', None, None, 'Electrical'],
+    })
+
+    result = assign_equipment_types(df)
+
+    expected = df.groupby('Equipment_ID')['equipment_category'].agg(lambda x: x.mode()[0])
+    primary = result.groupby('Equipment_ID')['equipment_primary_category'].first()
+    pd.testing.assert_series_equal(primary, expected, check_names=False)
+    assert result.loc[result['Equipment_ID'] == 'E002', 'equipment_category_consistency'].iloc[0] == pytest.approx(100 / 3)
+
+
+def test_assign_equipment_types_keeps_index():
+    """
+    Test that assign_equipment_types keeps the input rows and index.
+
+    Primary category and consistency are looked up per row, so a filtered
+    frame keeps its original index labels.
+    """
+    df = pd.DataFrame({
+        'Equipment_ID': ['E001', 'E002', 'E001', 'E002'],
+        'equipment_category': ['HVAC', 'Plumbing', 'HVAC', 'Electrical'],
+    }, index=[10, 3, 7, 42])
+
+    result = assign_equipment_types(df)
+
+    assert list(result.index) == [10, 3, 7, 42]
+    assert result['equipment_primary_category'].tolist() == ['HVAC', 'Electrical', 'HVAC', 'Electrical']
+    assert result['equipment_category_consistency'].tolist() == [100.0, 50.0, 100.0, 50.0]
+
+
+def test_assign_equipment_types_missing_equipment_id():
+    """
+    Test that work orders without an Equipment_ID get no consistency score.
+
+    Missing IDs form no group, so they neither get a score nor count toward
+    another equipment's score.
+    """
+    df = pd.DataFrame({
+        'Equipment_ID': ['E001', None, 'E001', 'E001'],
+        'equipment_category': ['HVAC', 'HVAC', 'Plumbing', 'HVAC'],
+    })
+
+    result = assign_equipment_types(df)
+
+    consistency = result['equipment_category_consistency']
+    assert pd.isna(consistency[1])
+    assert consistency.drop(1).round(2).tolist() == [66.67, 66.67, 66.67]
+
+
+def test_assign_equipment_types_categorical_input():
+    """
+    Test that category-dtype columns give the same result as object columns.
+
+    The primary category is taken from equipment_category itself, so it
+    keeps the category dtype.
+    """
+    df = pd.DataFrame({
+        'Equipment_ID': ['E001', 'E002', 'E001', 'E002', 'E001'],
+        'equipment_category': ['HVAC', 'Plumbing', 'HVAC', 'Plumbing', 'Electrical'],
+    })
+
+    expected = assign_equipment_types(df.copy())
+    result = assign_equipment_types(df.astype('category'))
+
+    assert isinstance(result['equipment_primary_category'].dtype, pd.CategoricalDtype)
+    assert (
+        result['equipment_primary_category'].tolist() ==
+        expected['equipment_primary_category'].tolist()
+    )
+    pd.testing.assert_series_equal(
+        result['equipment_category_consistency'],
+        expected['equipment_category_consistency']
+    )
+
+
 def test_categorize_work_orders_integration():
     """
     Test the full categorize_work_orders orchestration function.
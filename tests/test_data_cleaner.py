@@ -4,6 +4,8 @@ Tests for data_cleaner module.
 Tests cover equipment cleaning, cost cleaning, and date cleaning logic.
 """
 
+import hashlib
+
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -12,8 +14,10 @@ import pytest
 from src.pipeline.data_cleaner import (
     clean_equipment_data,
     clean_cost_data,
+    downcast_cost_data,
     clean_date_data,
-    clean_work_orders
+    clean_work_orders,
+    strip_title
 )
 
 
@@ -52,6 +56,34 @@ def test_clean_equipment_data_handles_partial_info():
     assert result['EquipmentName'].notna().all()
 
 
+def test_clean_equipment_data_synthetic_ids_are_name_hashes():
+    """Test that synthetic IDs are MD5 prefixes of the name, shared by repeated names."""
+    df = pd.DataFrame({
+        'Equipment_ID': [np.nan, 2.0, np.nan, np.nan],
+        'EquipmentName': ['Chiller 1', 'Pump 2', 'Boiler 3', 'Chiller 1']
+    })
+
+    result = clean_equipment_data(df)
+
+    assert result.loc[0, 'Equipment_ID'] == hashlib.md5(b'Chiller 1').hexdigest()[:12]
+    assert result.loc[2, 'Equipment_ID'] == hashlib.md5(b'Boiler 3').hexdigest()[:12]
+    assert result.loc[3, 'Equipment_ID'] == result.loc[0, 'Equipment_ID']
+    assert result.loc[1, 'Equipment_ID'] == 2.0
+
+
+def test_strip_title_matches_str_accessor():
+    """Test that strip_title matches .str.strip().str.title() on repeated values."""
+    values = pd.Series(
+        ['  pump a', 'PUMP A ', '  pump a', None, 'chiller', 42, 'chiller'],
+        index=[5, 3, 9, 1, 0, 2, 8],
+        name='EquipmentName'
+    )
+
+    result = strip_title(values)
+
+    pd.testing.assert_series_equal(result, values.str.strip().str.title())
+
+
 def test_clean_cost_data_fills_missing():
     """Test that missing costs are filled with 0."""
     df = pd.DataFrame({
@@ -98,6 +130,19 @@ def test_clean_cost_data_flags_outliers():
     assert result['cost_outlier'].sum() <= 2  # At most 1-2 outliers
 
 
+def test_downcast_cost_data_respects_cents_precision():
+    """Test PO_AMOUNT is downcast only when cents precision is preserved."""
+    small = pd.DataFrame({'PO_AMOUNT': [10.25, 99.99, 1200.5]})
+    result = downcast_cost_data(small)
+    assert result['PO_AMOUNT'].dtype == np.float32
+    assert result['PO_AMOUNT'].sum() == pytest.approx(1310.74, abs=0.005)
+
+    # Totals beyond the float32 cents-safe range stay float64
+    large = pd.DataFrame({'PO_AMOUNT': [25000.01, 30000.02]})
+    result = downcast_cost_data(large)
+    assert result['PO_AMOUNT'].dtype == np.float64
+
+
 def test_clean_date_data_drops_missing_create():
     """Test that rows without Create_Date are dropped."""
     df = pd.DataFrame({
@@ -226,3 +271,24 @@ def test_clean_work_orders_integration():
 
     # Duration should be calculated where possible
     assert result['duration_hours'].notna().sum() >= 1
+
+
+def test_clean_work_orders_leaves_input_unchanged():
+    """Test that cleaning does not add columns to or write values into the raw frame."""
+    # No rows are dropped, so every cleaner works on the caller's rows
+    df = pd.DataFrame({
+        'Equipment_ID': ['E1', np.nan, 'E3', np.nan],
+        'EquipmentName': [' pump a ', '無設備', np.nan, 'chiller'],
+        'PO_AMOUNT': [100.0, np.nan, -50.0, 200.0],
+        'Create_Date': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04']),
+        'Complete_Date': pd.to_datetime(['2024-01-02', None, '2024-01-04', '2024-01-05']),
+        'Status_Eng': ['Closed', 'Closed', 'Closed', 'Open'],
+        'Close_Date': pd.to_datetime([None, '2024-01-03', None, None])
+    })
+    original = df.copy()
+
+    result = clean_work_orders(df, downcast_costs=True)
+
+    assert len(result) == 4
+    assert result['Complete_Date'].notna().all()
+    pd.testing.assert_frame_equal(df, original)
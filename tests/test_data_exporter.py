@@ -147,6 +147,21 @@ def test_export_vendor_metrics_csv(sample_vendor_df, tmp_path):
     assert result_df.iloc[0]['total_cost'] == 150000
 
 
+def test_csv_export_does_not_modify_input(sample_vendor_df, tmp_path):
+    """Test sorting for export leaves the caller's DataFrame untouched."""
+    exporter = DataExporter()
+    output_file = tmp_path / "vendors_unsorted.csv"
+
+    unsorted_df = sample_vendor_df.iloc[::-1].reset_index(drop=True)
+    original = unsorted_df.copy()
+
+    exporter.export_vendor_metrics(unsorted_df, output_file)
+
+    pd.testing.assert_frame_equal(unsorted_df, original)
+    result_df = pd.read_csv(output_file)
+    assert result_df['total_cost'].is_monotonic_decreasing
+
+
 def test_export_failure_patterns_csv(sample_patterns_list, tmp_path):
     """Test CSV export for failure patterns."""
     exporter = DataExporter()
@@ -165,6 +180,27 @@ def test_export_failure_patterns_csv(sample_patterns_list, tmp_path):
     assert 'equipment_count' in result_df.columns  # Mapped from equipment_affected
 
 
+def test_failure_patterns_csv_text(tmp_path):
+    """Test failure pattern CSV text matches DataFrame.to_csv of the patterns."""
+    exporter = DataExporter()
+    output_file = tmp_path / "patterns.csv"
+
+    patterns = [
+        {'pattern': 'repair 修理', 'occurrences': 818, 'total_cost': 2118.0,
+         'equipment_affected': 23, 'category': 'other'},
+        {'pattern': 'leak, valve', 'occurrences': 394, 'total_cost': 5470.5,
+         'equipment_affected': 21, 'category': 'leak'}
+    ]
+
+    exporter.export_failure_patterns(patterns, output_file)
+
+    assert output_file.read_text(encoding='utf-8') == (
+        'pattern,frequency,total_cost,equipment_count,category\n'
+        'repair 修理,818,2118.0,23,other\n'
+        '"leak, valve",394,5470.5,21,leak\n'
+    )
+
+
 def test_csv_empty_dataframe(tmp_path):
     """Test CSV export handles empty DataFrame gracefully."""
     exporter = DataExporter()
@@ -220,6 +256,68 @@ def test_csv_special_characters(tmp_path):
     assert result_df.iloc[1]['Equipment_Name'] == 'Elevator (Main)'
 
 
+def test_csv_text_matches_to_csv(tmp_path):
+    """Test CSV exports are byte-for-byte what DataFrame.to_csv writes."""
+    exporter = DataExporter()
+    output_file = tmp_path / "rankings.csv"
+    expected_file = tmp_path / "expected.csv"
+
+    df = pd.DataFrame({
+        'Equipment_ID': [1.42029e18, 1.43296e18],
+        'Equipment_Name': ['Lift No.2', 'Chiller, Unit "A"'],
+        'equipment_primary_category': ['升降機及自動電梯', ''],
+        'is_critical': [True, False],
+        'cost_impact': [616.0, float('nan')],
+        'priority_score': [1.0, 0.8],
+        'overall_rank': [1, 2]
+    })
+
+    exporter.export_equipment_rankings(df, output_file)
+    df.to_csv(expected_file, index=False)
+
+    assert output_file.read_text(encoding='utf-8') == expected_file.read_text(encoding='utf-8')
+    assert output_file.read_text(encoding='utf-8').splitlines()[1] == (
+        '1.42029e+18,Lift No.2,升降機及自動電梯,True,616.0,1.0,1'
+    )
+
+
+def test_csv_mixed_type_column(tmp_path):
+    """Test CSV export handles object columns that mix value types."""
+    exporter = DataExporter()
+    output_file = tmp_path / "mixed_types.csv"
+
+    mixed_df = pd.DataFrame({
+        'Equipment_Name': ['Equipment A', 'Equipment B'],
+        'notes': ['check', 42],
+        'priority_score': [0.9, 0.8]
+    })
+
+    exporter.export_equipment_rankings(mixed_df, output_file)
+
+    result_df = pd.read_csv(output_file)
+    assert len(result_df) == 2
+    assert list(result_df['notes'].astype(str)) == ['check', '42']
+
+
+def test_csv_list_and_period_columns(tmp_path):
+    """Test CSV export writes list and period columns as their text form."""
+    exporter = DataExporter()
+    output_file = tmp_path / "nested.csv"
+
+    nested_df = pd.DataFrame({
+        'Equipment_Name': ['Equipment A', 'Equipment B'],
+        'related_ids': [[1, 2], [3]],
+        'month': pd.period_range('2024-01', periods=2, freq='M'),
+        'priority_score': [0.9, 0.8]
+    })
+
+    exporter.export_equipment_rankings(nested_df, output_file)
+
+    result_df = pd.read_csv(output_file)
+    assert list(result_df['related_ids']) == ['[1, 2]', '[3]']
+    assert list(result_df['month']) == ['2024-01', '2024-02']
+
+
 def test_csv_file_creation(tmp_path):
     """Test CSV files are created at correct paths."""
     exporter = DataExporter()
@@ -398,6 +496,30 @@ def test_json_nan_values(tmp_path):
     assert result[0]['priority_score'] == 0.85
 
 
+def test_json_records_match_cleaned_dicts():
+    """Test column-wise JSON record conversion matches per-cell cleaning."""
+    exporter = DataExporter()
+    df = pd.DataFrame({
+        'name': ['A', None, 'C'],
+        'cost': [1.5, float('nan'), float('inf')],
+        'count': [1, 2, 3],
+        'flag': [True, False, True],
+        'date': pd.to_datetime(['2024-01-01', None, '2024-03-01']),
+        'category': pd.Categorical(['x', None, 'y']),
+        'ids': [[1, 2], [], [3]]
+    })
+
+    records = exporter._df_to_json_records(df)
+
+    assert records == exporter._clean_for_json(df.to_dict('records'))
+    assert records[1] == {
+        'name': None, 'cost': None, 'count': 2, 'flag': 0,
+        'date': None, 'category': None, 'ids': []
+    }
+    assert records[0]['date'] == '2024-01-01T00:00:00'
+    json.dumps(records, allow_nan=False)
+
+
 def test_json_date_serialization(tmp_path):
     """Test JSON export serializes dates as ISO strings."""
     exporter = DataExporter()
@@ -419,6 +541,25 @@ def test_json_date_serialization(tmp_path):
     assert result[0]['last_service'] == '2024-01-15T00:00:00'
 
 
+def test_json_float_round_trip(tmp_path):
+    """Test JSON export keeps full float precision."""
+    exporter = DataExporter()
+    output_file = tmp_path / "precision.json"
+
+    vendor_df = pd.DataFrame({
+        'contractor': ['A', 'B'],
+        'total_cost': [0.1 + 0.2, 2 / 3],
+        'work_order_count': [3, 4]
+    })
+
+    exporter.export_vendor_metrics_json(vendor_df, output_file)
+
+    with open(output_file, 'r') as f:
+        result = json.load(f)
+
+    assert [r['total_cost'] for r in result] == [2 / 3, 0.1 + 0.2]
+
+
 def test_json_pretty_print(sample_equipment_df, tmp_path):
     """Test JSON export uses indent=2 for pretty printing."""
     exporter = DataExporter()
@@ -469,3 +610,209 @@ def test_json_roundtrip(sample_equipment_df, tmp_path):
     assert len(result_df) == len(sample_equipment_df)
     assert list(result_df['Equipment_Name']) == list(sample_equipment_df['Equipment_Name'])
     assert abs(result_df.iloc[0]['priority_score'] - 0.95) < 0.001
+
+
+# NDJSON Export Tests
+def test_export_ndjson(sample_vendor_df, tmp_path):
+    """Test NDJSON export writes one JSON object per row with NaN as null."""
+    exporter = DataExporter()
+    output_file = tmp_path / "vendors.ndjson"
+
+    vendor_df = sample_vendor_df.copy()
+    vendor_df.loc[0, 'avg_cost_per_wo'] = float('nan')
+
+    exporter.export_ndjson(vendor_df, output_file)
+
+    with open(output_file, 'r') as f:
+        lines = f.read().splitlines()
+
+    assert len(lines) == len(vendor_df)
+    records = [json.loads(line) for line in lines]
+    assert records[0]['contractor'] == vendor_df.iloc[0]['contractor']
+    assert records[0]['avg_cost_per_wo'] is None
+
+
+def test_export_ndjson_empty(tmp_path):
+    """Test NDJSON export of an empty DataFrame creates an empty file."""
+    exporter = DataExporter()
+    output_file = tmp_path / "empty.ndjson"
+
+    exporter.export_ndjson(pd.DataFrame(), output_file)
+
+    assert output_file.exists()
+    assert output_file.read_text() == ''
+
+
+# Batch Export Tests
+def test_export_all(sample_equipment_df, sample_vendor_df, sample_patterns_list, tmp_path):
+    """Test export_all writes CSV and JSON for every export in input order."""
+    exporter = DataExporter()
+
+    paths = exporter.export_all({
+        'equipment_rankings': ('equipment_rankings', sample_equipment_df),
+        'vendor_metrics': ('vendor_metrics', sample_vendor_df),
+        'failure_patterns': ('failure_patterns', sample_patterns_list)
+    }, tmp_path, max_workers=2)
+
+    assert [Path(p).name for p in paths['csv']] == [
+        'equipment_rankings.csv', 'vendor_metrics.csv', 'failure_patterns.csv'
+    ]
+    assert [Path(p).name for p in paths['json']] == [
+        'equipment_rankings.json', 'vendor_metrics.json', 'failure_patterns.json'
+    ]
+    for path in paths['csv'] + paths['json']:
+        assert Path(path).exists()
+
+    assert len(pd.read_csv(tmp_path / 'vendor_metrics.csv')) == len(sample_vendor_df)
+
+
+def test_export_all_invalid_kind(tmp_path):
+    """Test export_all rejects unknown export kinds."""
+    exporter = DataExporter()
+
+    with pytest.raises(ValueError):
+        exporter.export_all({'unknown': ('not_a_kind', [])}, tmp_path)
+
+
+def test_export_vendor_metrics_both_matches_separate(sample_vendor_df, tmp_path):
+    """Test the fused CSV + JSON export writes the same files as the separate exporters."""
+    exporter = DataExporter()
+    unsorted_df = sample_vendor_df.iloc[::-1]
+
+    exporter.export_vendor_metrics_both(unsorted_df, tmp_path / "both.csv", tmp_path / "both.json")
+    exporter.export_vendor_metrics(unsorted_df, tmp_path / "single.csv")
+    exporter.export_vendor_metrics_json(unsorted_df, tmp_path / "single.json")
+
+    assert (tmp_path / "both.csv").read_text() == (tmp_path / "single.csv").read_text()
+    assert (tmp_path / "both.json").read_text() == (tmp_path / "single.json").read_text()
+
+
+def test_csv_downcast_floats(tmp_path):
+    """Test opt-in float32 downcast shortens scores but keeps costs exact."""
+    output_file = tmp_path / "downcast.csv"
+
+    df = pd.DataFrame({
+        'Equipment_Name': ['A', 'B'],
+        'avg_cost': [1234.5678912345, 10.1],
+        'priority_score': [1 / 3, 0.25]
+    })
+
+    DataExporter(downcast_floats=True).export_equipment_rankings(df, output_file)
+
+    with open(output_file, 'r') as f:
+        lines = f.read().splitlines()
+
+    assert lines[1].split(',')[1:] == ['1234.5678912345', '0.33333334']
+    assert df['priority_score'].dtype == 'float64'
+
+
+def test_json_columns_orient(sample_vendor_df, tmp_path):
+    """Test column-oriented JSON export holds the same values as records."""
+    exporter = DataExporter()
+    records_file = tmp_path / "vendors_records.json"
+    columns_file = tmp_path / "vendors_columns.json"
+
+    exporter.export_vendor_metrics_json(sample_vendor_df, records_file)
+    exporter.export_vendor_metrics_json(sample_vendor_df, columns_file, orient='columns')
+
+    with open(records_file, 'r') as f:
+        records = json.load(f)
+    with open(columns_file, 'r') as f:
+        columns = json.load(f)
+
+    assert columns['layout'] == 'columns'
+    assert pd.DataFrame(columns['data']).to_dict('records') == records
+
+    with pytest.raises(ValueError):
+        exporter.export_equipment_rankings_json(sample_vendor_df, columns_file, orient='split')
+
+
+def test_compressed_exports(sample_vendor_df, tmp_path):
+    """Test '.gz' output paths are written gzip-compressed."""
+    import gzip
+
+    exporter = DataExporter()
+    csv_file = tmp_path / "vendors.csv.gz"
+    json_file = tmp_path / "vendors.json.gz"
+
+    exporter.export_vendor_metrics(sample_vendor_df, csv_file)
+    exporter.export_vendor_metrics_json(sample_vendor_df, json_file)
+
+    result_df = pd.read_csv(csv_file)
+    assert list(result_df['contractor']) == list(sample_vendor_df['contractor'])
+
+    with gzip.open(json_file, 'rt') as f:
+        assert len(json.load(f)) == len(sample_vendor_df)
+
+
+def test_failed_export_keeps_previous_file(tmp_path):
+    """Test an export failing mid-write leaves the old file and no temporary."""
+    output_file = tmp_path / "records.ndjson"
+    output_file.write_text('previous\n')
+
+    df = pd.DataFrame({'value': [1, object()]})
+
+    exporter = DataExporter()
+    with pytest.raises(TypeError):
+        exporter.export_ndjson(df, output_file)
+
+    assert output_file.read_text() == 'previous\n'
+    assert os.listdir(tmp_path) == ['records.ndjson']
+
+
+def test_csv_exports_match_to_csv_text(sample_equipment_df, sample_patterns_list, tmp_path):
+    """Test CSV exports have the same file text as DataFrame.to_csv."""
+    exporter = DataExporter()
+
+    exporter.export_equipment_rankings(sample_equipment_df, tmp_path / "rankings.csv")
+    exporter.export_failure_patterns(sample_patterns_list, tmp_path / "patterns.csv")
+
+    sample_equipment_df.sort_values('priority_score', ascending=False).to_csv(
+        tmp_path / "expected_rankings.csv", index=False
+    )
+    pd.DataFrame(sample_patterns_list).rename(
+        columns={'occurrences': 'frequency', 'equipment_affected': 'equipment_count'}
+    )[['pattern', 'frequency', 'total_cost', 'equipment_count', 'category']].to_csv(
+        tmp_path / "expected_patterns.csv", index=False
+    )
+
+    for name in ("rankings", "patterns"):
+        assert (tmp_path / f"{name}.csv").read_text(encoding='utf-8') == (
+            (tmp_path / f"expected_{name}.csv").read_text(encoding='utf-8')
+        )
+
+
+def test_json_stdlib_encoder_matches_orjson(sample_equipment_df, sample_patterns_list, tmp_path):
+    """Test use_orjson=False writes the same JSON documents through the json module."""
+    orjson_exporter = DataExporter()
+    stdlib_exporter = DataExporter(use_orjson=False)
+
+    orjson_exporter.export_equipment_rankings_json(sample_equipment_df, tmp_path / "orjson.json")
+    stdlib_exporter.export_equipment_rankings_json(sample_equipment_df, tmp_path / "stdlib.json")
+    orjson_exporter.export_failure_patterns_json(sample_patterns_list, tmp_path / "orjson_patterns.json")
+    stdlib_exporter.export_failure_patterns_json(sample_patterns_list, tmp_path / "stdlib_patterns.json")
+
+    for name in ("", "_patterns"):
+        orjson_text = (tmp_path / f"orjson{name}.json").read_text(encoding='utf-8')
+        stdlib_text = (tmp_path / f"stdlib{name}.json").read_text(encoding='utf-8')
+        assert orjson_text == stdlib_text
+
+
+def test_json_non_ascii_and_exponent_floats_match_stdlib(tmp_path):
+    """Test JSON exports keep json.dumps escaping and float formatting."""
+    patterns = [
+        {'pattern': 'repair 修理', 'frequency': 818, 'total_cost': 1.42029e18,
+         'equipment_count': 23, 'category': 'other'},
+        {'pattern': 'leak', 'frequency': 394, 'total_cost': 6.2e-05,
+         'equipment_count': 21, 'category': 'leak'},
+    ]
+    output_path = tmp_path / "patterns.json"
+    DataExporter().export_failure_patterns_json(patterns, output_path)
+
+    text = output_path.read_text(encoding='utf-8')
+    assert '"repair \\u4fee\\u7406"' in text
+    assert '1.42029e+18' in text
+    assert '6.2e-05' in text
+    expected_path = tmp_path / "expected.json"
+    DataExporter(use_orjson=False).export_failure_patterns_json(patterns, expected_path)
+    assert text == expected_path.read_text(encoding='utf-8')
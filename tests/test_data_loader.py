@@ -0,0 +1,99 @@
+"""
+Tests for data_loader module.
+
+Tests cover CSV reading, type conversion and the PyArrow/pandas reader parity.
+"""
+
+import pandas as pd
+import pytest
+
+from src.pipeline.data_loader import load_work_orders
+
+
+HEADER = (
+    'id_,wo_no,Equipment_ID,EquipmentName,Create_Date,Complete_Date,Close_Date,PO_AMOUNT,'
+    'Property_category,FM_Type,Work_Order_Type,description,response_ontime\n'
+)
+
+
+@pytest.fixture
+def work_orders_csv(tmp_path):
+    """CSV with a quoted line break, ISO dates, NULL markers, full-width spaces and an empty column."""
+    path = tmp_path / 'work_orders.csv'
+    path.write_text(
+        '\ufeff' + HEADER +
+        '1,WO1,E1,\u3000Pump A ,2024-01-05,2024-01-07 10:30:00,2024-01-08,100.5,Cat1,Fitter,Adhoc,"leak\nat valve",\n'
+        '2,WO2,E2,Chiller,2024-02-01,NULL,NULL,NULL,Cat2,Electrical,Adhoc,  reset ,\n'
+        '3,WO3,NULL,NULL,2024-03-15,,2024-03-20,75,Cat1,Fitter,Adhoc,,\n',
+        encoding='utf-8'
+    )
+    return path
+
+
+def test_load_work_orders_converts_types(work_orders_csv):
+    """Test that dates and costs are converted and strings stripped."""
+    df = load_work_orders(work_orders_csv)
+
+    assert len(df) == 3
+    assert pd.api.types.is_datetime64_any_dtype(df['Create_Date'])
+    assert pd.api.types.is_datetime64_any_dtype(df['Complete_Date'])
+    assert pd.api.types.is_datetime64_any_dtype(df['Close_Date'])
+    assert df['PO_AMOUNT'].tolist()[::2] == [100.5, 75.0]
+    assert pd.isna(df.loc[1, 'PO_AMOUNT'])
+    assert df.loc[0, 'EquipmentName'] == 'Pump A'
+    assert df.loc[0, 'description'] == 'leak\nat valve'
+    assert df.loc[1, 'description'] == 'reset'
+
+
+def test_load_work_orders_arrow_matches_pandas(work_orders_csv):
+    """Test that the PyArrow reader produces the same frame as pandas.read_csv."""
+    pytest.importorskip('pyarrow')
+
+    arrow_df = load_work_orders(work_orders_csv)
+    pandas_df = load_work_orders(work_orders_csv, use_arrow=False)
+
+    pd.testing.assert_frame_equal(arrow_df, pandas_df)
+    # assert_frame_equal treats None and NaN alike; pandas marks missing text with NaN
+    assert not arrow_df.map(lambda value: value is None).any().any()
+
+
+def test_load_work_orders_arrow_time_of_day_column(tmp_path):
+    """Test that HH:MM and HH:MM:SS text, which Arrow infers as times, stays text."""
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'work_orders.csv'
+    path.write_text(
+        HEADER.rstrip('\n') + ',Start_Time\n' +
+        '1,WO1,E1,Pump A,2024-01-05,2024-01-07,2024-01-08,100.5,Cat1,Fitter,Adhoc,leak,,08:30\n'
+        '2,WO2,E2,Chiller,2024-02-01,NULL,NULL,NULL,Cat2,Electrical,Adhoc,reset,,17:45:10\n'
+        '3,WO3,E3,Fan,2024-03-15,,2024-03-20,75,Cat1,Fitter,Adhoc,,,\n',
+        encoding='utf-8'
+    )
+
+    arrow_df = load_work_orders(path)
+    pandas_df = load_work_orders(path, use_arrow=False)
+
+    pd.testing.assert_frame_equal(arrow_df, pandas_df)
+    assert arrow_df['Start_Time'].iloc[0] == '08:30'
+
+
+def test_load_work_orders_arrow_integers_beyond_int64(tmp_path):
+    """Test that integers past the int64 range load as uint64, as with pandas."""
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'work_orders.csv'
+    path.write_text(
+        HEADER.rstrip('\n') + ',Asset_No\n' +
+        '1,WO1,E1,Pump A,2024-01-05,2024-01-07,2024-01-08,100.5,Cat1,Fitter,Adhoc,leak,,9223372036854775808\n'
+        '2,WO2,E2,Chiller,2024-02-01,NULL,NULL,NULL,Cat2,Electrical,Adhoc,reset,,18446744073709551615\n',
+        encoding='utf-8'
+    )
+
+    arrow_df = load_work_orders(path)
+
+    assert arrow_df['Asset_No'].dtype == 'uint64'
+    pd.testing.assert_frame_equal(arrow_df, load_work_orders(path, use_arrow=False))
+
+
+def test_load_work_orders_missing_file(tmp_path):
+    """Test that a missing file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        load_work_orders(tmp_path / 'missing.csv')
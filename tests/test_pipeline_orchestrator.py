@@ -23,7 +23,7 @@ import tempfile
 import shutil
 import os
 
-from src.orchestrator.pipeline_orchestrator import PipelineOrchestrator
+from src.orchestrator.pipeline_orchestrator import PipelineOrchestrator, REPORT_COLUMNS
 
 
 # Test Fixtures
@@ -121,6 +121,19 @@ def test_orchestrator_output_dir_creation(sample_csv_file, tmp_path):
     assert (output_dir / 'visualizations').exists()
 
 
+def test_orchestrator_recreates_removed_output_dirs(sample_csv_file, tmp_path):
+    """Test that a new orchestrator recreates output dirs removed since the last one."""
+    output_path = tmp_path / "shared_output"
+    PipelineOrchestrator(input_file=str(sample_csv_file), output_dir=str(output_path))
+    shutil.rmtree(output_path)
+
+    PipelineOrchestrator(input_file=str(sample_csv_file), output_dir=str(output_path))
+
+    assert (output_path / 'reports').exists()
+    assert (output_path / 'exports').exists()
+    assert (output_path / 'visualizations').exists()
+
+
 # Analysis Execution Tests (4 tests)
 
 def test_run_full_analysis(sample_csv_file, output_dir):
@@ -168,6 +181,89 @@ def test_run_full_analysis_results_structure(sample_csv_file, output_dir):
     assert 'quality_passed' in results['quality_report']
 
 
+def test_run_full_analysis_projects_work_orders(sample_csv_file, output_dir):
+    """Test that work_orders_df keeps only the columns reports read."""
+    orchestrator = PipelineOrchestrator(
+        input_file=str(sample_csv_file),
+        output_dir=str(output_dir)
+    )
+
+    results = orchestrator.run_full_analysis()
+
+    work_orders_df = results['work_orders_df']
+    assert len(work_orders_df) > 0
+    assert set(work_orders_df.columns) <= set(REPORT_COLUMNS)
+    assert 'PO_AMOUNT' in work_orders_df.columns
+
+
+def test_run_full_analysis_serial_matches_parallel(sample_csv_file, output_dir, monkeypatch):
+    """Test that running the analysis stages on one thread gives the same results."""
+    orchestrator = PipelineOrchestrator(
+        input_file=str(sample_csv_file),
+        output_dir=str(output_dir),
+        use_cache=False
+    )
+
+    parallel = orchestrator.run_full_analysis()
+    monkeypatch.setenv('TCLRPD_ANALYSIS_THREADS', '1')
+    serial = orchestrator.run_full_analysis()
+
+    pd.testing.assert_frame_equal(parallel['equipment_df'], serial['equipment_df'])
+    pd.testing.assert_frame_equal(parallel['vendor_df'], serial['vendor_df'])
+    assert parallel['patterns_list'] == serial['patterns_list']
+    assert parallel['seasonal_dict']['pattern_count'] == serial['seasonal_dict']['pattern_count']
+
+
+def test_run_full_analysis_no_cache_by_default(sample_csv_file, output_dir):
+    """Test that results are not cached unless use_cache is set."""
+    orchestrator = PipelineOrchestrator(
+        input_file=str(sample_csv_file),
+        output_dir=str(output_dir)
+    )
+
+    orchestrator.run_full_analysis()
+
+    assert not (output_dir / '.cache').exists()
+
+
+def test_run_full_analysis_reuses_cached_results(sample_csv_file, output_dir):
+    """Test that a second run on an unchanged input file skips the pipeline."""
+    orchestrator = PipelineOrchestrator(
+        input_file=str(sample_csv_file),
+        output_dir=str(output_dir),
+        use_cache=True
+    )
+
+    first = orchestrator.run_full_analysis()
+    assert list((output_dir / '.cache').glob('*.pkl'))
+
+    with patch('src.orchestrator.pipeline_orchestrator.run_pipeline') as mock_pipeline:
+        second = orchestrator.run_full_analysis()
+    mock_pipeline.assert_not_called()
+
+    pd.testing.assert_frame_equal(first['vendor_df'], second['vendor_df'])
+    assert first['patterns_list'] == second['patterns_list']
+
+
+def test_run_full_analysis_ignores_truncated_cache(sample_csv_file, output_dir):
+    """Test that a truncated cache entry is ignored and the analysis reruns."""
+    orchestrator = PipelineOrchestrator(
+        input_file=str(sample_csv_file),
+        output_dir=str(output_dir),
+        use_cache=True
+    )
+
+    first = orchestrator.run_full_analysis()
+    cache_path, = (output_dir / '.cache').glob('*.pkl')
+    data = cache_path.read_bytes()
+    cache_path.write_bytes(data[:len(data) // 2])
+
+    second = orchestrator.run_full_analysis()
+
+    pd.testing.assert_frame_equal(first['vendor_df'], second['vendor_df'])
+    assert cache_path.stat().st_size == len(data)
+
+
 def test_run_full_analysis_empty_data(empty_csv_file, output_dir):
     """Test that analysis handles empty input data gracefully."""
     orchestrator = PipelineOrchestrator(
@@ -189,6 +285,26 @@ def test_run_full_analysis_empty_data(empty_csv_file, output_dir):
     assert len(results['patterns_list']) == 0
 
 
+def test_run_full_analysis_no_rows_after_pipeline(sample_csv_file, output_dir):
+    """Test that analysis returns empty results when the pipeline leaves no rows."""
+    orchestrator = PipelineOrchestrator(
+        input_file=str(sample_csv_file),
+        output_dir=str(output_dir),
+        use_cache=False
+    )
+
+    empty_df = pd.DataFrame(columns=['Equipment_Name', 'PO_AMOUNT', 'Contractor', 'is_no_equipment'])
+    with patch('src.orchestrator.pipeline_orchestrator.run_pipeline') as mock_pipeline:
+        mock_pipeline.return_value = (empty_df, {'total_records': 0})
+        results = orchestrator.run_full_analysis()
+
+    assert len(results['equipment_df']) == 0
+    assert len(results['vendor_df']) == 0
+    assert results['patterns_list'] == []
+    assert results['seasonal_dict']['pattern_count'] == 0
+    assert results['no_equipment_summary']['count'] == 0
+
+
 def test_run_full_analysis_invalid_input(output_dir):
     """Test that analysis raises error for invalid input file path."""
     orchestrator = PipelineOrchestrator(
@@ -229,6 +345,22 @@ def test_generate_reports(sample_csv_file, output_dir):
     assert excel_path.exists(), f"Excel not created at {excel_path}"
 
 
+def test_generate_reports_reuses_analysis_results(sample_csv_file, output_dir):
+    """Test that report generation reuses analysis results instead of reloading the input."""
+    orchestrator = PipelineOrchestrator(
+        input_file=str(sample_csv_file),
+        output_dir=str(output_dir)
+    )
+
+    results = orchestrator.run_full_analysis()
+    with patch('src.reporting.report_builder.ReportBuilder._load_data') as mock_load:
+        report_paths = orchestrator.generate_reports(results)
+    mock_load.assert_not_called()
+
+    assert Path(report_paths['pdf_path']).exists()
+    assert Path(report_paths['excel_path']).exists()
+
+
 def test_generate_reports_file_validity(sample_csv_file, output_dir):
     """Test that generated report files are valid (size > 0, correct format)."""
     orchestrator = PipelineOrchestrator(
@@ -352,6 +484,24 @@ def test_generate_visualizations(sample_csv_file, output_dir):
     assert dashboard_path.exists(), f"Dashboard not created: {dashboard_path}"
 
 
+def test_generate_visualizations_process_pool(sample_csv_file, output_dir, monkeypatch):
+    """Test that charts rendered in worker processes are written in task order."""
+    orchestrator = PipelineOrchestrator(
+        input_file=str(sample_csv_file),
+        output_dir=str(output_dir)
+    )
+
+    results = orchestrator.run_full_analysis()
+    monkeypatch.setenv('TCLRPD_CHART_PROCESSES', '2')
+    viz_paths = orchestrator.generate_visualizations(results)
+
+    assert Path(viz_paths['charts'][0]).name == 'equipment_ranking.png'
+    assert Path(viz_paths['charts'][-1]).name == 'failure_patterns.png'
+    for chart_path in viz_paths['charts']:
+        assert Path(chart_path).exists(), f"Chart not created: {chart_path}"
+    assert Path(viz_paths['dashboard']).exists()
+
+
 def test_generate_visualizations_file_validity(sample_csv_file, output_dir):
     """Test that visualization files are valid formats and in correct location."""
     orchestrator = PipelineOrchestrator(
@@ -474,3 +624,43 @@ def test_pipeline_with_edge_case_data(tmp_path, output_dir):
     report_paths = orchestrator.generate_reports(results)
     assert Path(report_paths['pdf_path']).exists()
     assert Path(report_paths['excel_path']).exists()
+
+
+def test_generate_outputs_runs_selected_stages(sample_csv_file, output_dir):
+    """Test that generate_outputs returns each selected stage's result and skips the rest."""
+    orchestrator = PipelineOrchestrator(
+        input_file=str(sample_csv_file),
+        output_dir=str(output_dir)
+    )
+
+    results = orchestrator.run_full_analysis()
+    outputs = orchestrator.generate_outputs(results, reports=False)
+
+    assert outputs['reports'] is None
+    assert len(outputs['exports']['csv']) == len(outputs['exports']['json'])
+    for path in outputs['exports']['csv'] + outputs['visualizations']['charts']:
+        assert Path(path).exists()
+    assert Path(outputs['visualizations']['dashboard']).exists()
+
+
+def test_no_equipment_summary_categorical_property(sample_csv_file, output_dir):
+    """Test that categories absent from the no-equipment rows are not counted."""
+    orchestrator = PipelineOrchestrator(
+        input_file=str(sample_csv_file),
+        output_dir=str(output_dir)
+    )
+
+    df = pd.DataFrame({
+        'is_no_equipment': [True, True, False, False],
+        'PO_AMOUNT': [100.0, 300.0, 50.0, np.nan],
+        'Property': ['Tower A', 'Tower A', 'Tower B', 'Tower C']
+    })
+    orchestrator._categorize_columns(df)
+    assert isinstance(df['Property'].dtype, pd.CategoricalDtype)
+
+    summary = orchestrator._calculate_no_equipment_summary(df)
+
+    assert summary['count'] == 2
+    assert summary['total_cost'] == 400.0
+    assert summary['avg_cost'] == 200.0
+    assert summary['top_properties'] == {'Tower A': 2}
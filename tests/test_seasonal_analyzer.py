@@ -140,6 +140,34 @@ class TestQuarterlyAggregation:
         assert list(result.columns) == ['period', 'total_cost', 'avg_cost', 'work_order_count']
 
 
+class TestMonthlyAndQuarterlyAggregation:
+    """Tests for calculate_monthly_and_quarterly method."""
+
+    def test_matches_separate_aggregations(self, analyzer):
+        """Test that the fused aggregation matches the monthly and quarterly methods."""
+        df = pd.DataFrame({
+            'Complete_Date': pd.to_datetime([
+                '2024-01-05', '2024-01-20', '2024-03-11', '2024-05-02',
+                '2024-08-30', '2024-11-15', '2025-02-01', None
+            ]),
+            'PO_AMOUNT': [100.0, 250.5, 80.0, np.nan, 400.25, 60.0, 120.0, 90.0]
+        })
+
+        monthly, quarterly = analyzer.calculate_monthly_and_quarterly(df)
+
+        assert_frame_equal(monthly, analyzer.calculate_monthly_costs(df))
+        assert_frame_equal(quarterly, analyzer.calculate_quarterly_costs(df))
+
+    def test_empty_dataframe(self, analyzer):
+        """Test fused aggregation with empty DataFrame."""
+        empty_df = pd.DataFrame(columns=['Complete_Date', 'PO_AMOUNT'])
+        monthly, quarterly = analyzer.calculate_monthly_and_quarterly(empty_df)
+
+        assert len(monthly) == 0
+        assert len(quarterly) == 0
+        assert list(quarterly.columns) == ['period', 'total_cost', 'avg_cost', 'work_order_count']
+
+
 class TestSeasonalAggregation:
     """Tests for calculate_seasonal_costs method."""
 
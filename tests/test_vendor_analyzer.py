@@ -239,6 +239,19 @@ def test_identify_high_cost_vendors_top_10(sample_work_orders):
     assert set(result['contractor']) == {'ABC Corp', 'XYZ Inc', 'Quick Fix'}
 
 
+def test_identify_high_cost_vendors_top_10_many_vendors():
+    """Test top_10 keeps the ten highest-cost vendors in descending order."""
+    df = pd.DataFrame({
+        'Contractor': [f'Vendor {i:02d}' for i in range(25) for _ in range(3)],
+        'PO_AMOUNT': [float(i * 100 + j) for i in range(25) for j in range(3)]
+    })
+    analyzer = VendorAnalyzer(min_work_orders=3)
+    result = analyzer.identify_high_cost_vendors(df, threshold='top_10')
+
+    assert list(result['contractor']) == [f'Vendor {i:02d}' for i in range(24, 14, -1)]
+    assert (result['cost_threshold'] == result['total_cost'].min()).all()
+
+
 def test_calculate_cost_efficiency(sample_work_orders):
     """Test cost efficiency calculation (cost per day)."""
     analyzer = VendorAnalyzer(min_work_orders=3)
@@ -401,3 +414,114 @@ def test_vendor_analyzer_custom_label():
 
     assert len(result) == 1
     assert result.iloc[0]['contractor'] == 'N/A'
+
+
+def test_calculate_vendor_costs_streaming_matches_in_memory(sample_work_orders):
+    """Test chunked cost aggregation matches the in-memory result."""
+    analyzer = VendorAnalyzer(min_work_orders=3)
+    chunks = [sample_work_orders.iloc[i:i + 5] for i in range(0, len(sample_work_orders), 5)]
+
+    expected = analyzer.calculate_vendor_costs(sample_work_orders)
+    result = analyzer.calculate_vendor_costs_streaming(chunks)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_calculate_vendor_duration_streaming_matches_in_memory(sample_work_orders):
+    """Test chunked duration aggregation matches the in-memory result."""
+    analyzer = VendorAnalyzer(min_work_orders=3)
+    chunks = [sample_work_orders.iloc[i:i + 5] for i in range(0, len(sample_work_orders), 5)]
+
+    expected = analyzer.calculate_vendor_duration(sample_work_orders)
+    result = analyzer.calculate_vendor_duration_streaming(chunks)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert len(analyzer.calculate_vendor_duration_streaming([])) == 0
+
+
+def test_polars_backend_matches_pandas(sample_work_orders):
+    """Test the Polars aggregation backend produces the same vendor metrics."""
+    pytest.importorskip('polars')
+
+    pandas_analyzer = VendorAnalyzer(min_work_orders=3)
+    polars_analyzer = VendorAnalyzer(min_work_orders=3, backend='polars')
+
+    pd.testing.assert_frame_equal(
+        polars_analyzer.rank_vendors(sample_work_orders),
+        pandas_analyzer.rank_vendors(sample_work_orders)
+    )
+    pd.testing.assert_frame_equal(
+        polars_analyzer.calculate_vendor_duration(sample_work_orders, include_unknown=True),
+        pandas_analyzer.calculate_vendor_duration(sample_work_orders, include_unknown=True)
+    )
+
+
+def test_invalid_backend():
+    """Test unknown backend names are rejected."""
+    with pytest.raises(ValueError):
+        VendorAnalyzer(backend='spark')
+
+
+def test_prepare_matches_raw_frame(sample_work_orders):
+    """Test analysis on a prepared (categorical Contractor) frame matches the raw frame."""
+    analyzer = VendorAnalyzer(min_work_orders=2)
+    prepared = analyzer.prepare(sample_work_orders)
+
+    assert isinstance(prepared['Contractor'].dtype, pd.CategoricalDtype)
+    assert analyzer.prepare(prepared) is prepared
+
+    for include_unknown in (False, True):
+        pd.testing.assert_frame_equal(
+            analyzer.rank_vendors(prepared, include_unknown=include_unknown),
+            analyzer.rank_vendors(sample_work_orders, include_unknown=include_unknown)
+        )
+        pd.testing.assert_frame_equal(
+            analyzer.calculate_quality_indicators(prepared, include_unknown=include_unknown),
+            analyzer.calculate_quality_indicators(sample_work_orders, include_unknown=include_unknown)
+        )
+
+
+def test_repeated_calls_see_in_place_edits(sample_work_orders):
+    """Test metrics are recomputed on every call, so in-place edits are reflected."""
+    analyzer = VendorAnalyzer(min_work_orders=3)
+    df = sample_work_orders.copy()
+
+    first = analyzer.calculate_vendor_costs(df).set_index('contractor')['total_cost']
+    contractor = df.loc[df.index[1], 'Contractor']
+    df.loc[df.index[1], 'PO_AMOUNT'] += 1e6
+    second = analyzer.calculate_vendor_costs(df).set_index('contractor')['total_cost']
+
+    assert second[contractor] == first[contractor] + 1e6
+
+
+def test_prepare_arrow_strings_match_raw_frame(sample_work_orders):
+    """Test analysis on an Arrow-backed string Contractor column matches the raw frame."""
+    pytest.importorskip('pyarrow')
+
+    analyzer = VendorAnalyzer(min_work_orders=2)
+    prepared = analyzer.prepare(sample_work_orders, contractor_dtype='string[pyarrow]')
+
+    assert prepared['Contractor'].dtype == 'string[pyarrow]'
+    assert analyzer.prepare(prepared, contractor_dtype='string[pyarrow]') is prepared
+
+    for include_unknown in (False, True):
+        pd.testing.assert_frame_equal(
+            analyzer.rank_vendors(prepared, include_unknown=include_unknown),
+            analyzer.rank_vendors(sample_work_orders, include_unknown=include_unknown)
+        )
+        assert (analyzer.get_vendor_recommendations(prepared, include_unknown=include_unknown)
+                == analyzer.get_vendor_recommendations(sample_work_orders, include_unknown=include_unknown))
+
+    with pytest.raises(ValueError):
+        analyzer.prepare(sample_work_orders, contractor_dtype='object')
+
+
+def test_unobserved_contractor_categories_excluded(sample_work_orders):
+    """Test categories with no rows in the frame do not appear as zero-count vendors."""
+    analyzer = VendorAnalyzer(min_work_orders=0)
+    prepared = analyzer.prepare(sample_work_orders)
+    subset = prepared[prepared['Contractor'] == 'ABC Corp']
+
+    assert len(subset['Contractor'].cat.categories) > 1
+    assert list(analyzer.calculate_vendor_costs(subset)['contractor']) == ['ABC Corp']
+    assert list(analyzer.calculate_quality_indicators(subset)['contractor']) == ['ABC Corp']